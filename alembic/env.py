@@ -10,6 +10,7 @@ import src.db.models  # noqa: F401
 from alembic import context
 from src.core.config import settings
 from src.db.base import Base
+from src.repositories.activity_partition import is_activity_partition
 
 config = context.config
 
@@ -25,6 +26,13 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def include_name(name: str | None, type_: str, parent_names: dict) -> bool:
+    # Activities partitions come and go with the maintenance command; only the
+    # partitioned parent table is described by the models.
+    return not (type_ == "table" and name is not None and is_activity_partition(name))
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -57,7 +65,9 @@ def run_migrations_offline() -> None:
 
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with the given connection."""
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection, target_metadata=target_metadata, include_name=include_name
+    )
 
     with context.begin_transaction():
         context.run_migrations()
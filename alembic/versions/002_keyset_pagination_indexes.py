@@ -0,0 +1,45 @@
+"""keyset pagination indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "002"
+down_revision: str | None = "001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # The composite indexes lead with organization_id, so they also serve every
+    # query the single-column indexes did.
+    op.create_index(
+        "idx_deal_org_created",
+        "deals",
+        ["organization_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.drop_index("idx_deal_org", table_name="deals")
+
+    op.create_index(
+        "idx_contact_org_created",
+        "contacts",
+        ["organization_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.drop_index("idx_contact_org", table_name="contacts")
+
+
+def downgrade() -> None:
+    op.create_index("idx_contact_org", "contacts", ["organization_id"], unique=False)
+    op.drop_index("idx_contact_org_created", table_name="contacts")
+
+    op.create_index("idx_deal_org", "deals", ["organization_id"], unique=False)
+    op.drop_index("idx_deal_org_created", table_name="deals")
@@ -0,0 +1,51 @@
+"""contact search indexes
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for column in ("name", "email", "phone"):
+        op.create_index(
+            f"idx_contact_{column}_trgm",
+            "contacts",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+    op.create_index(
+        "idx_contact_org_email_prefix",
+        "contacts",
+        ["organization_id", sa.text("lower(email) text_pattern_ops")],
+        unique=False,
+    )
+    op.create_index(
+        "idx_contact_org_phone_prefix",
+        "contacts",
+        ["organization_id", sa.text("phone text_pattern_ops")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_contact_org_phone_prefix", table_name="contacts")
+    op.drop_index("idx_contact_org_email_prefix", table_name="contacts")
+    for column in ("phone", "email", "name"):
+        op.drop_index(f"idx_contact_{column}_trgm", table_name="contacts")
@@ -0,0 +1,45 @@
+"""org deal stats rollup
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "org_deal_stats",
+        sa.Column("organization_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("stage", sa.String(), nullable=False),
+        sa.Column("currency", sa.String(length=3), nullable=False),
+        sa.Column("deal_count", sa.Integer(), nullable=False),
+        sa.Column("amount_sum", sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"]),
+        sa.PrimaryKeyConstraint("organization_id", "status", "stage", "currency"),
+    )
+    op.execute(
+        """
+        INSERT INTO org_deal_stats
+            (organization_id, status, stage, currency, deal_count, amount_sum)
+        SELECT organization_id, status, stage, currency, count(id), sum(amount)
+        FROM deals
+        GROUP BY organization_id, status, stage, currency
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("org_deal_stats")
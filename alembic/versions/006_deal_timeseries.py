@@ -0,0 +1,68 @@
+"""deal closed_at and org deal timeseries rollup
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("deals", sa.Column("closed_at", sa.DateTime(timezone=True), nullable=True))
+    # Closing time was never recorded; the last update is the best approximation.
+    op.execute("UPDATE deals SET closed_at = updated_at WHERE status IN ('won', 'lost')")
+
+    op.create_table(
+        "org_deal_timeseries",
+        sa.Column("organization_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("granularity", sa.String(), nullable=False),
+        sa.Column("bucket_start", sa.Date(), nullable=False),
+        sa.Column("created_count", sa.Integer(), nullable=False),
+        sa.Column("won_count", sa.Integer(), nullable=False),
+        sa.Column("lost_count", sa.Integer(), nullable=False),
+        sa.Column("won_amount", sa.Numeric(precision=20, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.id"]),
+        sa.PrimaryKeyConstraint("organization_id", "granularity", "bucket_start"),
+    )
+    for granularity in ("day", "week", "month"):
+        op.execute(
+            f"""
+            INSERT INTO org_deal_timeseries
+                (organization_id, granularity, bucket_start,
+                 created_count, won_count, lost_count, won_amount)
+            SELECT organization_id, '{granularity}', bucket,
+                   sum(created), sum(won), sum(lost), sum(won_amount)
+            FROM (
+                SELECT organization_id,
+                       date_trunc('{granularity}', created_at AT TIME ZONE 'UTC')::date AS bucket,
+                       1 AS created, 0 AS won, 0 AS lost, 0 AS won_amount
+                FROM deals
+                UNION ALL
+                SELECT organization_id,
+                       date_trunc('{granularity}', closed_at AT TIME ZONE 'UTC')::date,
+                       0,
+                       (status = 'won')::int,
+                       (status = 'lost')::int,
+                       CASE WHEN status = 'won' THEN amount ELSE 0 END
+                FROM deals
+                WHERE closed_at IS NOT NULL AND status IN ('won', 'lost')
+            ) AS events
+            GROUP BY organization_id, bucket
+            """
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("org_deal_timeseries")
+    op.drop_column("deals", "closed_at")
@@ -0,0 +1,36 @@
+"""activity timeline index
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Serves the paginated per-deal timeline, with or without a type filter;
+    # the type index on its own was never selective enough to be used.
+    op.create_index(
+        "idx_activity_deal_created",
+        "activities",
+        ["deal_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.drop_index("idx_activity_deal", table_name="activities")
+    op.drop_index("idx_activity_type", table_name="activities")
+
+
+def downgrade() -> None:
+    op.create_index("idx_activity_type", "activities", ["type"], unique=False)
+    op.create_index("idx_activity_deal", "activities", ["deal_id"], unique=False)
+    op.drop_index("idx_activity_deal_created", table_name="activities")
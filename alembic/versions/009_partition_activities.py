@@ -0,0 +1,118 @@
+"""partition activities by month
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Later months are created by src.commands.maintain_activity_partitions.
+MONTHS_AHEAD = 3
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _columns() -> list[sa.Column]:
+    return [
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("deal_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("author_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("type", sa.String(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["author_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["deal_id"], ["deals.id"]),
+    ]
+
+
+def upgrade() -> None:
+    op.rename_table("activities", "activities_unpartitioned")
+    op.execute("ALTER INDEX activities_pkey RENAME TO activities_unpartitioned_pkey")
+    op.execute(
+        "ALTER INDEX idx_activity_deal_created RENAME TO idx_activity_unpartitioned_deal_created"
+    )
+
+    op.create_table(
+        "activities",
+        *_columns(),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.create_index(
+        "idx_activity_deal_created",
+        "activities",
+        ["deal_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.execute("CREATE TABLE activities_default PARTITION OF activities DEFAULT")
+
+    oldest = (
+        op.get_bind()
+        .execute(sa.text("SELECT min(created_at) FROM activities_unpartitioned"))
+        .scalar()
+    )
+    now = datetime.now(UTC)
+    month = (oldest or now).astimezone(UTC).date().replace(day=1)
+    last = now.date().replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        following = _next_month(month)
+        op.execute(
+            f"CREATE TABLE activities_{month:%Y_%m} PARTITION OF activities "
+            f"FOR VALUES FROM ('{month} 00:00:00+00') TO ('{following} 00:00:00+00')"
+        )
+        month = following
+
+    op.execute(
+        "INSERT INTO activities (id, deal_id, author_id, type, payload, created_at) "
+        "SELECT id, deal_id, author_id, type, payload, created_at FROM activities_unpartitioned"
+    )
+    op.drop_table("activities_unpartitioned")
+
+
+def downgrade() -> None:
+    op.create_table(
+        "activities_unpartitioned",
+        *_columns(),
+        sa.PrimaryKeyConstraint("id", name="activities_unpartitioned_pkey"),
+    )
+    op.execute(
+        "INSERT INTO activities_unpartitioned (id, deal_id, author_id, type, payload, created_at) "
+        "SELECT id, deal_id, author_id, type, payload, created_at FROM activities"
+    )
+    # Drops every attached partition with it.
+    op.drop_table("activities")
+
+    op.rename_table("activities_unpartitioned", "activities")
+    op.execute("ALTER INDEX activities_unpartitioned_pkey RENAME TO activities_pkey")
+    for column in ("deal_id", "author_id"):
+        op.execute(
+            f"ALTER TABLE activities RENAME CONSTRAINT activities_unpartitioned_{column}_fkey "
+            f"TO activities_{column}_fkey"
+        )
+    op.create_index(
+        "idx_activity_deal_created",
+        "activities",
+        ["deal_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+    )
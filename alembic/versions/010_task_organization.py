@@ -0,0 +1,49 @@
+"""task organization
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "010"
+down_revision: str | None = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks", sa.Column("organization_id", postgresql.UUID(as_uuid=True), nullable=True)
+    )
+    op.execute(
+        "UPDATE tasks SET organization_id = deals.organization_id "
+        "FROM deals WHERE deals.id = tasks.deal_id"
+    )
+    op.alter_column("tasks", "organization_id", nullable=False)
+    op.create_foreign_key(
+        "tasks_organization_id_fkey", "tasks", "organizations", ["organization_id"], ["id"]
+    )
+
+    # Organization-wide lists filter on is_done and page through (due_date, id);
+    # due_date was never queried on its own.
+    op.create_index(
+        "idx_task_org_done_due",
+        "tasks",
+        ["organization_id", "is_done", "due_date", "id"],
+        unique=False,
+    )
+    op.drop_index("idx_task_due_date", table_name="tasks")
+
+
+def downgrade() -> None:
+    op.create_index("idx_task_due_date", "tasks", ["due_date"], unique=False)
+    op.drop_index("idx_task_org_done_due", table_name="tasks")
+    op.drop_constraint("tasks_organization_id_fkey", "tasks", type_="foreignkey")
+    op.drop_column("tasks", "organization_id")
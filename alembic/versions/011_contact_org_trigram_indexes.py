@@ -0,0 +1,45 @@
+"""contact org trigram indexes
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "011"
+down_revision: str | None = "010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # btree_gin provides the GIN operator class for organization_id, so a search
+    # only scans the trigram postings of its own organization.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    for column in ("name", "email", "phone"):
+        op.create_index(
+            f"idx_contact_org_{column}_trgm",
+            "contacts",
+            ["organization_id", column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+        op.drop_index(f"idx_contact_{column}_trgm", table_name="contacts")
+
+
+def downgrade() -> None:
+    for column in ("phone", "email", "name"):
+        op.create_index(
+            f"idx_contact_{column}_trgm",
+            "contacts",
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+        op.drop_index(f"idx_contact_org_{column}_trgm", table_name="contacts")
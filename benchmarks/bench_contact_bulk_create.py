@@ -0,0 +1,57 @@
+"""Contact insert throughput: one create per contact vs POST /contacts/bulk batches.
+
+Usage: python -m benchmarks.bench_contact_bulk_create [contact_count]
+"""
+import asyncio
+import sys
+import time
+
+from benchmarks.common import drop_organization, seed_organization
+from src.core.config import settings
+from src.db.session import AsyncSessionLocal, engine
+from src.services.contact import ContactService
+
+
+def contact_payloads(prefix: str, count: int) -> list[dict[str, str | None]]:
+    return [
+        {"name": f"{prefix} {i}", "email": f"{prefix}{i}@example.com", "phone": f"+1555{i:07d}"}
+        for i in range(count)
+    ]
+
+
+async def single(service: ContactService, org_id, user_id, contacts) -> None:
+    for contact in contacts:
+        await service.create_contact(org_id, user_id, **contact)
+
+
+async def bulk(service: ContactService, org_id, user_id, contacts) -> None:
+    batch = settings.contacts_bulk_max_items
+    for start in range(0, len(contacts), batch):
+        await service.create_contacts(org_id, user_id, contacts[start : start + batch])
+
+
+async def main(contact_count: int) -> None:
+    async with AsyncSessionLocal() as session:
+        org_id, user_id = await seed_organization(session)
+        try:
+            service = ContactService(session)
+            for label, create in (("single create", single), ("bulk create", bulk)):
+                contacts = contact_payloads(label.split()[0], contact_count)
+                started = time.perf_counter()
+                await create(service, org_id, user_id, contacts)
+                await session.commit()
+                elapsed = time.perf_counter() - started
+                # Keep the identity map from growing across runs.
+                session.expunge_all()
+                print(
+                    f"{label:<15} contacts={contact_count} "
+                    f"elapsed={elapsed:7.2f}s throughput={contact_count / elapsed:10.0f}/s"
+                )
+        finally:
+            await session.rollback()
+            await drop_organization(session, org_id, user_id)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -0,0 +1,64 @@
+"""Compare contact search latency with and without the trigram/prefix indexes.
+
+Usage: python -m benchmarks.bench_contact_search [contact_count]
+"""
+import asyncio
+import sys
+
+from sqlalchemy import text
+
+from benchmarks.common import (
+    drop_organization,
+    measure,
+    report,
+    seed_contacts,
+    seed_organization,
+)
+from src.core.pagination import TotalMode
+from src.db.session import AsyncSessionLocal, engine
+from src.domain.value_objects.search_mode import ContactSearchMode
+from src.repositories.contact import ContactRepository
+
+PAGE_SIZE = 50
+
+CASES = (
+    ("contains name", "Contact 123456", ContactSearchMode.CONTAINS),
+    ("contains email", "contact4242@", ContactSearchMode.CONTAINS),
+    ("similar", "Contakt 123456", ContactSearchMode.SIMILAR),
+    ("prefix email", "contact4242@", ContactSearchMode.PREFIX),
+    ("prefix phone", "+15550424", ContactSearchMode.PREFIX),
+)
+
+
+async def main(contact_count: int) -> None:
+    async with AsyncSessionLocal() as session:
+        org_id, user_id = await seed_organization(session)
+        try:
+            await seed_contacts(session, org_id, user_id, contact_count)
+            await session.execute(text("ANALYZE contacts"))
+            repo = ContactRepository(session)
+
+            for label, term, mode in CASES:
+                def run(term=term, mode=mode):
+                    return repo.list_by_organization(
+                        org_id, PAGE_SIZE, search=term, total_mode=TotalMode.NONE, search_mode=mode
+                    )
+
+                if mode == ContactSearchMode.CONTAINS:
+                    # Bitmap scans are how the GIN indexes are used, so disabling them
+                    # approximates the old ILIKE plan over the tenant's rows. Cached
+                    # plans ignore the setting, hence DISCARD PLANS around it.
+                    await session.execute(text("SET enable_bitmapscan = off"))
+                    await session.execute(text("DISCARD PLANS"))
+                    report(f"{label:<15} no trigram index", await measure(run, repeat=5))
+                    await session.execute(text("RESET enable_bitmapscan"))
+                    await session.execute(text("DISCARD PLANS"))
+                report(f"{label:<15} indexed", await measure(run))
+        finally:
+            await session.rollback()
+            await drop_organization(session, org_id, user_id)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000))
@@ -0,0 +1,70 @@
+"""Compare OFFSET and keyset page latency for deep pages of deals.
+
+Usage: python -m benchmarks.bench_keyset_pagination [deal_count]
+"""
+import asyncio
+import sys
+
+from sqlalchemy import select, text
+
+from benchmarks.common import (
+    drop_organization,
+    measure,
+    report,
+    seed_contacts,
+    seed_deals,
+    seed_organization,
+)
+from src.db.models import DealModel
+from src.db.session import AsyncSessionLocal, engine
+from src.repositories.deal import DealRepository
+
+PAGE_SIZE = 100
+PAGES = (1, 10, 100, 1000)
+
+
+async def main(deal_count: int) -> None:
+    async with AsyncSessionLocal() as session:
+        org_id, user_id = await seed_organization(session)
+        try:
+            [contact_id] = await seed_contacts(session, org_id, user_id, 1)
+            await seed_deals(session, org_id, user_id, contact_id, deal_count)
+            await session.execute(text("ANALYZE deals"))
+            repo = DealRepository(session)
+
+            for page in PAGES:
+                offset = (page - 1) * PAGE_SIZE
+                if offset >= deal_count:
+                    break
+
+                after = None
+                if offset:
+                    row = (
+                        await session.execute(
+                            select(DealModel.created_at, DealModel.id)
+                            .where(DealModel.organization_id == org_id)
+                            .order_by(DealModel.created_at.desc(), DealModel.id.desc())
+                            .offset(offset - 1)
+                            .limit(1)
+                        )
+                    ).one()
+                    after = (row.created_at, row.id)
+
+                report(
+                    f"page {page:>5} offset",
+                    await measure(lambda: repo.list_by_organization(org_id, PAGE_SIZE, offset)),
+                )
+                report(
+                    f"page {page:>5} cursor",
+                    await measure(
+                        lambda: repo.list_by_organization(org_id, PAGE_SIZE, 0, after=after)
+                    ),
+                )
+        finally:
+            await session.rollback()
+            await drop_organization(session, org_id, user_id)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000))
@@ -0,0 +1,82 @@
+"""Deal list page throughput: ORM objects + response_model vs plain rows + TypeAdapter.
+
+The ORM case replays what GET /deals did before: load ``DealModel`` instances
+into a fresh identity map, validate each into ``DealResponse`` and let
+FastAPI's response_model pass validate, dump and ``json.dumps`` the page.
+
+Usage: python -m benchmarks.bench_list_serialization [deal_count]
+"""
+import asyncio
+import json
+import sys
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from benchmarks.common import (
+    drop_organization,
+    measure,
+    report,
+    seed_contacts,
+    seed_deals,
+    seed_organization,
+)
+from src.api.responses import json_response
+from src.api.v1.schemas.deal import DealListResponse, DealResponse
+from src.core.pagination import TotalMode
+from src.db.models import DealModel
+from src.db.session import AsyncSessionLocal, engine
+from src.repositories.deal import DealRepository
+
+PAGE_SIZE = 100
+
+ADAPTER = TypeAdapter(DealListResponse)
+
+
+async def main(deal_count: int) -> None:
+    async with AsyncSessionLocal() as session:
+        org_id, user_id = await seed_organization(session)
+        try:
+            [contact_id] = await seed_contacts(session, org_id, user_id, 1)
+            await seed_deals(session, org_id, user_id, contact_id, deal_count)
+            repo = DealRepository(session)
+            page_query = (
+                select(DealModel)
+                .where(DealModel.organization_id == org_id)
+                .order_by(DealModel.created_at.desc(), DealModel.id.desc())
+                .limit(PAGE_SIZE)
+            )
+
+            async def orm_page() -> bytes:
+                # Each request starts with an empty identity map.
+                session.expunge_all()
+                deals = (await session.execute(page_query)).scalars().all()
+                page = DealListResponse(
+                    items=[DealResponse.model_validate(d) for d in deals],
+                    total=None,
+                    limit=PAGE_SIZE,
+                    offset=0,
+                )
+                content = ADAPTER.dump_python(ADAPTER.validate_python(page), mode="json")
+                return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+            async def row_page() -> bytes:
+                deals, total = await repo.list_by_organization(
+                    org_id, PAGE_SIZE, total_mode=TotalMode.NONE
+                )
+                content = {"items": deals, "total": total, "limit": PAGE_SIZE, "offset": 0}
+                return json_response(ADAPTER, content).body
+
+            assert json.loads(await orm_page()) == json.loads(await row_page())
+            for label, page in (("orm + response_model", orm_page), ("rows + TypeAdapter", row_page)):
+                result = await measure(page, repeat=200)
+                result["rows_per_s"] = PAGE_SIZE / result["p50_ms"] * 1000
+                report(f"{label:<22} page={PAGE_SIZE}", result)
+        finally:
+            await session.rollback()
+            await drop_organization(session, org_id, user_id)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000))
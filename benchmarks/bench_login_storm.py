@@ -0,0 +1,72 @@
+"""Latency of an unrelated endpoint while a burst of bcrypt verifications runs.
+
+Compares verifying passwords inline on the event loop (the previous
+behaviour) with the bounded password hash executor.
+
+Usage: python -m benchmarks.bench_login_storm [concurrent_logins]
+"""
+import asyncio
+import sys
+import time
+
+from httpx import ASGITransport, AsyncClient
+
+from src.core.security import hash_password, verify_password, verify_password_async
+from src.domain.exceptions import ServiceUnavailableError
+from src.main import app
+
+PROBE_INTERVAL = 0.005
+
+
+async def inline_login(hashed: str) -> None:
+    verify_password("password123", hashed)
+
+
+async def executor_login(hashed: str) -> None:
+    try:
+        await verify_password_async("password123", hashed)
+    except ServiceUnavailableError:
+        pass
+
+
+async def probe_latencies(client: AsyncClient, stop: asyncio.Event) -> list[float]:
+    # Latency is measured from when the probe was due, so time spent with the
+    # event loop blocked counts against the unrelated request.
+    samples = []
+    due = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(max(due - time.perf_counter(), 0))
+        await client.get("/health")
+        finished = time.perf_counter()
+        samples.append((finished - due) * 1000)
+        due = finished + PROBE_INTERVAL
+    return samples
+
+
+async def run(label: str, login, hashed: str, logins: int) -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        stop = asyncio.Event()
+        probe = asyncio.create_task(probe_latencies(client, stop))
+        await asyncio.sleep(0.05)
+        started = time.perf_counter()
+        await asyncio.gather(*(login(hashed) for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        await asyncio.sleep(PROBE_INTERVAL * 2)
+        stop.set()
+        samples = sorted(await probe)
+
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(
+        f"{label:<10} logins={logins} storm={elapsed:6.2f}s "
+        f"health p50={samples[len(samples) // 2]:7.2f}ms p99={p99:7.2f}ms max={samples[-1]:7.2f}ms"
+    )
+
+
+async def main(logins: int) -> None:
+    hashed = hash_password("password123")
+    await run("inline", inline_login, hashed, logins)
+    await run("executor", executor_login, hashed, logins)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 32))
@@ -0,0 +1,127 @@
+"""Shared helpers for the database benchmarks.
+
+Benchmarks run against the database configured in DATABASE_URL and clean up
+the organization they seed. Run them as modules from the project root, e.g.
+``python -m benchmarks.bench_keyset_pagination``.
+"""
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import (
+    ContactModel,
+    DealModel,
+    OrganizationMemberModel,
+    OrganizationModel,
+    OrgDealStatsModel,
+    OrgDealTimeseriesModel,
+    Role,
+    UserModel,
+)
+
+BATCH_SIZE = 5000
+
+
+async def seed_organization(session: AsyncSession) -> tuple[UUID, UUID]:
+    user_id = uuid4()
+    org_id = uuid4()
+    await session.execute(
+        insert(UserModel).values(
+            id=user_id,
+            email=f"bench-{user_id.hex}@example.com",
+            hashed_password="x",
+            name="Benchmark",
+        )
+    )
+    await session.execute(insert(OrganizationModel).values(id=org_id, name="Benchmark Org"))
+    await session.execute(
+        insert(OrganizationMemberModel).values(
+            id=uuid4(), organization_id=org_id, user_id=user_id, role=Role.OWNER
+        )
+    )
+    await session.commit()
+    return org_id, user_id
+
+
+async def seed_contacts(
+    session: AsyncSession, org_id: UUID, owner_id: UUID, count: int
+) -> list[UUID]:
+    ids: list[UUID] = []
+    for start in range(0, count, BATCH_SIZE):
+        rows = [
+            {
+                "id": uuid4(),
+                "organization_id": org_id,
+                "owner_id": owner_id,
+                "name": f"Contact {i}",
+                "email": f"contact{i}@example{i % 97}.com",
+                "phone": f"+1555{i:07d}",
+            }
+            for i in range(start, min(start + BATCH_SIZE, count))
+        ]
+        await session.execute(insert(ContactModel), rows)
+        ids.extend(row["id"] for row in rows)
+    await session.commit()
+    return ids
+
+
+async def seed_deals(
+    session: AsyncSession, org_id: UUID, owner_id: UUID, contact_id: UUID, count: int
+) -> None:
+    for start in range(0, count, BATCH_SIZE):
+        rows = [
+            {
+                "id": uuid4(),
+                "organization_id": org_id,
+                "contact_id": contact_id,
+                "owner_id": owner_id,
+                "title": f"Deal {i}",
+                "amount": 1000 + i % 1000,
+                "currency": "USD",
+                "status": "new",
+                "stage": "qualification",
+            }
+            for i in range(start, min(start + BATCH_SIZE, count))
+        ]
+        await session.execute(insert(DealModel), rows)
+    await session.commit()
+
+
+async def drop_organization(session: AsyncSession, org_id: UUID, user_id: UUID) -> None:
+    await session.execute(delete(DealModel).where(DealModel.organization_id == org_id))
+    await session.execute(
+        delete(OrgDealStatsModel).where(OrgDealStatsModel.organization_id == org_id)
+    )
+    await session.execute(
+        delete(OrgDealTimeseriesModel).where(OrgDealTimeseriesModel.organization_id == org_id)
+    )
+    await session.execute(delete(ContactModel).where(ContactModel.organization_id == org_id))
+    await session.execute(
+        delete(OrganizationMemberModel).where(OrganizationMemberModel.organization_id == org_id)
+    )
+    await session.execute(delete(OrganizationModel).where(OrganizationModel.id == org_id))
+    await session.execute(delete(UserModel).where(UserModel.id == user_id))
+    await session.commit()
+
+
+async def measure(fn: Callable[[], Awaitable[object]], repeat: int = 20) -> dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": statistics.median(samples),
+        "p95_ms": samples[int(len(samples) * 0.95) - 1],
+        "max_ms": samples[-1],
+    }
+
+
+def report(label: str, result: dict[str, float]) -> None:
+    stats = "  ".join(f"{key}={value:8.2f}" for key, value in result.items())
+    print(f"{label:<40} {stats}")
@@ -1,48 +1,83 @@
+from collections.abc import AsyncGenerator
+from ipaddress import ip_address, ip_network
 from uuid import UUID
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.security import verify_token
-from src.db.models import OrganizationMemberModel, UserModel
-from src.db.session import get_db
-from src.repositories.organization_member import OrganizationMemberRepository
-from src.repositories.user import UserRepository
+from src.core.config import settings
+from src.core.security import AccessTokenClaims, decode_access_token
+from src.db.session import engine, get_db, read_router, snapshot_session
+from src.domain.entities.organization_member import OrganizationMember
+from src.domain.entities.principal import Principal
+from src.domain.exceptions import AuthenticationError, AuthorizationError
+from src.services.auth import AuthService
+from src.services.membership import MembershipService
 
 security = HTTPBearer()
 
+READ_CONSISTENCY_HEADER = "X-Read-Consistency"
 
-async def get_current_user(
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in ip_network(proxy, strict=False) for proxy in settings.trusted_proxies)
+
+
+def get_client_ip(request: Request) -> str | None:
+    """The client's address, from X-Forwarded-For when the peer is a trusted proxy.
+
+    Hops are read right to left and the first one that is not a trusted proxy
+    wins, so a client cannot pick its address by sending the header itself.
+    """
+    address = request.client.host if request.client else None
+    if address is None or not _is_trusted_proxy(address):
+        return address
+    forwarded = ",".join(request.headers.getlist("x-forwarded-for"))
+    for hop in reversed([hop.strip() for hop in forwarded.split(",") if hop.strip()]):
+        address = hop
+        if not _is_trusted_proxy(hop):
+            break
+    return address
+
+
+async def get_access_token_claims(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    session: AsyncSession = Depends(get_db),
-) -> UserModel:
-    token = credentials.credentials
-    user_id = verify_token(token, "access")
+) -> AccessTokenClaims:
+    claims = decode_access_token(credentials.credentials)
 
-    if not user_id:
+    if not claims:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
         )
 
-    user_repo = UserRepository(session)
-    user = await user_repo.get_by_id(user_id)
+    return claims
 
-    if not user:
+
+async def get_current_user(
+    claims: AccessTokenClaims = Depends(get_access_token_claims),
+    session: AsyncSession = Depends(get_db, scope="function"),
+) -> Principal:
+    try:
+        return await AuthService(session).get_principal(claims.user_id)
+    except AuthenticationError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            detail=str(e),
         )
 
-    return user
-
 
 async def get_organization_context(
     x_organization_id: str = Header(...),
-    user: UserModel = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
-) -> tuple[UUID, OrganizationMemberModel]:
+    claims: AccessTokenClaims = Depends(get_access_token_claims),
+    user: Principal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db, scope="function"),
+) -> tuple[UUID, OrganizationMember]:
     try:
         org_id = UUID(x_organization_id)
     except ValueError:
@@ -51,16 +86,56 @@ async def get_organization_context(
             detail="Invalid organization ID format",
         )
 
-    member_repo = OrganizationMemberRepository(session)
-    results = await member_repo.get_user_organizations(user.id)
-
-    member = next((m for m, org in results if m.organization_id == org_id), None)
+    member = MembershipService.membership_from_claims(claims, user, org_id)
+    if member is not None:
+        return org_id, member
 
-    if not member:
-        available_orgs = [str(m.organization_id) for m, org in results]
+    try:
+        member = await MembershipService(session).get_membership(user, org_id)
+    except AuthorizationError as e:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail=f"Access denied to organization. Available organizations: {available_orgs}",
+            detail=str(e),
         )
 
     return org_id, member
+
+
+async def get_read_db(
+    request: Request,
+    session: AsyncSession = Depends(get_db, scope="function"),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Session for read-only endpoints: the replica when healthy, else the primary.
+
+    Clients that need to read their own writes send ``X-Read-Consistency: primary``.
+    """
+    if request.headers.get(READ_CONSISTENCY_HEADER, "").lower() == "primary":
+        if read_router.enabled:
+            read_router.forced_primary_reads += 1
+        yield session
+        return
+
+    if not await read_router.use_replica():
+        yield session
+        return
+
+    async with read_router.session() as replica_session:
+        yield replica_session
+
+
+async def get_export_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Snapshot session for streaming exports, routed like ``get_read_db``.
+
+    The session stays open until the response body has been sent, which needs
+    FastAPI 0.118+: earlier versions run the dependency's exit before streaming,
+    and the export would autobegin outside the snapshot.
+    """
+    if request.headers.get(READ_CONSISTENCY_HEADER, "").lower() == "primary":
+        if read_router.enabled:
+            read_router.forced_primary_reads += 1
+        bind = engine
+    else:
+        bind = read_router.engine if await read_router.use_replica() else engine
+
+    async with snapshot_session(bind) as session:
+        yield session
@@ -0,0 +1,33 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from src.core.tabular import encode_records
+from src.domain.value_objects.data_format import DataFormat
+
+_MEDIA_TYPES = {
+    DataFormat.CSV: "text/csv; charset=utf-8",
+    DataFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def export_response(
+    items: AsyncIterator[Any], schema: type[BaseModel], data_format: DataFormat, name: str
+) -> StreamingResponse:
+    """Stream ``items`` serialized through ``schema`` as a CSV or NDJSON download.
+
+    The 200 status is sent with the first chunk, so an error mid-stream can only
+    abort the connection: clients get a truncated body, not an error response.
+    """
+
+    async def rows() -> AsyncIterator[dict[str, Any]]:
+        async for item in items:
+            yield schema.model_validate(item).model_dump(mode="json")
+
+    return StreamingResponse(
+        encode_records(rows(), list(schema.model_fields), data_format),
+        media_type=_MEDIA_TYPES[data_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{data_format.value}"'},
+    )
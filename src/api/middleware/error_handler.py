@@ -6,6 +6,9 @@ from src.domain.exceptions import (
     AuthorizationError,
     ConflictError,
     NotFoundError,
+    PayloadTooLargeError,
+    RateLimitError,
+    ServiceUnavailableError,
     ValidationError,
 )
 
@@ -45,3 +48,30 @@ def add_exception_handlers(app: FastAPI) -> None:
             status_code=status.HTTP_409_CONFLICT,
             content={"error": "Conflict", "detail": str(exc)},
         )
+
+    @app.exception_handler(PayloadTooLargeError)
+    async def payload_too_large_error_handler(
+        request: Request, exc: PayloadTooLargeError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            content={"error": "Payload too large", "detail": str(exc)},
+        )
+
+    @app.exception_handler(ServiceUnavailableError)
+    async def service_unavailable_error_handler(
+        request: Request, exc: ServiceUnavailableError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"error": "Service unavailable", "detail": str(exc)},
+            headers={"Retry-After": "1"},
+        )
+
+    @app.exception_handler(RateLimitError)
+    async def rate_limit_error_handler(request: Request, exc: RateLimitError) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"error": "Too many requests", "detail": str(exc)},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
@@ -0,0 +1,16 @@
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_response(adapter: TypeAdapter[Any], content: Any) -> Response:
+    """Validate ``content`` with a prebuilt ``adapter`` and send it as JSON bytes.
+
+    Replaces FastAPI's response_model pass (validate, dump to Python objects,
+    ``json.dumps``) with a single pydantic-core validation and serialization;
+    the route's ``response_model`` then only documents the schema.
+    """
+    return Response(
+        adapter.dump_json(adapter.validate_python(content)), media_type="application/json"
+    )
@@ -1,48 +1,68 @@
+from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_organization_context
+from src.api.dependencies import get_export_db, get_organization_context, get_read_db
+from src.api.export import export_response
 from src.api.v1.schemas.activity import (
     ActivityCreate,
     ActivityListResponse,
     ActivityResponse,
 )
-from src.db.models import OrganizationMemberModel
+from src.db.models import ActivityType
 from src.db.session import get_db
-from src.domain.exceptions import AuthorizationError, NotFoundError
+from src.domain.entities.organization_member import OrganizationMember
+from src.domain.exceptions import AuthorizationError, NotFoundError, ValidationError
+from src.domain.value_objects.data_format import DataFormat
 from src.services.activity import ActivityService
 
 router = APIRouter(prefix="/deals/{deal_id}/activities", tags=["activities"])
+organization_router = APIRouter(prefix="/activities", tags=["activities"])
 
 
 @router.get(
     "",
     response_model=ActivityListResponse,
     summary="История активностей",
-    description="Возвращает полную историю активностей по сделке: комментарии, изменения статуса и стадии, создание задач.",
+    description="Возвращает историю активностей по сделке (комментарии, изменения статуса и стадии, создание задач) от новых к старым, постранично. Для следующей страницы передайте `next_cursor` из предыдущего ответа в параметр `cursor`. Параметр `type` оставляет активности одного типа, `since` — только созданные позже указанного момента, что удобно для периодического опроса новых событий.",
 )
 async def list_activities(
     deal_id: UUID,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(None),
+    activity_type: ActivityType | None = Query(None, alias="type"),
+    since: datetime | None = Query(None),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_read_db, scope="function"),
 ) -> ActivityListResponse:
     org_id, member = org_context
     activity_service = ActivityService(session)
 
     try:
-        activities = await activity_service.list_activities(
+        activities, next_cursor = await activity_service.list_activities(
             deal_id=deal_id,
             organization_id=org_id,
             user_id=member.user_id,
             role=member.role,
+            limit=limit,
+            cursor=cursor,
+            activity_type=activity_type,
+            since=since,
+        )
+        return ActivityListResponse(
+            items=[ActivityResponse.model_validate(a) for a in activities],
+            limit=limit,
+            next_cursor=next_cursor,
         )
-        return ActivityListResponse(items=[ActivityResponse.model_validate(a) for a in activities])
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except AuthorizationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
 @router.post(
@@ -55,8 +75,8 @@ async def list_activities(
 async def create_activity(
     deal_id: UUID,
     request: ActivityCreate,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> ActivityResponse:
     org_id, member = org_context
     activity_service = ActivityService(session)
@@ -74,3 +94,29 @@ async def create_activity(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except AuthorizationError as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
+
+@organization_router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Экспорт активностей",
+    description="Выгружает историю активностей по сделкам организации в формате CSV или NDJSON потоком. Можно ограничить выгрузку одной сделкой (`deal_id`) и типом активности (`type`). Участники без прав администратора получают только активности своих сделок.",
+)
+async def export_activities(
+    data_format: DataFormat = Query(DataFormat.CSV, alias="format"),
+    deal_id: UUID | None = Query(None),
+    activity_type: ActivityType | None = Query(None, alias="type"),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_export_db),
+) -> StreamingResponse:
+    org_id, member = org_context
+    activity_service = ActivityService(session)
+
+    activities = activity_service.export_activities(
+        organization_id=org_id,
+        user_id=member.user_id,
+        role=member.role,
+        deal_id=deal_id,
+        activity_type=activity_type,
+    )
+    return export_response(activities, ActivityResponse, data_format, "activities")
@@ -1,12 +1,19 @@
+from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_organization_context
-from src.api.v1.schemas.analytics import DealSummaryResponse, FunnelResponse
-from src.db.models import OrganizationMemberModel
-from src.db.session import get_db
+from src.api.dependencies import get_organization_context, get_read_db
+from src.api.v1.schemas.analytics import (
+    DealSummaryResponse,
+    FunnelResponse,
+    TimeseriesPointResponse,
+    TimeseriesResponse,
+)
+from src.domain.entities.organization_member import OrganizationMember
+from src.domain.exceptions import ValidationError
+from src.domain.value_objects.timeseries_granularity import TimeseriesGranularity
 from src.services.analytics import AnalyticsService
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
@@ -19,8 +26,8 @@ router = APIRouter(prefix="/analytics", tags=["analytics"])
     description="Возвращает агрегированную статистику по сделкам: количество, суммы, средние значения.",
 )
 async def get_deals_summary(
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_read_db, scope="function"),
 ) -> DealSummaryResponse:
     org_id, member = org_context
     analytics_service = AnalyticsService(session)
@@ -36,11 +43,44 @@ async def get_deals_summary(
     description="Возвращает распределение сделок по стадиям воронки.",
 )
 async def get_deals_funnel(
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_read_db, scope="function"),
 ) -> FunnelResponse:
     org_id, member = org_context
     analytics_service = AnalyticsService(session)
 
     funnel = await analytics_service.get_deals_funnel(org_id)
     return FunnelResponse(stages=funnel)
+
+
+@router.get(
+    "/deals/timeseries",
+    response_model=TimeseriesResponse,
+    summary="Динамика сделок",
+    description=(
+        "Возвращает по интервалам (день, неделя, месяц) количество созданных, "
+        "выигранных и проигранных сделок и сумму выигранных. "
+        "Интервалы без событий возвращаются с нулями."
+    ),
+)
+async def get_deals_timeseries(
+    granularity: TimeseriesGranularity = Query(TimeseriesGranularity.DAY),
+    date_from: date = Query(..., alias="from"),
+    date_to: date = Query(..., alias="to"),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_read_db, scope="function"),
+) -> TimeseriesResponse:
+    org_id, member = org_context
+    analytics_service = AnalyticsService(session)
+
+    try:
+        points = await analytics_service.get_deals_timeseries(
+            org_id, granularity, date_from, date_to
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return TimeseriesResponse(
+        granularity=granularity,
+        points=[TimeseriesPointResponse(**point) for point in points],
+    )
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.api.dependencies import get_client_ip
 from src.api.v1.schemas.auth import (
     LoginRequest,
     RegisterRequest,
@@ -23,7 +24,7 @@ router = APIRouter(prefix="/auth", tags=["auth"])
 )
 async def register(
     request: RegisterRequest,
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> RegisterResponse:
     auth_service = AuthService(session)
     try:
@@ -48,15 +49,18 @@ async def register(
     "/login",
     response_model=TokenResponse,
     summary="Вход в систему",
-    description="Аутентификация пользователя по email и паролю. Возвращает access и refresh токены.",
+    description="Аутентификация пользователя по email и паролю. Возвращает access и refresh токены. После серии неудачных попыток для email или IP-адреса возвращает 429 без проверки пароля.",
 )
 async def login(
     request: LoginRequest,
-    session: AsyncSession = Depends(get_db),
+    client_ip: str | None = Depends(get_client_ip),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> TokenResponse:
     auth_service = AuthService(session)
     try:
-        tokens = await auth_service.login(email=request.email, password=request.password)
+        tokens = await auth_service.login(
+            email=request.email, password=request.password, client_ip=client_ip
+        )
         return TokenResponse(
             access_token=tokens["access_token"],
             refresh_token=tokens["refresh_token"],
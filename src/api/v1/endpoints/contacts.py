@@ -1,51 +1,83 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from pydantic import ValidationError as SchemaValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_organization_context
+from src.api.dependencies import get_export_db, get_organization_context, get_read_db
+from src.api.export import export_response
+from src.api.responses import json_response
+from src.api.v1.schemas.common import BulkItemError
 from src.api.v1.schemas.contact import (
+    ContactBulkCreate,
+    ContactBulkCreateResponse,
     ContactCreate,
     ContactListResponse,
     ContactResponse,
     ContactUpdate,
 )
-from src.db.models import OrganizationMemberModel
+from src.core.pagination import TotalMode
 from src.db.session import get_db
-from src.domain.exceptions import AuthorizationError, ConflictError, NotFoundError
+from src.domain.entities.organization_member import OrganizationMember
+from src.domain.exceptions import (
+    AuthorizationError,
+    ConflictError,
+    NotFoundError,
+    ValidationError,
+)
+from src.domain.value_objects.data_format import DataFormat
+from src.domain.value_objects.search_mode import ContactSearchMode
 from src.services.contact import ContactService
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
+_CONTACT_LIST = TypeAdapter(ContactListResponse)
+
 
 @router.get(
     "",
     response_model=ContactListResponse,
     summary="Список контактов",
-    description="Возвращает список контактов организации с пагинацией и поиском.",
+    description="Возвращает список контактов организации с пагинацией и поиском. Для глубокой пагинации передавайте `next_cursor` из предыдущего ответа в параметр `cursor` вместо `offset`. Параметр `total_mode` управляет подсчётом `total`: `exact` — точное значение, `estimated` — оценка планировщика, `none` — без подсчёта. Параметр `search_mode` задаёт способ поиска: `contains` — подстрока в имени, email или телефоне, `similar` — нечёткий поиск с сортировкой по релевантности (без `cursor`), `prefix` — быстрый поиск по началу email или телефона.",
 )
 async def list_contacts(
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
+    total_mode: TotalMode = Query(TotalMode.EXACT),
     search: str | None = Query(None),
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
-) -> ContactListResponse:
+    search_mode: ContactSearchMode = Query(ContactSearchMode.CONTAINS),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_read_db, scope="function"),
+) -> Response:
     org_id, member = org_context
     contact_service = ContactService(session)
 
-    contacts, total = await contact_service.list_contacts(
-        organization_id=org_id,
-        limit=limit,
-        offset=offset,
-        search=search,
-    )
-
-    return ContactListResponse(
-        items=[ContactResponse.model_validate(c) for c in contacts],
-        total=total,
-        limit=limit,
-        offset=offset,
+    try:
+        contacts, total, next_cursor = await contact_service.list_contacts(
+            organization_id=org_id,
+            limit=limit,
+            offset=offset,
+            search=search,
+            cursor=cursor,
+            total_mode=total_mode,
+            search_mode=search_mode,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return json_response(
+        _CONTACT_LIST,
+        {
+            "items": contacts,
+            "total": total,
+            "total_exact": total_mode == TotalMode.EXACT,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+        },
     )
 
 
@@ -58,8 +90,8 @@ async def list_contacts(
 )
 async def create_contact(
     request: ContactCreate,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> ContactResponse:
     org_id, member = org_context
     contact_service = ContactService(session)
@@ -75,6 +107,67 @@ async def create_contact(
     return ContactResponse.model_validate(contact)
 
 
+@router.post(
+    "/bulk",
+    response_model=ContactBulkCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Массовое создание контактов",
+    description="Создаёт до `CONTACTS_BULK_MAX_ITEMS` контактов за один запрос. Каждый элемент проверяется отдельно: некорректные элементы возвращаются в `errors` с индексом и причиной, остальные создаются одной вставкой и возвращаются в `created` в исходном порядке.",
+)
+async def create_contacts_bulk(
+    request: ContactBulkCreate,
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
+) -> ContactBulkCreateResponse:
+    org_id, member = org_context
+    contact_service = ContactService(session)
+
+    valid: list[dict[str, str | None]] = []
+    errors: list[BulkItemError] = []
+    for index, item in enumerate(request.items):
+        try:
+            valid.append(ContactCreate.model_validate(item).model_dump())
+        except SchemaValidationError as e:
+            detail = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}"
+                for error in e.errors()
+            )
+            errors.append(BulkItemError(index=index, detail=detail))
+
+    contacts = await contact_service.create_contacts(
+        organization_id=org_id,
+        owner_id=member.user_id,
+        contacts=valid,
+    )
+
+    return ContactBulkCreateResponse(
+        created=[ContactResponse.model_validate(c) for c in contacts],
+        errors=errors,
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Экспорт контактов",
+    description="Выгружает все контакты организации в формате CSV или NDJSON потоком, без пагинации. Параметры `search` и `search_mode` работают так же, как в списке контактов. Данные читаются серверным курсором из одного снимка базы.",
+)
+async def export_contacts(
+    data_format: DataFormat = Query(DataFormat.CSV, alias="format"),
+    search: str | None = Query(None),
+    search_mode: ContactSearchMode = Query(ContactSearchMode.CONTAINS),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_export_db),
+) -> StreamingResponse:
+    org_id, member = org_context
+    contact_service = ContactService(session)
+
+    contacts = contact_service.export_contacts(
+        organization_id=org_id, search=search, search_mode=search_mode
+    )
+    return export_response(contacts, ContactResponse, data_format, "contacts")
+
+
 @router.get(
     "/{contact_id}",
     response_model=ContactResponse,
@@ -83,8 +176,8 @@ async def create_contact(
 )
 async def get_contact(
     contact_id: UUID,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> ContactResponse:
     org_id, member = org_context
     contact_service = ContactService(session)
@@ -105,8 +198,8 @@ async def get_contact(
 async def update_contact(
     contact_id: UUID,
     request: ContactUpdate,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> ContactResponse:
     org_id, member = org_context
     contact_service = ContactService(session)
@@ -114,6 +207,7 @@ async def update_contact(
     try:
         contact = await contact_service.update_contact(
             contact_id=contact_id,
+            organization_id=org_id,
             user_id=member.user_id,
             user_role=member.role,
             name=request.name,
@@ -135,8 +229,8 @@ async def update_contact(
 )
 async def delete_contact(
     contact_id: UUID,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> None:
     org_id, member = org_context
     contact_service = ContactService(session)
@@ -144,6 +238,7 @@ async def delete_contact(
     try:
         await contact_service.delete_contact(
             contact_id=contact_id,
+            organization_id=org_id,
             user_id=member.user_id,
             user_role=member.role,
         )
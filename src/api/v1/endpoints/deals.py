@@ -1,48 +1,78 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_organization_context
-from src.api.v1.schemas.deal import DealCreate, DealListResponse, DealResponse, DealUpdate
-from src.db.models import DealStage, DealStatus, OrganizationMemberModel
+from src.api.dependencies import get_export_db, get_organization_context, get_read_db
+from src.api.export import export_response
+from src.api.responses import json_response
+from src.api.v1.schemas.common import BulkItemError
+from src.api.v1.schemas.deal import (
+    DealBulkUpdate,
+    DealBulkUpdateResponse,
+    DealCreate,
+    DealDetailResponse,
+    DealListResponse,
+    DealResponse,
+    DealUpdate,
+)
+from src.core.pagination import TotalMode
+from src.db.models import DealStage, DealStatus
 from src.db.session import get_db
+from src.domain.entities.organization_member import OrganizationMember
 from src.domain.exceptions import AuthorizationError, NotFoundError, ValidationError
+from src.domain.value_objects.data_format import DataFormat
 from src.services.deal import DealService
 
 router = APIRouter(prefix="/deals", tags=["deals"])
 
+_DEAL_LIST = TypeAdapter(DealListResponse)
+
 
 @router.get(
     "",
     response_model=DealListResponse,
     summary="Список сделок",
-    description="Возвращает список сделок с фильтрацией по статусу и стадии.",
+    description="Возвращает список сделок с фильтрацией по статусу и стадии. Для глубокой пагинации передавайте `next_cursor` из предыдущего ответа в параметр `cursor` вместо `offset`. Параметр `total_mode` управляет подсчётом `total`: `exact` — точное значение, `estimated` — оценка планировщика, `none` — без подсчёта.",
 )
 async def list_deals(
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    status: DealStatus | None = Query(None),
+    cursor: str | None = Query(None),
+    total_mode: TotalMode = Query(TotalMode.EXACT),
+    deal_status: DealStatus | None = Query(None, alias="status"),
     stage: DealStage | None = Query(None),
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
-) -> DealListResponse:
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_read_db, scope="function"),
+) -> Response:
     org_id, member = org_context
     deal_service = DealService(session)
 
-    deals, total = await deal_service.list_deals(
-        organization_id=org_id,
-        limit=limit,
-        offset=offset,
-        status=status,
-        stage=stage,
-    )
+    try:
+        deals, total, next_cursor = await deal_service.list_deals(
+            organization_id=org_id,
+            limit=limit,
+            offset=offset,
+            status=deal_status,
+            stage=stage,
+            cursor=cursor,
+            total_mode=total_mode,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    return DealListResponse(
-        items=[DealResponse.model_validate(d) for d in deals],
-        total=total,
-        limit=limit,
-        offset=offset,
+    return json_response(
+        _DEAL_LIST,
+        {
+            "items": deals,
+            "total": total,
+            "total_exact": total_mode == TotalMode.EXACT,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+        },
     )
 
 
@@ -55,8 +85,8 @@ async def list_deals(
 )
 async def create_deal(
     request: DealCreate,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> DealResponse:
     org_id, member = org_context
     deal_service = DealService(session)
@@ -75,25 +105,91 @@ async def create_deal(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.patch(
+    "/bulk",
+    response_model=DealBulkUpdateResponse,
+    summary="Массовое обновление сделок",
+    description="Применяет одинаковые изменения статуса, стадии и/или владельца к списку сделок (до `DEALS_BULK_MAX_ITEMS` ID) одним запросом к базе. Сделки, которые не найдены или недоступны для изменения, возвращаются в `errors` с индексом ID и причиной, остальные обновляются и возвращаются в `updated`. Записи об изменении статуса и стадии добавляются в историю активностей одной вставкой.",
+)
+async def update_deals_bulk(
+    request: DealBulkUpdate,
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
+) -> DealBulkUpdateResponse:
+    org_id, member = org_context
+    deal_service = DealService(session)
+
+    try:
+        deals, errors = await deal_service.update_deals(
+            deal_ids=request.ids,
+            organization_id=org_id,
+            user_id=member.user_id,
+            user_role=member.role,
+            status=request.status,
+            stage=request.stage,
+            owner_id=request.owner_id,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return DealBulkUpdateResponse(
+        updated=[DealResponse.model_validate(d) for d in deals],
+        errors=[BulkItemError(index=index, detail=detail) for index, detail in errors],
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Экспорт сделок",
+    description="Выгружает все сделки организации в формате CSV или NDJSON потоком, без пагинации. Поддерживает те же фильтры, что и список сделок. Данные читаются серверным курсором из одного снимка базы, поэтому потребление памяти не зависит от объёма выгрузки.",
+)
+async def export_deals(
+    data_format: DataFormat = Query(DataFormat.CSV, alias="format"),
+    deal_status: DealStatus | None = Query(None, alias="status"),
+    stage: DealStage | None = Query(None),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_export_db),
+) -> StreamingResponse:
+    org_id, member = org_context
+    deal_service = DealService(session)
+
+    deals = deal_service.export_deals(organization_id=org_id, status=deal_status, stage=stage)
+    return export_response(deals, DealResponse, data_format, "deals")
+
+
 @router.get(
     "/{deal_id}",
-    response_model=DealResponse,
+    response_model=DealDetailResponse,
     summary="Получение сделки",
-    description="Возвращает детальную информацию о сделке по её ID.",
+    description="Возвращает детальную информацию о сделке по её ID. Параметр include (через запятую: contact, tasks, activities) добавляет в ответ контакт, задачи (по сроку) и активности (сначала новые) одним запросом к БД; списки ограничены DEAL_DETAIL_MAX_ITEMS элементами, полные списки доступны через /tasks и /deals/{deal_id}/activities.",
 )
 async def get_deal(
     deal_id: UUID,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
-) -> DealResponse:
+    include: str | None = Query(None, description="contact,tasks,activities"),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
+) -> DealDetailResponse:
     org_id, member = org_context
     deal_service = DealService(session)
 
     try:
-        deal = await deal_service.get_deal(deal_id, org_id)
-        return DealResponse.model_validate(deal)
+        deal, related = await deal_service.get_deal_detail(
+            deal_id, org_id, member.user_id, member.role, include
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except NotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except AuthorizationError as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
+    return DealDetailResponse(
+        **DealResponse.model_validate(deal).model_dump(),
+        contact=related.get("contact"),
+        tasks=related.get("tasks"),
+        activities=related.get("activities"),
+    )
 
 
 @router.patch(
@@ -105,8 +201,8 @@ async def get_deal(
 async def update_deal(
     deal_id: UUID,
     request: DealUpdate,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> DealResponse:
     org_id, member = org_context
     deal_service = DealService(session)
@@ -139,8 +235,8 @@ async def update_deal(
 )
 async def delete_deal(
     deal_id: UUID,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> None:
     org_id, member = org_context
     deal_service = DealService(session)
@@ -0,0 +1,86 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.api.dependencies import get_organization_context
+from src.api.v1.schemas.import_job import ImportJobResponse
+from src.db.models import ImportEntity
+from src.db.session import get_db, get_session_factory
+from src.domain.entities.organization_member import OrganizationMember
+from src.domain.exceptions import NotFoundError
+from src.domain.value_objects.data_format import DataFormat
+from src.services.import_job import ImportService, schedule_import, spool_upload
+
+router = APIRouter(prefix="/imports", tags=["imports"])
+
+_UPLOAD_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "text/csv": {"schema": {"type": "string", "format": "binary"}},
+            "application/x-ndjson": {"schema": {"type": "string", "format": "binary"}},
+        },
+    }
+}
+
+
+@router.post(
+    "/{entity}",
+    response_model=ImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Импорт контактов или сделок",
+    description="Загружает контакты или сделки из тела запроса в формате CSV (с заголовком) или NDJSON. Тело сохраняется во временный файл (не больше IMPORT_MAX_UPLOAD_BYTES, иначе 413), после чего запрос сразу отвечает 202 с задачей в статусе `running` и заголовком `Location`; импорт идёт в фоне. Поток обрабатывается порциями: каждая порция загружается через COPY во временную таблицу и переносится в данные организации отдельной транзакцией, поэтому ход импорта можно отслеживать через `GET /imports/{job_id}`. Сделки ссылаются на контакт через `contact_id` или `contact_email`. Некорректные строки не прерывают импорт и возвращаются в `errors` с номером строки.",
+    openapi_extra=_UPLOAD_BODY,
+)
+async def create_import(
+    entity: ImportEntity,
+    request: Request,
+    response: Response,
+    data_format: DataFormat = Query(DataFormat.CSV, alias="format"),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> ImportJobResponse:
+    org_id, member = org_context
+    import_service = ImportService(session)
+
+    upload = await spool_upload(request.stream())
+    try:
+        job = await import_service.create_job(
+            organization_id=org_id,
+            user_id=member.user_id,
+            entity=entity,
+            data_format=data_format,
+        )
+        # get_db only commits once the endpoint returns, and the background import
+        # may start first: it reads the job from its own session.
+        await session.commit()
+    except BaseException:
+        await upload.close()
+        raise
+
+    schedule_import(job.id, upload, session_factory)
+    response.headers["Location"] = request.url_for("get_import", job_id=job.id).path
+    return ImportJobResponse.model_validate(job)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=ImportJobResponse,
+    summary="Статус импорта",
+    description="Возвращает состояние задачи импорта: статус, количество обработанных, загруженных и отклонённых строк и первые ошибки.",
+)
+async def get_import(
+    job_id: UUID,
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
+) -> ImportJobResponse:
+    org_id, member = org_context
+    import_service = ImportService(session)
+
+    try:
+        job = await import_service.get_job(job_id, org_id)
+        return ImportJobResponse.model_validate(job)
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
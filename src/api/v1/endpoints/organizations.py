@@ -2,8 +2,8 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.dependencies import get_current_user
-from src.db.models import UserModel
 from src.db.session import get_db
+from src.domain.entities.principal import Principal
 from src.repositories.organization_member import OrganizationMemberRepository
 
 router = APIRouter(prefix="/organizations", tags=["organizations"])
@@ -15,8 +15,8 @@ router = APIRouter(prefix="/organizations", tags=["organizations"])
     description="Возвращает список всех организаций, к которым принадлежит текущий пользователь, с указанием роли.",
 )
 async def get_my_organizations(
-    user: UserModel = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    user: Principal = Depends(get_current_user),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> list[dict]:
     member_repo = OrganizationMemberRepository(session)
     results = await member_repo.get_user_organizations(user.id)
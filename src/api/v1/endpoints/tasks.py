@@ -1,12 +1,13 @@
+from datetime import date
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_organization_context
+from src.api.dependencies import get_organization_context, get_read_db
 from src.api.v1.schemas.task import TaskCreate, TaskListResponse, TaskResponse, TaskUpdate
-from src.db.models import OrganizationMemberModel
 from src.db.session import get_db
+from src.domain.entities.organization_member import OrganizationMember
 from src.domain.exceptions import AuthorizationError, NotFoundError, ValidationError
 from src.services.task import TaskService
 
@@ -17,24 +18,43 @@ router = APIRouter(prefix="/tasks", tags=["tasks"])
     "",
     response_model=TaskListResponse,
     summary="Список задач",
-    description="Возвращает список задач с возможностью фильтрации по сделке и статусу выполнения.",
+    description="Возвращает задачи сделки (`deal_id`) или, без него, задачи всей организации, упорядоченные по сроку выполнения. Задачи организации фильтруются по владельцу сделки (`owner_id`), статусу выполнения (`is_done` или `only_open`) и диапазону сроков (`due_from`, `due_to`) и отдаются постранично: для следующей страницы передайте `next_cursor` в параметр `cursor`.",
 )
 async def list_tasks(
     deal_id: UUID | None = Query(None),
     only_open: bool = Query(False),
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    is_done: bool | None = Query(None),
+    owner_id: UUID | None = Query(None),
+    due_from: date | None = Query(None),
+    due_to: date | None = Query(None),
+    limit: int = Query(50, ge=1, le=100),
+    cursor: str | None = Query(None),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_read_db, scope="function"),
 ) -> TaskListResponse:
     org_id, member = org_context
     task_service = TaskService(session)
 
-    tasks = await task_service.list_tasks(
-        organization_id=org_id,
-        deal_id=deal_id,
-        only_open=only_open,
-    )
+    try:
+        tasks, next_cursor = await task_service.list_tasks(
+            organization_id=org_id,
+            deal_id=deal_id,
+            only_open=only_open,
+            is_done=is_done,
+            owner_id=owner_id,
+            due_from=due_from,
+            due_to=due_to,
+            limit=limit,
+            cursor=cursor,
+        )
+    except NotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValidationError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    return TaskListResponse(items=[TaskResponse.model_validate(t) for t in tasks])
+    return TaskListResponse(
+        items=[TaskResponse.model_validate(t) for t in tasks], next_cursor=next_cursor
+    )
 
 
 @router.post(
@@ -47,8 +67,8 @@ async def list_tasks(
 async def create_task(
     deal_id: UUID,
     request: TaskCreate,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> TaskResponse:
     org_id, member = org_context
     task_service = TaskService(session)
@@ -80,8 +100,8 @@ async def create_task(
 )
 async def get_task(
     task_id: UUID,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> TaskResponse:
     org_id, member = org_context
     task_service = TaskService(session)
@@ -102,8 +122,8 @@ async def get_task(
 async def update_task(
     task_id: UUID,
     request: TaskUpdate,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> TaskResponse:
     org_id, member = org_context
     task_service = TaskService(session)
@@ -134,8 +154,8 @@ async def update_task(
 )
 async def delete_task(
     task_id: UUID,
-    org_context: tuple[UUID, OrganizationMemberModel] = Depends(get_organization_context),
-    session: AsyncSession = Depends(get_db),
+    org_context: tuple[UUID, OrganizationMember] = Depends(get_organization_context),
+    session: AsyncSession = Depends(get_db, scope="function"),
 ) -> None:
     org_id, member = org_context
     task_service = TaskService(session)
@@ -24,3 +24,5 @@ class ActivityResponse(BaseModel):
 
 class ActivityListResponse(BaseModel):
     items: list[ActivityResponse]
+    limit: int
+    next_cursor: str | None = None
@@ -1,7 +1,10 @@
+from datetime import date
 from decimal import Decimal
 
 from pydantic import BaseModel
 
+from src.domain.value_objects.timeseries_granularity import TimeseriesGranularity
+
 
 class DealSummaryResponse(BaseModel):
     total_count: int
@@ -21,3 +24,16 @@ class FunnelStageResponse(BaseModel):
 
 class FunnelResponse(BaseModel):
     stages: list[FunnelStageResponse]
+
+
+class TimeseriesPointResponse(BaseModel):
+    bucket_start: date
+    created_count: int
+    won_count: int
+    lost_count: int
+    won_amount: Decimal
+
+
+class TimeseriesResponse(BaseModel):
+    granularity: TimeseriesGranularity
+    points: list[TimeseriesPointResponse]
@@ -10,6 +10,11 @@ class ErrorResponse(BaseModel):
     detail: str
 
 
+class BulkItemError(BaseModel):
+    index: int
+    detail: str
+
+
 class PaginationParams(BaseModel):
     limit: int = 50
     offset: int = 0
@@ -1,7 +1,11 @@
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.api.v1.schemas.common import BulkItemError
+from src.core.config import settings
 
 
 class ContactCreate(BaseModel):
@@ -22,6 +26,11 @@ class ContactCreate(BaseModel):
     }
 
 
+class ContactBulkCreate(BaseModel):
+    # Items are validated one by one so a bad item is reported, not the whole batch.
+    items: list[dict[str, Any]] = Field(min_length=1, max_length=settings.contacts_bulk_max_items)
+
+
 class ContactUpdate(BaseModel):
     name: str | None = None
     email: str | None = None
@@ -42,6 +51,13 @@ class ContactResponse(BaseModel):
 
 class ContactListResponse(BaseModel):
     items: list[ContactResponse]
-    total: int
+    total: int | None
+    total_exact: bool = True
     limit: int
     offset: int
+    next_cursor: str | None = None
+
+
+class ContactBulkCreateResponse(BaseModel):
+    created: list[ContactResponse]
+    errors: list[BulkItemError]
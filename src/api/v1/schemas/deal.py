@@ -2,8 +2,13 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
+from src.api.v1.schemas.activity import ActivityResponse
+from src.api.v1.schemas.common import BulkItemError
+from src.api.v1.schemas.contact import ContactResponse
+from src.api.v1.schemas.task import TaskResponse
+from src.core.config import settings
 from src.db.models import DealStage, DealStatus
 
 
@@ -34,6 +39,13 @@ class DealUpdate(BaseModel):
     stage: DealStage | None = None
 
 
+class DealBulkUpdate(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=settings.deals_bulk_max_items)
+    status: DealStatus | None = None
+    stage: DealStage | None = None
+    owner_id: UUID | None = None
+
+
 class DealResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -48,10 +60,25 @@ class DealResponse(BaseModel):
     stage: DealStage
     created_at: datetime
     updated_at: datetime
+    closed_at: datetime | None = None
+
+
+class DealDetailResponse(DealResponse):
+    # Filled only for the relations named in ?include=.
+    contact: ContactResponse | None = None
+    tasks: list[TaskResponse] | None = None
+    activities: list[ActivityResponse] | None = None
 
 
 class DealListResponse(BaseModel):
     items: list[DealResponse]
-    total: int
+    total: int | None
+    total_exact: bool = True
     limit: int
     offset: int
+    next_cursor: str | None = None
+
+
+class DealBulkUpdateResponse(BaseModel):
+    updated: list[DealResponse]
+    errors: list[BulkItemError]
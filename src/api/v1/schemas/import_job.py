@@ -0,0 +1,30 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+from src.db.models import ImportEntity, ImportStatus
+from src.domain.value_objects.data_format import DataFormat
+
+
+class ImportRowError(BaseModel):
+    line: int
+    detail: str
+
+
+class ImportJobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    organization_id: UUID
+    created_by: UUID
+    entity: ImportEntity
+    format: DataFormat
+    status: ImportStatus
+    processed_rows: int
+    imported_rows: int
+    failed_rows: int
+    errors: list[ImportRowError]
+    error: str | None
+    created_at: datetime
+    finished_at: datetime | None
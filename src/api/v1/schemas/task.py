@@ -21,6 +21,7 @@ class TaskResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
+    organization_id: UUID
     deal_id: UUID
     title: str
     description: str | None
@@ -31,3 +32,4 @@ class TaskResponse(BaseModel):
 
 class TaskListResponse(BaseModel):
     items: list[TaskResponse]
+    next_cursor: str | None = None
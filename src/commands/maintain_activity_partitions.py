@@ -0,0 +1,56 @@
+"""Create upcoming monthly activities partitions and retire expired ones.
+
+Usage: python -m src.commands.maintain_activity_partitions
+
+Partitions are created through ACTIVITY_PARTITION_MONTHS_AHEAD months from now.
+With ACTIVITY_RETENTION_MONTHS set, months older than that are detached and
+dropped, or moved to ACTIVITY_ARCHIVE_SCHEMA when it is set.
+"""
+import asyncio
+from datetime import UTC, datetime
+
+from sqlalchemy import text
+
+from src.core.config import settings
+from src.db.session import AsyncSessionLocal, engine
+from src.repositories.activity_partition import (
+    ActivityPartitionRepository,
+    add_months,
+    month_start,
+    partition_name,
+)
+
+
+async def main() -> None:
+    current = month_start(datetime.now(UTC))
+    async with AsyncSessionLocal() as session:
+        # Detaching locks the whole table; fail instead of queueing every
+        # activity query behind a long-running reader.
+        await session.execute(text("SET LOCAL lock_timeout = '5s'"))
+        repo = ActivityPartitionRepository(session)
+        existing = await repo.list_months()
+
+        for offset in range(settings.activity_partition_months_ahead + 1):
+            month = add_months(current, offset)
+            if month not in existing:
+                moved = await repo.create(month)
+                print(f"Created {partition_name(month)} ({moved} rows moved from default)")
+
+        if settings.activity_retention_months > 0:
+            cutoff = add_months(current, -settings.activity_retention_months)
+            for month in existing:
+                if month < cutoff:
+                    await repo.detach(month, settings.activity_archive_schema)
+                    action = (
+                        f"archived to {settings.activity_archive_schema}"
+                        if settings.activity_archive_schema
+                        else "dropped"
+                    )
+                    print(f"Detached {partition_name(month)}, {action}")
+
+        await session.commit()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
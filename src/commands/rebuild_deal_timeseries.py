@@ -0,0 +1,22 @@
+"""Recompute the org_deal_timeseries rollup from the deals table.
+
+Usage: python -m src.commands.rebuild_deal_timeseries [organization_id]
+"""
+import asyncio
+import sys
+from uuid import UUID
+
+from src.db.session import AsyncSessionLocal, engine
+from src.repositories.deal_timeseries import DealTimeseriesRepository
+
+
+async def main(organization_id: UUID | None) -> None:
+    async with AsyncSessionLocal() as session:
+        rows = await DealTimeseriesRepository(session).rebuild(organization_id)
+        await session.commit()
+    await engine.dispose()
+    print(f"Rebuilt {rows} org_deal_timeseries rows")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(UUID(sys.argv[1]) if len(sys.argv) > 1 else None))
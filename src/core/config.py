@@ -4,13 +4,49 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     database_url: PostgresDsn
+    database_replica_url: PostgresDsn | None = None
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = -1
+    db_pool_pre_ping: bool = True
+    db_pool_use_lifo: bool = False
+    db_statement_cache_size: int = 100
+    replica_max_lag_seconds: float = 5.0
+    replica_health_check_interval_seconds: float = 1.0
     jwt_secret: str
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 7
+    access_token_membership_claims: bool = False
+    access_token_max_memberships: int = 50
     bcrypt_rounds: int = 12
+    password_hash_workers: int = 4
+    password_hash_queue_limit: int = 64
+    login_max_failures_per_email: int = 5
+    login_max_failures_per_ip: int = 50
+    login_failure_window_seconds: int = 900
+    login_throttle_max_keys: int = 100000
+    trusted_proxies: list[str] = []
+    contacts_bulk_max_items: int = 1000
+    deals_bulk_max_items: int = 1000
+    deal_detail_max_items: int = 20
+    import_chunk_rows: int = 5000
+    import_max_record_length: int = 65536
+    import_max_reported_errors: int = 1000
+    import_max_upload_bytes: int = 100 * 1024 * 1024
+    export_batch_rows: int = 1000
+    activity_partition_months_ahead: int = 3
+    activity_retention_months: int = 0
+    activity_archive_schema: str | None = None
     api_v1_prefix: str = "/api/v1"
     debug: bool = False
+    analytics_cache_ttl_seconds: int = 300
+    analytics_cache_max_entries: int = 1024
+    principal_cache_ttl_seconds: int = 60
+    principal_cache_max_entries: int = 10000
+    membership_cache_ttl_seconds: int = 60
+    membership_cache_max_entries: int = 10000
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,36 @@
+import bisect
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+LATENCY_BUCKETS_SECONDS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    """Fixed-bucket histogram with cumulative, Prometheus-style bucket counts."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_SECONDS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.sum += value
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            counts = list(self._counts)
+            count, total = self.count, self.sum
+
+        cumulative = 0
+        buckets: dict[str, int] = {}
+        for bound, bucket_count in zip((*self.buckets, "+Inf"), counts, strict=True):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        return {"count": count, "sum": total, "buckets": buckets}
@@ -0,0 +1,41 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from src.domain.exceptions import ValidationError
+
+
+class TotalMode(str, Enum):
+    """How a list endpoint computes the total number of matching rows."""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+def encode_cursor(*values: datetime | date | UUID) -> str:
+    raw = json.dumps([value.isoformat() if isinstance(value, date) else str(value) for value in values])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple[Any, ...]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError(cursor)
+        return tuple(_parse(value, type_) for value, type_ in zip(values, types, strict=True))
+    except (ValueError, TypeError, UnicodeError, binascii.Error):
+        raise ValidationError("Invalid cursor")
+
+
+def _parse(value: str, type_: type) -> Any:
+    if type_ is datetime:
+        return datetime.fromisoformat(value)
+    if type_ is date:
+        return date.fromisoformat(value)
+    return type_(value)
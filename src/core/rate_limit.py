@@ -0,0 +1,122 @@
+import math
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Protocol
+
+
+class RateLimitBackend(Protocol):
+    """Storage for sliding-window counters; swap in a shared store for multi-process setups."""
+
+    async def count(self, key: str, now: float, window_seconds: float) -> float: ...
+
+    async def increment(self, key: str, now: float, window_seconds: float) -> None: ...
+
+    async def decrement(self, key: str, now: float, window_seconds: float) -> None: ...
+
+    async def reset(self, key: str) -> None: ...
+
+
+class InMemoryRateLimitBackend:
+    """Per-process sliding-window counters, bounded to ``max_keys`` by LRU eviction.
+
+    Each key costs one small tuple: the current fixed-window index and the
+    counts of the current and previous windows. The sliding count weights the
+    previous window by how much of it still overlaps the sliding window.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._counters: OrderedDict[str, tuple[int, int, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+    def _current(self, key: str, index: int) -> tuple[int, int]:
+        entry = self._counters.get(key)
+        if entry is None:
+            return 0, 0
+        stored_index, current, previous = entry
+        if stored_index == index:
+            return current, previous
+        if stored_index == index - 1:
+            return 0, current
+        return 0, 0
+
+    async def count(self, key: str, now: float, window_seconds: float) -> float:
+        index = math.floor(now / window_seconds)
+        current, previous = self._current(key, index)
+        overlap = 1 - (now - index * window_seconds) / window_seconds
+        return current + previous * overlap
+
+    async def increment(self, key: str, now: float, window_seconds: float) -> None:
+        index = math.floor(now / window_seconds)
+        current, previous = self._current(key, index)
+        self._counters[key] = (index, current + 1, previous)
+        self._counters.move_to_end(key)
+        while len(self._counters) > self.max_keys:
+            self._counters.popitem(last=False)
+
+    async def decrement(self, key: str, now: float, window_seconds: float) -> None:
+        # Only the current window is decremented; an attempt counted just before a
+        # window boundary stays in the previous one.
+        index = math.floor(now / window_seconds)
+        current, previous = self._current(key, index)
+        if current:
+            self._counters[key] = (index, current - 1, previous)
+
+    async def reset(self, key: str) -> None:
+        self._counters.pop(key, None)
+
+
+class SlidingWindowRateLimiter:
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        limit: int,
+        window_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.backend = backend
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self.rejected = 0
+
+    async def is_allowed(self, key: str) -> bool:
+        count = await self.backend.count(key, self._clock(), self.window_seconds)
+        if count >= self.limit:
+            self.rejected += 1
+            return False
+        return True
+
+    async def hit(self, key: str) -> None:
+        await self.backend.increment(key, self._clock(), self.window_seconds)
+
+    async def acquire(self, key: str) -> bool:
+        """Count an attempt for ``key`` unless it is already over the limit.
+
+        Counting up front, rather than after the attempt failed, makes concurrent
+        attempts see each other while they are still in flight.
+        """
+        if not await self.is_allowed(key):
+            return False
+        await self.hit(key)
+        return True
+
+    async def release(self, key: str) -> None:
+        """Take back an attempt counted by ``acquire`` that turned out not to count."""
+        await self.backend.decrement(key, self._clock(), self.window_seconds)
+
+    async def reset(self, key: str) -> None:
+        await self.backend.reset(key)
+
+    def stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = {
+            "limit": self.limit,
+            "window_seconds": self.window_seconds,
+            "rejected": self.rejected,
+        }
+        if isinstance(self.backend, InMemoryRateLimitBackend):
+            stats["tracked_keys"] = len(self.backend)
+        return stats
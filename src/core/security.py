@@ -1,10 +1,21 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from typing import Any, TypeVar
 from uuid import UUID
 
 import bcrypt
 import jwt
 
 from src.core.config import settings
+from src.core.metrics import Histogram
+from src.domain.exceptions import ServiceUnavailableError
+
+T = TypeVar("T")
 
 
 def hash_password(password: str) -> str:
@@ -17,13 +28,116 @@ def verify_password(password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
 
 
-def create_access_token(user_id: UUID) -> str:
+class PasswordHashExecutor:
+    """Bounded thread pool that keeps bcrypt work off the event loop.
+
+    bcrypt releases the GIL, so workers hash in parallel while the loop keeps
+    serving other requests. Work beyond ``workers + queue_limit`` in-flight
+    calls is rejected immediately instead of queueing without bound.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_time = Histogram()
+        self.run_time = Histogram()
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            if self.in_flight >= self.workers + self.queue_limit:
+                self.rejected += 1
+                raise ServiceUnavailableError("Password hashing capacity exhausted, retry later")
+            self.in_flight += 1
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hash"
+            )
+
+        submitted_at = time.perf_counter()
+
+        def job() -> T:
+            started_at = time.perf_counter()
+            self.wait_time.observe(started_at - submitted_at)
+            try:
+                return fn(*args)
+            finally:
+                self.run_time.observe(time.perf_counter() - started_at)
+
+        # Release the slot when the thread finishes, not when the caller stops
+        # waiting, so a cancelled request cannot free capacity that is still busy.
+        future = self._executor.submit(job)
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            in_flight = self.in_flight
+        return {
+            "workers": self.workers,
+            "queue_limit": self.queue_limit,
+            "in_flight": in_flight,
+            "queue_depth": max(in_flight - self.workers, 0),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_seconds": self.wait_time.snapshot(),
+            "run_seconds": self.run_time.snapshot(),
+        }
+
+
+password_hash_executor = PasswordHashExecutor(
+    workers=settings.password_hash_workers,
+    queue_limit=settings.password_hash_queue_limit,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    return await password_hash_executor.run(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    return await password_hash_executor.run(verify_password, password, hashed_password)
+
+
+@dataclass(frozen=True, slots=True)
+class AccessTokenClaims:
+    """Verified access token contents.
+
+    ``memberships`` maps organization id to ``(member_id, role)`` and is only
+    populated for tokens issued with membership claims.
+    """
+
+    user_id: UUID
+    membership_version: int | None = None
+    memberships: dict[UUID, tuple[UUID, str]] = field(default_factory=dict)
+
+
+def create_access_token(
+    user_id: UUID,
+    memberships: dict[UUID, tuple[UUID, str]] | None = None,
+    membership_version: int | None = None,
+) -> str:
     expire = datetime.now(UTC) + timedelta(minutes=settings.access_token_expire_minutes)
-    payload = {
+    payload: dict[str, Any] = {
         "sub": str(user_id),
         "exp": expire,
         "type": "access",
     }
+    if memberships is not None and membership_version is not None:
+        payload["mv"] = membership_version
+        payload["orgs"] = {
+            str(org_id): [str(member_id), role] for org_id, (member_id, role) in memberships.items()
+        }
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
@@ -50,6 +164,24 @@ def verify_token(token: str, token_type: str = "access") -> UUID | None:
         return None
 
 
+def decode_access_token(token: str) -> AccessTokenClaims | None:
+    try:
+        payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
+        if payload.get("type") != "access" or payload.get("sub") is None:
+            return None
+        version = payload.get("mv")
+        orgs = payload.get("orgs") or {}
+        return AccessTokenClaims(
+            user_id=UUID(payload["sub"]),
+            membership_version=version if isinstance(version, int) else None,
+            memberships={
+                UUID(org_id): (UUID(member_id), role) for org_id, (member_id, role) in orgs.items()
+            },
+        )
+    except (jwt.InvalidTokenError, ValueError, TypeError, AttributeError):
+        return None
+
+
 def decode_token(token: str) -> dict | None:
     try:
         return jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
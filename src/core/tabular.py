@@ -0,0 +1,145 @@
+import codecs
+import csv
+import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from src.domain.exceptions import ValidationError
+from src.domain.value_objects.data_format import DataFormat
+
+
+@dataclass(frozen=True, slots=True)
+class Record:
+    """One parsed input record; ``values`` is None when the record itself is malformed."""
+
+    line: int
+    values: dict[str, Any] | None
+    error: str | None = None
+
+
+async def iter_records(
+    chunks: AsyncIterable[bytes], data_format: DataFormat, max_record_length: int
+) -> AsyncIterator[Record]:
+    """Parse a UTF-8 CSV (with header) or NDJSON byte stream record by record.
+
+    Only the current record is buffered. Malformed records are yielded with an
+    error; input that cannot be read at all raises ValidationError.
+    """
+    lines = _iter_lines(chunks, max_record_length)
+    parse = _csv_records if data_format == DataFormat.CSV else _ndjson_records
+    async for record in parse(lines, max_record_length):
+        yield record
+
+
+async def encode_records(
+    rows: AsyncIterable[dict[str, Any]],
+    columns: Sequence[str],
+    data_format: DataFormat,
+    chunk_size: int = 65536,
+) -> AsyncIterator[bytes]:
+    """Serialize JSON-compatible ``rows`` as CSV (with header) or NDJSON.
+
+    Output is yielded in chunks of roughly ``chunk_size`` bytes.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if data_format == DataFormat.CSV:
+        writer.writerow(columns)
+
+    async for row in rows:
+        if data_format == DataFormat.CSV:
+            writer.writerow([_csv_value(row.get(column)) for column in columns])
+        else:
+            buffer.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+            buffer.write("\n")
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, dict | list):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return value
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes], max_length: int) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                yield line.removesuffix("\r")
+            if len(pending) > max_length:
+                raise ValidationError(f"Line exceeds {max_length} characters")
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise ValidationError("Input is not valid UTF-8")
+    if pending:
+        yield pending.removesuffix("\r")
+
+
+async def _csv_records(lines: AsyncIterator[str], max_length: int) -> AsyncIterator[Record]:
+    header: list[str] | None = None
+    parts: list[str] = []
+    quotes = length = start = 0
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not parts:
+            start = line_number
+        parts.append(line)
+        quotes += line.count('"')
+        length += len(line)
+        if length > max_length:
+            raise ValidationError(f"Record at line {start} exceeds {max_length} characters")
+        # Quotes inside fields are doubled, so an odd count means the record
+        # continues on the next line.
+        if quotes % 2:
+            continue
+
+        text = "\n".join(parts)
+        parts, quotes, length = [], 0, 0
+        if not text.strip():
+            continue
+        try:
+            values = next(csv.reader([text]))
+        except csv.Error as e:
+            yield Record(start, None, f"Malformed CSV: {e}")
+            continue
+
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield Record(start, None, f"Expected {len(header)} fields, got {len(values)}")
+            continue
+        yield Record(start, dict(zip(header, values, strict=True)))
+
+    if parts:
+        yield Record(start, None, "Unterminated quoted field")
+
+
+async def _ndjson_records(lines: AsyncIterator[str], max_length: int) -> AsyncIterator[Record]:
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            values = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield Record(line_number, None, f"Invalid JSON: {e.msg}")
+            continue
+        if not isinstance(values, dict):
+            yield Record(line_number, None, "Expected a JSON object")
+            continue
+        yield Record(line_number, values)
@@ -5,4 +5,6 @@ from sqlalchemy.orm import DeclarativeBase
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
-    pass
+    # Server-generated columns (defaults, onupdate timestamps) come back through
+    # RETURNING on the INSERT/UPDATE itself instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
@@ -4,19 +4,24 @@ from enum import Enum as PyEnum
 from uuid import UUID, uuid4
 
 from sqlalchemy import (
+    DDL,
     Boolean,
     Date,
     DateTime,
+    FetchedValue,
     ForeignKey,
     Index,
+    Integer,
     Numeric,
     String,
     Text,
     UniqueConstraint,
+    event,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
 from src.db.base import Base
@@ -51,6 +56,17 @@ class ActivityType(str, PyEnum):
     SYSTEM = "system"
 
 
+class ImportEntity(str, PyEnum):
+    CONTACTS = "contacts"
+    DEALS = "deals"
+
+
+class ImportStatus(str, PyEnum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
 class UserModel(Base):
     __tablename__ = "users"
 
@@ -58,6 +74,9 @@ class UserModel(Base):
     email: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)
     hashed_password: Mapped[str] = mapped_column(String, nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=False)
+    membership_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -110,8 +129,33 @@ class ContactModel(Base):
     )
 
     __table_args__ = (
-        Index("idx_contact_org", "organization_id"),
+        Index(
+            "idx_contact_org_created", "organization_id", text("created_at DESC"), text("id DESC")
+        ),
         Index("idx_contact_owner", "owner_id"),
+        Index(
+            "idx_contact_org_name_trgm",
+            "organization_id",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_contact_org_email_trgm",
+            "organization_id",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_contact_org_phone_trgm",
+            "organization_id",
+            "phone",
+            postgresql_using="gin",
+            postgresql_ops={"phone": "gin_trgm_ops"},
+        ),
+        Index("idx_contact_org_email_prefix", "organization_id", text("lower(email) text_pattern_ops")),
+        Index("idx_contact_org_phone_prefix", "organization_id", text("phone text_pattern_ops")),
     )
 
 
@@ -144,9 +188,19 @@ class DealModel(Base):
         onupdate=func.now(),
         nullable=False,
     )
+    # Written as the database's now(); FetchedValue makes eager_defaults return it
+    # from the UPDATE instead of expiring it. Set it on new rows too, or the INSERT
+    # reads it back.
+    closed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, server_onupdate=FetchedValue()
+    )
+
+    # Read side only: loaded explicitly by DealRepository.get_detail, never lazily,
+    # and writes keep going through the id columns.
+    contact: Mapped["ContactModel"] = relationship(lazy="raise", viewonly=True)
 
     __table_args__ = (
-        Index("idx_deal_org", "organization_id"),
+        Index("idx_deal_org_created", "organization_id", text("created_at DESC"), text("id DESC")),
         Index("idx_deal_contact", "contact_id"),
         Index("idx_deal_owner", "owner_id"),
         Index("idx_deal_status", "status"),
@@ -154,10 +208,53 @@ class DealModel(Base):
     )
 
 
+class OrgDealStatsModel(Base):
+    """Per-organization deal counts and amounts, maintained by DealService."""
+
+    __tablename__ = "org_deal_stats"
+
+    organization_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("organizations.id"), primary_key=True
+    )
+    status: Mapped[DealStatus] = mapped_column(String, primary_key=True)
+    stage: Mapped[DealStage] = mapped_column(String, primary_key=True)
+    currency: Mapped[str] = mapped_column(String(3), primary_key=True)
+    deal_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    amount_sum: Mapped[Decimal] = mapped_column(
+        Numeric(precision=20, scale=2), nullable=False, default=0
+    )
+
+
+class OrgDealTimeseriesModel(Base):
+    """Created/won/lost deal counts per organization and day, week or month bucket.
+
+    Deals are bucketed by ``created_at`` for creations and by ``closed_at`` for
+    wins and losses, in UTC; weeks start on Monday.
+    """
+
+    __tablename__ = "org_deal_timeseries"
+
+    organization_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("organizations.id"), primary_key=True
+    )
+    granularity: Mapped[str] = mapped_column(String, primary_key=True)
+    bucket_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    created_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    won_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lost_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    won_amount: Mapped[Decimal] = mapped_column(
+        Numeric(precision=20, scale=2), nullable=False, default=0
+    )
+
+
 class TaskModel(Base):
     __tablename__ = "tasks"
 
     id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    # Copied from the deal so organization-wide task lists need no join.
+    organization_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
+    )
     deal_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), ForeignKey("deals.id"), nullable=False
     )
@@ -171,14 +268,18 @@ class TaskModel(Base):
 
     __table_args__ = (
         Index("idx_task_deal", "deal_id"),
-        Index("idx_task_due_date", "due_date"),
+        Index("idx_task_org_done_due", "organization_id", "is_done", "due_date", "id"),
     )
 
 
 class ActivityModel(Base):
     __tablename__ = "activities"
 
-    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    # Lets multi-row INSERT ... RETURNING match rows back to parameters even
+    # though created_at, the other key column, is generated by the server.
+    id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), primary_key=True, default=uuid4, insert_sentinel=True
+    )
     deal_id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), ForeignKey("deals.id"), nullable=False
     )
@@ -187,11 +288,61 @@ class ActivityModel(Base):
     )
     type: Mapped[ActivityType] = mapped_column(String, nullable=False)
     payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    # Part of the primary key: a partitioned table's unique constraints must
+    # include the partition key.
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index("idx_activity_deal_created", "deal_id", text("created_at DESC"), text("id DESC")),
+        # Monthly partitions are created ahead of time by
+        # src.commands.maintain_activity_partitions.
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+
+class ImportJobModel(Base):
+    __tablename__ = "import_jobs"
+
+    id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
+    organization_id: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
+    )
+    created_by: Mapped[UUID] = mapped_column(
+        PGUUID(as_uuid=True), ForeignKey("users.id"), nullable=False
+    )
+    entity: Mapped[ImportEntity] = mapped_column(String, nullable=False)
+    format: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[ImportStatus] = mapped_column(
+        String, nullable=False, default=ImportStatus.RUNNING
+    )
+    processed_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    imported_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # First failed rows as {"line": ..., "detail": ...}; failed_rows has the full count.
+    errors: Mapped[list] = mapped_column(JSONB, nullable=False, default=list)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     __table_args__ = (
-        Index("idx_activity_deal", "deal_id"),
-        Index("idx_activity_type", "type"),
+        Index("idx_import_job_org_created", "organization_id", text("created_at DESC")),
     )
+
+
+# Databases built with create_all get no monthly partitions; the default one
+# keeps activities writable until the maintenance command creates them.
+event.listen(
+    ActivityModel.__table__,
+    "after_create",
+    DDL("CREATE TABLE activities_default PARTITION OF activities DEFAULT"),
+)
+
+# Contact search indexes use trigram operator classes behind a btree_gin
+# organization_id; create_all needs the extensions in place first (migrations
+# enable them themselves).
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS btree_gin"))
@@ -0,0 +1,96 @@
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+from src.core.metrics import Histogram
+
+_CHECKED_OUT_AT_KEY = "checked_out_at"
+
+
+class PoolMetrics:
+    """Checkout waits and connection hold times for one connection pool."""
+
+    def __init__(self) -> None:
+        self.checkout_wait_seconds = Histogram()
+        self.checkout_hold_seconds = Histogram()
+        self.waiters = 0
+        self.checkouts = 0
+        self.timeouts = 0
+
+    def on_checkout(self, dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        self.checkouts += 1
+        connection_record.info[_CHECKED_OUT_AT_KEY] = time.perf_counter()
+
+    def on_checkin(self, dbapi_connection: Any, connection_record: Any) -> None:
+        checked_out_at = connection_record.info.pop(_CHECKED_OUT_AT_KEY, None)
+        if checked_out_at is not None:
+            self.checkout_hold_seconds.observe(time.perf_counter() - checked_out_at)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that times how long callers wait for a connection.
+
+    The pool has no event that fires before a checkout, so waits are timed
+    around ``connect()``; everything else comes from pool events.
+    """
+
+    metrics: PoolMetrics | None = None
+
+    def connect(self) -> PoolProxiedConnection:
+        if self.metrics is None:
+            return super().connect()
+
+        self.metrics.waiters += 1
+        started_at = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.waiters -= 1
+            self.metrics.checkout_wait_seconds.observe(time.perf_counter() - started_at)
+
+    def recreate(self) -> "InstrumentedAsyncAdaptedQueuePool":
+        # dispose() swaps in a fresh pool; event listeners travel with the
+        # dispatch, the metrics object has to be carried over explicitly.
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def instrument_pool(engine: AsyncEngine) -> PoolMetrics:
+    metrics = PoolMetrics()
+    pool = engine.sync_engine.pool
+    if isinstance(pool, InstrumentedAsyncAdaptedQueuePool):
+        pool.metrics = metrics
+    event.listen(engine.sync_engine, "checkout", metrics.on_checkout)
+    event.listen(engine.sync_engine, "checkin", metrics.on_checkin)
+    return metrics
+
+
+def pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+    pool = engine.sync_engine.pool
+    stats: dict[str, Any] = {}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            # QueuePool counts overflow from -pool_size until the pool is filled.
+            overflow=max(pool.overflow(), 0),
+        )
+    metrics = getattr(pool, "metrics", None)
+    if isinstance(metrics, PoolMetrics):
+        stats.update(
+            waiters=metrics.waiters,
+            checkouts=metrics.checkouts,
+            timeouts=metrics.timeouts,
+            checkout_wait_seconds=metrics.checkout_wait_seconds.snapshot(),
+            checkout_hold_seconds=metrics.checkout_hold_seconds.snapshot(),
+        )
+    return stats
@@ -1,16 +1,48 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import time
+from collections.abc import AsyncGenerator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
 
 from src.core.config import settings
+from src.core.metrics import Histogram
+from src.db.pool import InstrumentedAsyncAdaptedQueuePool, instrument_pool
+
+
+def create_engine_from_settings(url: str) -> AsyncEngine:
+    pooled_engine = create_async_engine(
+        url,
+        echo=settings.debug,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_use_lifo=settings.db_pool_use_lifo,
+        connect_args={
+            # The first is SQLAlchemy's prepared statement cache, the second asyncpg's
+            # own; both must be 0 behind a transaction-mode PgBouncer.
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "statement_cache_size": settings.db_statement_cache_size,
+        },
+    )
+    instrument_pool(pooled_engine)
+    return pooled_engine
 
-engine = create_async_engine(
-    str(settings.database_url),
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
+
+engine = create_engine_from_settings(str(settings.database_url))
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -20,8 +52,153 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Safe methods read in autocommit mode: no BEGIN/COMMIT round-trips, and the
+# connection goes back to the pool without a rollback.
+ReadOnlySessionLocal = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+    info={"read_only": True},
+)
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# From a session's first statement to its close. get_db closes when the
+# endpoint returns, so sending the response is not part of the window.
+connection_hold_seconds = {
+    "read_only": Histogram(),
+    "read_write": Histogram(),
+}
+
+
+# NULL (unhealthy) on a standby without a streaming WAL receiver: once it is
+# disconnected, receive and replay LSNs stall together and would read as no lag.
+# The receiver's status needs pg_read_all_stats; without it a running receiver
+# is taken as streaming.
+_REPLICA_LAG_QUERY = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver"
+    " WHERE COALESCE(status, 'streaming') = 'streaming') THEN NULL"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+class ReadReplicaRouter:
+    """Decides whether read-only requests may be served by the replica.
+
+    Replica health and replication lag are probed at most once per
+    ``check_interval_seconds``; while the replica is unreachable or lagging
+    beyond ``max_lag_seconds`` reads fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine | None,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+        check_timeout_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.check_timeout_seconds = check_timeout_seconds
+        self._clock = clock
+        self._sessionmaker = (
+            async_sessionmaker(
+                engine.execution_options(isolation_level="AUTOCOMMIT"),
+                class_=AsyncSession,
+                expire_on_commit=False,
+                autoflush=False,
+                info={"read_only": True},
+            )
+            if engine is not None
+            else None
+        )
+        self._healthy = False
+        self._checking = False
+        self._next_check_at = 0.0
+        self.last_lag_seconds: float | None = None
+        self.replica_reads = 0
+        self.primary_fallbacks = 0
+        self.forced_primary_reads = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.engine is not None
+
+    async def use_replica(self) -> bool:
+        if not self.enabled:
+            return False
+        if not self._checking and self._clock() >= self._next_check_at:
+            self._checking = True
+            try:
+                self._healthy = await self._check()
+            finally:
+                self._checking = False
+                self._next_check_at = self._clock() + self.check_interval_seconds
+        if self._healthy:
+            self.replica_reads += 1
+        else:
+            self.primary_fallbacks += 1
+        return self._healthy
+
+    async def _check(self) -> bool:
+        try:
+            async with asyncio.timeout(self.check_timeout_seconds):
+                async with self.engine.connect() as conn:
+                    lag = (await conn.execute(_REPLICA_LAG_QUERY)).scalar_one()
+        except (OSError, TimeoutError, SQLAlchemyError):
+            lag = None
+        self.last_lag_seconds = float(lag) if lag is not None else None
+        return self.last_lag_seconds is not None and self.last_lag_seconds <= self.max_lag_seconds
+
+    @asynccontextmanager
+    async def session(self) -> AsyncGenerator[AsyncSession, None]:
+        async with self._sessionmaker() as session:
+            yield session
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "healthy": self._healthy,
+            "last_lag_seconds": self.last_lag_seconds,
+            "replica_reads": self.replica_reads,
+            "primary_fallbacks": self.primary_fallbacks,
+            "forced_primary_reads": self.forced_primary_reads,
+        }
+
+
+read_router = ReadReplicaRouter(
+    create_engine_from_settings(str(settings.database_replica_url))
+    if settings.database_replica_url
+    else None,
+    max_lag_seconds=settings.replica_max_lag_seconds,
+    check_interval_seconds=settings.replica_health_check_interval_seconds,
+)
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Request session: AUTOCOMMIT for safe methods, one committed transaction otherwise.
+
+    Depend on it with ``scope="function"`` (FastAPI 0.121+) so the commit and the
+    connection release happen when the endpoint returns; with the default
+    request scope they run after the response has been sent, where a failed
+    commit no longer reaches the client.
+    """
+    if request.method in SAFE_METHODS:
+        async with ReadOnlySessionLocal() as session:
+            try:
+                yield session
+            finally:
+                await session.close()
+                _observe_connection_hold(session, "read_only")
+        return
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -31,3 +208,71 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+            _observe_connection_hold(session, "read_write")
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Sessions for work that outlives the request, such as background imports."""
+    return AsyncSessionLocal
+
+
+@asynccontextmanager
+async def snapshot_session(bind: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """Session holding a single REPEATABLE READ, READ ONLY transaction.
+
+    Server-side cursors only live inside a transaction, and the shared snapshot
+    keeps a long-running export consistent from its first row to its last.
+    """
+    async with AsyncSession(
+        bind, expire_on_commit=False, autoflush=False, info={"read_only": True}
+    ) as session:
+        try:
+            await session.connection(
+                execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True}
+            )
+            yield session
+        finally:
+            await session.close()
+            _observe_connection_hold(session, "read_only")
+
+
+_CONNECTION_ACQUIRED_AT_KEY = "connection_acquired_at"
+
+
+def _observe_connection_hold(session: AsyncSession, mode: str) -> None:
+    acquired_at = session.info.pop(_CONNECTION_ACQUIRED_AT_KEY, None)
+    if acquired_at is not None:
+        connection_hold_seconds[mode].observe(time.perf_counter() - acquired_at)
+
+
+@event.listens_for(Session, "after_begin")
+def _record_connection_acquired(session: Session, transaction: Any, connection: Any) -> None:
+    session.info.setdefault(_CONNECTION_ACQUIRED_AT_KEY, time.perf_counter())
+
+
+@event.listens_for(Session, "before_flush")
+def _reject_writes_in_read_only_session(session: Session, flush_context: Any, instances: Any) -> None:
+    if session.info.get("read_only") and (session.new or session.dirty or session.deleted):
+        raise RuntimeError("Attempted to write through a read-only session")
+
+
+_AFTER_COMMIT_CALLBACKS_KEY = "after_commit_callbacks"
+
+
+def run_after_commit(session: AsyncSession | Session, callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the session's current transaction commits.
+
+    Callbacks are dropped if the transaction rolls back instead.
+    """
+    session.info.setdefault(_AFTER_COMMIT_CALLBACKS_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_CALLBACKS_KEY, ()):
+        callback()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_CALLBACKS_KEY, None)
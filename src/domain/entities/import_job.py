@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass
+class ImportJob:
+    """Import job entity tracking a bulk load of contacts or deals."""
+
+    id: UUID
+    organization_id: UUID
+    created_by: UUID
+    entity: str
+    format: str
+    status: str
+    processed_rows: int
+    imported_rows: int
+    failed_rows: int
+    errors: list[dict]
+    error: str | None
+    created_at: datetime
+    finished_at: datetime | None
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Authenticated user snapshot, safe to share between requests."""
+
+    id: UUID
+    email: str
+    name: str
+    membership_version: int
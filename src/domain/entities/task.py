@@ -8,6 +8,7 @@ class Task:
     """Task entity representing a todo item for a deal."""
 
     id: UUID
+    organization_id: UUID
     deal_id: UUID
     title: str
     description: str | None
@@ -32,3 +32,23 @@ class ConflictError(DomainError):
     """Raised when a business rule conflict occurs."""
 
     pass
+
+
+class PayloadTooLargeError(DomainError):
+    """Raised when a request body exceeds its configured size limit."""
+
+    pass
+
+
+class ServiceUnavailableError(DomainError):
+    """Raised when a bounded resource is saturated and the request should be retried."""
+
+    pass
+
+
+class RateLimitError(DomainError):
+    """Raised when a caller exceeds an attempt limit."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class DataFormat(str, Enum):
+    """Serialization of a bulk import or export stream."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class ContactSearchMode(str, Enum):
+    """How a contact search term is matched against name, email and phone."""
+
+    CONTAINS = "contains"
+    SIMILAR = "similar"
+    PREFIX = "prefix"
@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class TimeseriesGranularity(str, Enum):
+    """Bucket width of a pipeline time series."""
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
@@ -1,3 +1,6 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import APIRouter, FastAPI
 
 from src.api.middleware.error_handler import add_exception_handlers
@@ -7,10 +10,27 @@ from src.api.v1.endpoints import (
     auth,
     contacts,
     deals,
+    imports,
     organizations,
     tasks,
 )
 from src.core.config import settings
+from src.core.security import password_hash_executor
+from src.db.pool import pool_stats
+from src.db.session import connection_hold_seconds, engine, read_router
+from src.services.analytics import analytics_cache
+from src.services.auth import login_email_limiter, login_ip_limiter, principal_cache
+from src.services.import_job import cancel_running_imports
+from src.services.membership import membership_cache, membership_claims_stats
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Background imports do not survive the worker; fail their jobs rather than
+    # leave them running forever.
+    await cancel_running_imports()
+
 
 app = FastAPI(
     title="CRM API",
@@ -18,6 +38,7 @@ app = FastAPI(
     docs_url=f"{settings.api_v1_prefix}/docs",
     redoc_url=f"{settings.api_v1_prefix}/redoc",
     openapi_url=f"{settings.api_v1_prefix}/openapi.json",
+    lifespan=lifespan,
 )
 
 add_exception_handlers(app)
@@ -29,7 +50,9 @@ api_router.include_router(contacts.router)
 api_router.include_router(deals.router)
 api_router.include_router(tasks.router)
 api_router.include_router(activities.router)
+api_router.include_router(activities.organization_router)
 api_router.include_router(analytics.router)
+api_router.include_router(imports.router)
 
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 
@@ -37,3 +60,26 @@ app.include_router(api_router, prefix=settings.api_v1_prefix)
 @app.get("/health")
 async def health_check() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@app.get("/metrics")
+async def metrics() -> dict[str, dict]:
+    return {
+        "analytics_cache": analytics_cache.stats(),
+        "principal_cache": principal_cache.stats(),
+        "membership_cache": membership_cache.stats(),
+        "membership_claims": membership_claims_stats,
+        "password_hashing": password_hash_executor.stats(),
+        "read_replica": read_router.stats(),
+        "db_pool": {
+            "primary": pool_stats(engine),
+            **({"replica": pool_stats(read_router.engine)} if read_router.enabled else {}),
+        },
+        "connection_hold_seconds": {
+            mode: histogram.snapshot() for mode, histogram in connection_hold_seconds.items()
+        },
+        "login_throttle": {
+            "email": login_email_limiter.stats(),
+            "ip": login_ip_limiter.stats(),
+        },
+    }
@@ -1,9 +1,12 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.models import ActivityModel
+from src.core.config import settings
+from src.db.models import ActivityModel, ActivityType, DealModel
 from src.domain.entities.activity import Activity
 from src.repositories.base import BaseRepository
 
@@ -12,10 +15,53 @@ class ActivityRepository(BaseRepository[ActivityModel, Activity]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, ActivityModel)
 
-    async def list_by_deal(self, deal_id: UUID) -> list[ActivityModel]:
+    def _scoped(self, query: Select, organization_id: UUID) -> Select:
+        return query.join(DealModel, DealModel.id == ActivityModel.deal_id).where(
+            DealModel.organization_id == organization_id
+        )
+
+    async def list_by_deal(
+        self,
+        deal_id: UUID,
+        limit: int = 50,
+        activity_type: ActivityType | None = None,
+        since: datetime | None = None,
+        after: tuple[datetime, UUID] | None = None,
+    ) -> list[ActivityModel]:
+        """A page of the deal's timeline, newest first."""
+        query = select(ActivityModel).where(ActivityModel.deal_id == deal_id)
+        if activity_type:
+            query = query.where(ActivityModel.type == activity_type)
+        if since:
+            query = query.where(ActivityModel.created_at > since)
+        if after:
+            query = query.where(tuple_(ActivityModel.created_at, ActivityModel.id) < after)
+
         result = await self.session.execute(
-            select(ActivityModel)
-            .where(ActivityModel.deal_id == deal_id)
-            .order_by(ActivityModel.created_at.desc())
+            query.order_by(ActivityModel.created_at.desc(), ActivityModel.id.desc()).limit(limit)
         )
         return list(result.scalars().all())
+
+    async def stream_by_organization(
+        self,
+        organization_id: UUID,
+        deal_id: UUID | None = None,
+        activity_type: ActivityType | None = None,
+        deal_owner_id: UUID | None = None,
+    ) -> AsyncIterator[ActivityModel]:
+        """Activities on the organization's deals, newest first, via a server-side cursor."""
+        query = self._scoped(select(ActivityModel), organization_id)
+        if deal_id:
+            query = query.where(ActivityModel.deal_id == deal_id)
+        if activity_type:
+            query = query.where(ActivityModel.type == activity_type)
+        if deal_owner_id:
+            query = query.where(DealModel.owner_id == deal_owner_id)
+
+        result = await self.session.stream_scalars(
+            query.order_by(ActivityModel.created_at.desc(), ActivityModel.id.desc()).execution_options(
+                yield_per=settings.export_batch_rows
+            )
+        )
+        async for activity in result:
+            yield activity
@@ -0,0 +1,101 @@
+import re
+from datetime import UTC, date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEFAULT_PARTITION = "activities_default"
+
+_MONTHLY_PARTITION = re.compile(r"activities_(\d{4})_(\d{2})")
+
+
+def month_start(moment: datetime | date) -> date:
+    day = moment.astimezone(UTC).date() if isinstance(moment, datetime) else moment
+    return day.replace(day=1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"activities_{month:%Y_%m}"
+
+
+def is_activity_partition(name: str) -> bool:
+    return name == DEFAULT_PARTITION or _MONTHLY_PARTITION.fullmatch(name) is not None
+
+
+def _bound(month: date) -> str:
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+class ActivityPartitionRepository:
+    """Monthly range partitions of ``activities``, one per calendar month in UTC."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list_months(self) -> list[date]:
+        result = await self.session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "WHERE pg_inherits.inhparent = 'activities'::regclass"
+            )
+        )
+        months = []
+        for name in result.scalars():
+            match = _MONTHLY_PARTITION.fullmatch(name)
+            if match:
+                months.append(date(int(match[1]), int(match[2]), 1))
+        return sorted(months)
+
+    async def create(self, month: date) -> int:
+        """Attach the partition for ``month``; returns the rows moved out of the default one.
+
+        The table is filled and attached separately because a new range may not
+        overlap rows already sitting in the default partition.
+        """
+        name = partition_name(month)
+        lower, upper = _bound(month), _bound(add_months(month, 1))
+        await self.session.execute(
+            text(f"CREATE TABLE {name} (LIKE activities INCLUDING DEFAULTS INCLUDING CONSTRAINTS)")
+        )
+        moved = await self.session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                f"WHERE created_at >= {lower} AND created_at < {upper} RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            )
+        )
+        await self.session.execute(
+            text(
+                f"ALTER TABLE activities ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ({lower}) TO ({upper})"
+            )
+        )
+        return moved.rowcount
+
+    async def detach(self, month: date, archive_schema: str | None = None) -> None:
+        """Detach the partition for ``month`` and drop it, or move it to ``archive_schema``."""
+        name = partition_name(month)
+        await self.session.execute(text(f"ALTER TABLE activities DETACH PARTITION {name}"))
+        if archive_schema:
+            # Archived rows must not keep deals and users from being deleted.
+            foreign_keys = await self.session.scalars(
+                text(
+                    "SELECT conname FROM pg_constraint "
+                    "WHERE conrelid = CAST(:name AS regclass) AND contype = 'f'"
+                ),
+                {"name": name},
+            )
+            for constraint in foreign_keys.all():
+                await self.session.execute(
+                    text(f'ALTER TABLE {name} DROP CONSTRAINT "{constraint}"')
+                )
+            await self.session.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{archive_schema}"'))
+            await self.session.execute(text(f'ALTER TABLE {name} SET SCHEMA "{archive_schema}"'))
+        else:
+            await self.session.execute(text(f"DROP TABLE {name}"))
@@ -1,15 +1,29 @@
-from typing import Generic, TypeVar
+from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import ClauseElement, Executable, Select, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
 
+from src.core.pagination import TotalMode
 from src.db.base import Base
 
 ModelType = TypeVar("ModelType", bound=Base)
 EntityType = TypeVar("EntityType")
 
 
+class Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
 class BaseRepository(Generic[ModelType, EntityType]):
     def __init__(self, session: AsyncSession, model: type[ModelType]):
         self.session = session
@@ -19,17 +33,92 @@ class BaseRepository(Generic[ModelType, EntityType]):
         result = await self.session.execute(select(self.model).where(self.model.id == id))
         return result.scalar_one_or_none()
 
+    async def get_for_organization(
+        self, id: UUID, organization_id: UUID, lock: bool = False
+    ) -> ModelType | None:
+        """The row with ``id`` if it belongs to ``organization_id``, in one query.
+
+        ``lock`` reads it ``FOR UPDATE`` for writers that derive deltas from the
+        current values, refreshing an instance the session already holds.
+        """
+        query = self._scoped(select(self.model), organization_id).where(self.model.id == id)
+        if lock:
+            query = query.with_for_update(of=self.model).execution_options(
+                populate_existing=True
+            )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    def _scoped(self, query: Select, organization_id: UUID) -> Select:
+        """Restrict ``query`` to rows of ``organization_id``.
+
+        Models without their own ``organization_id`` override this with a join
+        to the parent that has one.
+        """
+        return query.where(self.model.organization_id == organization_id)
+
     async def create(self, model: ModelType) -> ModelType:
         self.session.add(model)
         await self.session.flush()
-        await self.session.refresh(model)
         return model
 
+    async def create_many(self, rows: list[dict[str, Any]]) -> list[ModelType]:
+        """Insert ``rows`` with multi-row ``INSERT ... RETURNING`` statements.
+
+        Returned models come back in the order of ``rows``.
+        """
+        if not rows:
+            return []
+        result = await self.session.scalars(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True), rows
+        )
+        return list(result.all())
+
     async def update(self, model: ModelType) -> ModelType:
         await self.session.flush()
-        await self.session.refresh(model)
         return model
 
     async def delete(self, model: ModelType) -> None:
         await self.session.delete(model)
         await self.session.flush()
+
+    async def _fetch_page(
+        self, query: Select, page_query: Select, total_mode: TotalMode
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        """Fetch a page of ``page_query`` and the size of ``query`` per ``total_mode``.
+
+        The page is read on the session's connection, so rows come back as plain
+        column dicts without ORM instances or identity-map bookkeeping (nor an
+        autoflush); list responses only serialize the column values.
+
+        Exact totals ride along with the page as an uncorrelated scalar subquery,
+        so the database evaluates the count once and returns both in one round-trip.
+        """
+        connection = await self.session.connection()
+        count_query = select(func.count()).select_from(query.subquery())
+
+        if total_mode == TotalMode.EXACT:
+            result = await connection.execute(
+                page_query.add_columns(count_query.scalar_subquery().label("_total"))
+            )
+            # zip() stops before the trailing _total column.
+            keys = list(result.keys())[:-1]
+            rows = result.all()
+            if rows:
+                return [dict(zip(keys, row)) for row in rows], rows[0]._total
+            # Past the last row there is nothing to carry the count.
+            total = (await connection.execute(count_query)).scalar_one()
+            return [], total
+
+        result = await connection.execute(page_query)
+        keys = list(result.keys())
+        items = [dict(zip(keys, row)) for row in result]
+
+        if total_mode == TotalMode.ESTIMATED:
+            return items, await self._estimate_count(query)
+        return items, None
+
+    async def _estimate_count(self, query: Select) -> int:
+        result = await self.session.execute(Explain(query))
+        plan = result.scalar_one()
+        return int(plan[0]["Plan"]["Plan Rows"])
@@ -1,10 +1,16 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, literal, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
+from src.core.pagination import TotalMode
 from src.db.models import ContactModel, DealModel, DealStatus
 from src.domain.entities.contact import Contact
+from src.domain.value_objects.search_mode import ContactSearchMode
 from src.repositories.base import BaseRepository
 
 
@@ -18,10 +24,68 @@ class ContactRepository(BaseRepository[ContactModel, Contact]):
         limit: int = 50,
         offset: int = 0,
         search: str | None = None,
-    ) -> tuple[list[ContactModel], int]:
+        after: tuple[datetime, UUID] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        search_mode: ContactSearchMode = ContactSearchMode.CONTAINS,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        query, order_by = self._searched(organization_id, search, search_mode)
+
+        page_query = query
+        if after:
+            page_query = page_query.where(tuple_(ContactModel.created_at, ContactModel.id) < after)
+
+        page_query = page_query.order_by(*order_by).limit(limit).offset(offset)
+        return await self._fetch_page(query, page_query, total_mode)
+
+    async def stream_by_organization(
+        self,
+        organization_id: UUID,
+        search: str | None = None,
+        search_mode: ContactSearchMode = ContactSearchMode.CONTAINS,
+    ) -> AsyncIterator[ContactModel]:
+        """All matching contacts in listing order, read through a server-side cursor."""
+        query, order_by = self._searched(organization_id, search, search_mode)
+        result = await self.session.stream_scalars(
+            query.order_by(*order_by).execution_options(yield_per=settings.export_batch_rows)
+        )
+        async for contact in result:
+            yield contact
+
+    @staticmethod
+    def _searched(
+        organization_id: UUID, search: str | None, search_mode: ContactSearchMode
+    ) -> tuple[Select, tuple]:
         query = select(ContactModel).where(ContactModel.organization_id == organization_id)
+        order_by = (ContactModel.created_at.desc(), ContactModel.id.desc())
 
-        if search:
+        if search and search_mode == ContactSearchMode.SIMILAR:
+            # `<%` (word similarity above pg_trgm.word_similarity_threshold) is
+            # answered by the (organization_id, ... gin_trgm_ops) GIN indexes; best
+            # matches come first.
+            term = literal(search)
+            query = query.where(
+                or_(
+                    term.op("<%")(ContactModel.name),
+                    term.op("<%")(ContactModel.email),
+                    term.op("<%")(ContactModel.phone),
+                )
+            )
+            rank = func.greatest(
+                func.word_similarity(term, ContactModel.name),
+                func.word_similarity(term, ContactModel.email),
+                func.word_similarity(term, ContactModel.phone),
+            )
+            order_by = (rank.desc(), ContactModel.id.desc())
+        elif search and search_mode == ContactSearchMode.PREFIX:
+            # Anchored patterns use the (organization_id, ... text_pattern_ops) btrees.
+            pattern = _escape_like(search) + "%"
+            query = query.where(
+                or_(
+                    func.lower(ContactModel.email).like(pattern.lower(), escape="\\"),
+                    ContactModel.phone.like(pattern, escape="\\"),
+                )
+            )
+        elif search:
             search_pattern = f"%{search}%"
             query = query.where(
                 (ContactModel.name.ilike(search_pattern))
@@ -29,15 +93,7 @@ class ContactRepository(BaseRepository[ContactModel, Contact]):
                 | (ContactModel.phone.ilike(search_pattern))
             )
 
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar_one()
-
-        query = query.limit(limit).offset(offset)
-        result = await self.session.execute(query)
-        contacts = list(result.scalars().all())
-
-        return contacts, total
+        return query, order_by
 
     async def has_active_deals(self, contact_id: UUID) -> bool:
         result = await self.session.execute(
@@ -50,3 +106,7 @@ class ContactRepository(BaseRepository[ContactModel, Contact]):
         )
         count = result.scalar_one()
         return count > 0
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
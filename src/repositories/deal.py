@@ -1,10 +1,16 @@
-from decimal import Decimal
+from collections.abc import AsyncIterator, Callable
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Lateral, Select, case, func, null, select, text, true, tuple_, update
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
-from src.db.models import DealModel, DealStage, DealStatus
+from src.core.config import settings
+from src.core.pagination import TotalMode
+from src.db.models import ActivityModel, DealModel, DealStage, DealStatus, TaskModel
 from src.domain.entities.deal import Deal
 from src.repositories.base import BaseRepository
 
@@ -21,84 +27,144 @@ class DealRepository(BaseRepository[DealModel, Deal]):
         status: DealStatus | None = None,
         stage: DealStage | None = None,
         owner_id: UUID | None = None,
-    ) -> tuple[list[DealModel], int]:
-        query = select(DealModel).where(DealModel.organization_id == organization_id)
-
-        if status:
-            query = query.where(DealModel.status == status)
-        if stage:
-            query = query.where(DealModel.stage == stage)
-        if owner_id:
-            query = query.where(DealModel.owner_id == owner_id)
-
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar_one()
-
-        query = query.order_by(DealModel.created_at.desc()).limit(limit).offset(offset)
-        result = await self.session.execute(query)
-        deals = list(result.scalars().all())
-
-        return deals, total
+        after: tuple[datetime, UUID] | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[list[dict[str, Any]], int | None]:
+        query = self._filtered(organization_id, status, stage, owner_id)
+
+        page_query = query
+        if after:
+            page_query = page_query.where(tuple_(DealModel.created_at, DealModel.id) < after)
+
+        page_query = (
+            page_query.order_by(DealModel.created_at.desc(), DealModel.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return await self._fetch_page(query, page_query, total_mode)
 
-    async def get_summary(self, organization_id: UUID) -> dict[str, int | Decimal]:
-        result = await self.session.execute(
-            select(
-                DealModel.status,
-                func.count(DealModel.id).label("count"),
-                func.coalesce(func.sum(DealModel.amount), 0).label("total_amount"),
-            )
-            .where(DealModel.organization_id == organization_id)
-            .group_by(DealModel.status)
+    async def stream_by_organization(
+        self,
+        organization_id: UUID,
+        status: DealStatus | None = None,
+        stage: DealStage | None = None,
+        owner_id: UUID | None = None,
+    ) -> AsyncIterator[DealModel]:
+        """All matching deals, newest first, read through a server-side cursor."""
+        query = (
+            self._filtered(organization_id, status, stage, owner_id)
+            .order_by(DealModel.created_at.desc(), DealModel.id.desc())
+            .execution_options(yield_per=settings.export_batch_rows)
         )
+        result = await self.session.stream_scalars(query)
+        async for deal in result:
+            yield deal
 
-        summary = {
-            "total_count": 0,
-            "new_count": 0,
-            "in_progress_count": 0,
-            "won_count": 0,
-            "lost_count": 0,
-            "total_amount": Decimal("0"),
-            "won_amount": Decimal("0"),
+    async def get_detail(
+        self,
+        deal_id: UUID,
+        organization_id: UUID,
+        include: frozenset[str],
+        limit: int,
+    ) -> tuple[DealModel, dict[str, Any]] | None:
+        """The organization's deal and its ``include``-d relations, read in one statement.
+
+        Tasks (by due date) and activities (newest first) are capped at ``limit``
+        each and come back as lists of row dicts. Every list is aggregated in its
+        own LATERAL subquery, so the statement returns a single row.
+        """
+        query = self._scoped(select(DealModel), organization_id).where(DealModel.id == deal_id)
+        if "contact" in include:
+            query = query.options(joinedload(DealModel.contact))
+        lists = {
+            name: _related_rows(model, order_by, limit, name)
+            for name, model, order_by in (
+                ("tasks", TaskModel, lambda c: (c.due_date, c.id)),
+                ("activities", ActivityModel, lambda c: (c.created_at.desc(), c.id.desc())),
+            )
+            if name in include
         }
-
-        for row in result:
-            status = row.status
-            count = row.count
-            amount = row.total_amount
-
-            summary["total_count"] += count
-            summary["total_amount"] += amount
-
-            if status == DealStatus.NEW:
-                summary["new_count"] = count
-            elif status == DealStatus.IN_PROGRESS:
-                summary["in_progress_count"] = count
-            elif status == DealStatus.WON:
-                summary["won_count"] = count
-                summary["won_amount"] = amount
-            elif status == DealStatus.LOST:
-                summary["lost_count"] = count
-
-        if summary["won_count"] > 0:
-            summary["average_won_amount"] = summary["won_amount"] / summary["won_count"]
-        else:
-            summary["average_won_amount"] = Decimal("0")
-
-        return summary
-
-    async def get_funnel(self, organization_id: UUID) -> list[dict[str, int | str]]:
+        for lateral in lists.values():
+            query = query.outerjoin_from(DealModel, lateral, true()).add_columns(lateral.c.rows)
+
+        row = (await self.session.execute(query)).one_or_none()
+        if row is None:
+            return None
+        deal, *rows = row
+        related: dict[str, Any] = dict(zip(lists, rows, strict=True))
+        if "contact" in include:
+            related["contact"] = deal.contact
+        return deal, related
+
+    async def lock_many(self, organization_id: UUID, ids: list[UUID]) -> list[DealModel]:
+        """The organization's deals among ``ids``, locked for update in id order."""
         result = await self.session.execute(
-            select(DealModel.stage, func.count(DealModel.id).label("count"))
-            .where(
-                DealModel.organization_id == organization_id,
-                DealModel.status.in_([DealStatus.NEW, DealStatus.IN_PROGRESS]),
+            select(DealModel)
+            .where(DealModel.organization_id == organization_id, DealModel.id.in_(ids))
+            .order_by(DealModel.id)
+            .with_for_update()
+        )
+        return list(result.scalars().all())
+
+    async def update_many(
+        self,
+        ids: list[UUID],
+        status: DealStatus | None = None,
+        stage: DealStage | None = None,
+        owner_id: UUID | None = None,
+    ) -> list[DealModel]:
+        """Apply the same changes to all ``ids`` in one ``UPDATE ... RETURNING``."""
+        values: dict = {}
+        if status:
+            closed_at = func.now() if status in (DealStatus.WON, DealStatus.LOST) else null()
+            values["status"] = status
+            # Only deals actually moving to the status get a new close time.
+            values["closed_at"] = case(
+                (DealModel.status != status, closed_at), else_=DealModel.closed_at
             )
-            .group_by(DealModel.stage)
+        if stage:
+            values["stage"] = stage
+        if owner_id:
+            values["owner_id"] = owner_id
+
+        result = await self.session.scalars(
+            update(DealModel).where(DealModel.id.in_(ids)).values(values).returning(DealModel),
+            execution_options={"populate_existing": True},
         )
+        return list(result.all())
 
-        funnel = []
-        for row in result:
-            funnel.append({"stage": row.stage, "count": row.count})
+    @staticmethod
+    def _filtered(
+        organization_id: UUID,
+        status: DealStatus | None,
+        stage: DealStage | None,
+        owner_id: UUID | None,
+    ) -> Select:
+        query = select(DealModel).where(DealModel.organization_id == organization_id)
 
-        return funnel
+        if status:
+            query = query.where(DealModel.status == status)
+        if stage:
+            query = query.where(DealModel.stage == stage)
+        if owner_id:
+            query = query.where(DealModel.owner_id == owner_id)
+        return query
+
+
+def _related_rows(
+    model: type[TaskModel] | type[ActivityModel],
+    order_by: Callable[[Any], tuple],
+    limit: int,
+    name: str,
+) -> Lateral:
+    """LATERAL subquery with the deal's first ``limit`` ``model`` rows as one JSON array."""
+    items = (
+        select(model.__table__)
+        .where(model.deal_id == DealModel.id)
+        .correlate(DealModel)
+        .order_by(*order_by(model.__table__.c))
+        .limit(limit)
+        .subquery("items")
+    )
+    rows = func.json_agg(aggregate_order_by(items.table_valued(), *order_by(items.c)), type_=JSON)
+    return select(func.coalesce(rows, text("'[]'::json")).label("rows")).lateral(f"deal_{name}")
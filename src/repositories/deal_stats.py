@@ -0,0 +1,142 @@
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import DealModel, DealStage, DealStatus, OrgDealStatsModel
+
+StatsKey = tuple[DealStatus, DealStage, str]
+
+
+class DealStatsRepository:
+    """Rollup of deal counts and amounts per (organization, status, stage, currency)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def apply_deltas(
+        self, organization_id: UUID, deltas: dict[StatsKey, tuple[int, Decimal]]
+    ) -> None:
+        rows = [
+            {
+                "organization_id": organization_id,
+                "status": status,
+                "stage": stage,
+                "currency": currency,
+                "deal_count": count,
+                "amount_sum": amount,
+            }
+            # Sorted so concurrent writers lock the rollup rows in the same order.
+            for (status, stage, currency), (count, amount) in sorted(deltas.items())
+            if count or amount
+        ]
+        if not rows:
+            return
+
+        statement = pg_insert(OrgDealStatsModel).values(rows)
+        await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    OrgDealStatsModel.organization_id,
+                    OrgDealStatsModel.status,
+                    OrgDealStatsModel.stage,
+                    OrgDealStatsModel.currency,
+                ],
+                set_={
+                    "deal_count": OrgDealStatsModel.deal_count + statement.excluded.deal_count,
+                    "amount_sum": OrgDealStatsModel.amount_sum + statement.excluded.amount_sum,
+                },
+            )
+        )
+
+    async def rebuild(self, organization_id: UUID | None = None) -> int:
+        # Blocks deal writers (their rollup upserts) until the rebuilt rows commit.
+        await self.session.execute(text("LOCK TABLE org_deal_stats IN EXCLUSIVE MODE"))
+
+        delete_query = delete(OrgDealStatsModel)
+        aggregate = select(
+            DealModel.organization_id,
+            DealModel.status,
+            DealModel.stage,
+            DealModel.currency,
+            func.count(DealModel.id),
+            func.sum(DealModel.amount),
+        ).group_by(DealModel.organization_id, DealModel.status, DealModel.stage, DealModel.currency)
+        if organization_id:
+            delete_query = delete_query.where(OrgDealStatsModel.organization_id == organization_id)
+            aggregate = aggregate.where(DealModel.organization_id == organization_id)
+
+        await self.session.execute(delete_query)
+        result = await self.session.execute(
+            insert(OrgDealStatsModel).from_select(
+                ["organization_id", "status", "stage", "currency", "deal_count", "amount_sum"],
+                aggregate,
+            )
+        )
+        return result.rowcount
+
+    async def get_summary(self, organization_id: UUID) -> dict[str, int | Decimal]:
+        result = await self.session.execute(
+            select(
+                OrgDealStatsModel.status,
+                func.sum(OrgDealStatsModel.deal_count).label("count"),
+                func.sum(OrgDealStatsModel.amount_sum).label("total_amount"),
+            )
+            .where(OrgDealStatsModel.organization_id == organization_id)
+            .group_by(OrgDealStatsModel.status)
+        )
+
+        summary = {
+            "total_count": 0,
+            "new_count": 0,
+            "in_progress_count": 0,
+            "won_count": 0,
+            "lost_count": 0,
+            "total_amount": Decimal("0"),
+            "won_amount": Decimal("0"),
+        }
+
+        for row in result:
+            status = row.status
+            count = int(row.count)
+            amount = row.total_amount
+
+            summary["total_count"] += count
+            summary["total_amount"] += amount
+
+            if status == DealStatus.NEW:
+                summary["new_count"] = count
+            elif status == DealStatus.IN_PROGRESS:
+                summary["in_progress_count"] = count
+            elif status == DealStatus.WON:
+                summary["won_count"] = count
+                summary["won_amount"] = amount
+            elif status == DealStatus.LOST:
+                summary["lost_count"] = count
+
+        if summary["won_count"] > 0:
+            summary["average_won_amount"] = summary["won_amount"] / summary["won_count"]
+        else:
+            summary["average_won_amount"] = Decimal("0")
+
+        return summary
+
+    async def get_funnel(self, organization_id: UUID) -> list[dict[str, int | str]]:
+        count = func.sum(OrgDealStatsModel.deal_count)
+        result = await self.session.execute(
+            select(OrgDealStatsModel.stage, count.label("count"))
+            .where(
+                OrgDealStatsModel.organization_id == organization_id,
+                OrgDealStatsModel.status.in_([DealStatus.NEW, DealStatus.IN_PROGRESS]),
+            )
+            .group_by(OrgDealStatsModel.stage)
+            .having(count > 0)
+        )
+
+        funnel = []
+        for row in result:
+            funnel.append({"stage": row.stage, "count": int(row.count)})
+
+        return funnel
@@ -0,0 +1,204 @@
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import Date, Select, case, delete, func, insert, literal, select, text, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import DealModel, DealStatus, OrgDealTimeseriesModel
+from src.domain.value_objects.timeseries_granularity import TimeseriesGranularity
+
+BucketKey = tuple[TimeseriesGranularity, date]
+# (created_count, won_count, lost_count, won_amount)
+BucketCounts = tuple[int, int, int, Decimal]
+
+_CLOSED_STATUSES = (DealStatus.WON, DealStatus.LOST)
+
+
+def bucket_start(granularity: TimeseriesGranularity, moment: datetime | date) -> date:
+    day = moment.astimezone(UTC).date() if isinstance(moment, datetime) else moment
+    if granularity == TimeseriesGranularity.WEEK:
+        return day - timedelta(days=day.weekday())
+    if granularity == TimeseriesGranularity.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket_start(granularity: TimeseriesGranularity, start: date) -> date:
+    if granularity == TimeseriesGranularity.WEEK:
+        return start + timedelta(days=7)
+    if granularity == TimeseriesGranularity.MONTH:
+        return (start + timedelta(days=32)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def deal_contribution(deal: DealModel) -> dict[BucketKey, BucketCounts]:
+    """Buckets a deal counts towards in its current state."""
+    contribution: dict[BucketKey, BucketCounts] = {}
+    for granularity in TimeseriesGranularity:
+        created_key = (granularity, bucket_start(granularity, deal.created_at))
+        _add(contribution, created_key, (1, 0, 0, Decimal(0)))
+        if deal.closed_at and deal.status in _CLOSED_STATUSES:
+            won = deal.status == DealStatus.WON
+            _add(
+                contribution,
+                (granularity, bucket_start(granularity, deal.closed_at)),
+                (0, int(won), int(not won), deal.amount if won else Decimal(0)),
+            )
+    return contribution
+
+
+def combined_contribution(deals: Iterable[DealModel]) -> dict[BucketKey, BucketCounts]:
+    combined: dict[BucketKey, BucketCounts] = {}
+    for deal in deals:
+        for key, counts in deal_contribution(deal).items():
+            _add(combined, key, counts)
+    return combined
+
+
+def contribution_delta(
+    old: dict[BucketKey, BucketCounts], new: dict[BucketKey, BucketCounts]
+) -> dict[BucketKey, BucketCounts]:
+    delta = dict(new)
+    for key, counts in old.items():
+        _add(delta, key, tuple(-value for value in counts))
+    return {key: counts for key, counts in delta.items() if any(counts)}
+
+
+def _add(target: dict[BucketKey, BucketCounts], key: BucketKey, counts: BucketCounts) -> None:
+    current = target.get(key)
+    if current is not None:
+        counts = tuple(a + b for a, b in zip(current, counts, strict=True))
+    target[key] = counts
+
+
+class DealTimeseriesRepository:
+    """Per-organization deal activity rolled up into day, week and month buckets."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def apply_deltas(
+        self, organization_id: UUID, deltas: dict[BucketKey, BucketCounts]
+    ) -> None:
+        rows = [
+            {
+                "organization_id": organization_id,
+                "granularity": granularity,
+                "bucket_start": start,
+                "created_count": created,
+                "won_count": won,
+                "lost_count": lost,
+                "won_amount": won_amount,
+            }
+            # Sorted so concurrent writers lock the bucket rows in the same order.
+            for (granularity, start), (created, won, lost, won_amount) in sorted(deltas.items())
+        ]
+        if not rows:
+            return
+
+        statement = pg_insert(OrgDealTimeseriesModel).values(rows)
+        excluded = statement.excluded
+        await self.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[
+                    OrgDealTimeseriesModel.organization_id,
+                    OrgDealTimeseriesModel.granularity,
+                    OrgDealTimeseriesModel.bucket_start,
+                ],
+                set_={
+                    "created_count": OrgDealTimeseriesModel.created_count + excluded.created_count,
+                    "won_count": OrgDealTimeseriesModel.won_count + excluded.won_count,
+                    "lost_count": OrgDealTimeseriesModel.lost_count + excluded.lost_count,
+                    "won_amount": OrgDealTimeseriesModel.won_amount + excluded.won_amount,
+                },
+            )
+        )
+
+    async def get_series(
+        self,
+        organization_id: UUID,
+        granularity: TimeseriesGranularity,
+        date_from: date,
+        date_to: date,
+    ) -> list[OrgDealTimeseriesModel]:
+        result = await self.session.execute(
+            select(OrgDealTimeseriesModel)
+            .where(
+                OrgDealTimeseriesModel.organization_id == organization_id,
+                OrgDealTimeseriesModel.granularity == granularity,
+                OrgDealTimeseriesModel.bucket_start >= bucket_start(granularity, date_from),
+                OrgDealTimeseriesModel.bucket_start <= date_to,
+            )
+            .order_by(OrgDealTimeseriesModel.bucket_start)
+        )
+        return list(result.scalars().all())
+
+    async def rebuild(self, organization_id: UUID | None = None) -> int:
+        # Blocks deal writers (their bucket upserts) until the rebuilt rows commit.
+        await self.session.execute(text("LOCK TABLE org_deal_timeseries IN EXCLUSIVE MODE"))
+
+        delete_query = delete(OrgDealTimeseriesModel)
+        if organization_id:
+            delete_query = delete_query.where(
+                OrgDealTimeseriesModel.organization_id == organization_id
+            )
+        await self.session.execute(delete_query)
+
+        rows = 0
+        for granularity in TimeseriesGranularity:
+            result = await self.session.execute(
+                insert(OrgDealTimeseriesModel).from_select(
+                    [
+                        "organization_id",
+                        "granularity",
+                        "bucket_start",
+                        "created_count",
+                        "won_count",
+                        "lost_count",
+                        "won_amount",
+                    ],
+                    self._aggregate(granularity, organization_id),
+                )
+            )
+            rows += result.rowcount
+        return rows
+
+    @staticmethod
+    def _aggregate(granularity: TimeseriesGranularity, organization_id: UUID | None) -> Select:
+        def bucket(column):
+            return func.date_trunc(granularity.value, func.timezone("UTC", column)).cast(Date)
+
+        zero = literal(0)
+        created = select(
+            DealModel.organization_id,
+            bucket(DealModel.created_at).label("bucket_start"),
+            literal(1).label("created_count"),
+            zero.label("won_count"),
+            zero.label("lost_count"),
+            literal(Decimal(0)).label("won_amount"),
+        )
+        closed = select(
+            DealModel.organization_id,
+            bucket(DealModel.closed_at).label("bucket_start"),
+            zero.label("created_count"),
+            case((DealModel.status == DealStatus.WON, 1), else_=0).label("won_count"),
+            case((DealModel.status == DealStatus.LOST, 1), else_=0).label("lost_count"),
+            case((DealModel.status == DealStatus.WON, DealModel.amount), else_=0).label("won_amount"),
+        ).where(DealModel.closed_at.is_not(None), DealModel.status.in_(_CLOSED_STATUSES))
+        if organization_id:
+            created = created.where(DealModel.organization_id == organization_id)
+            closed = closed.where(DealModel.organization_id == organization_id)
+
+        events = union_all(created, closed).subquery()
+        return select(
+            events.c.organization_id,
+            literal(granularity.value),
+            events.c.bucket_start,
+            func.sum(events.c.created_count),
+            func.sum(events.c.won_count),
+            func.sum(events.c.lost_count),
+            func.sum(events.c.won_amount),
+        ).group_by(events.c.organization_id, events.c.bucket_start)
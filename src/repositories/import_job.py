@@ -0,0 +1,10 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import ImportJobModel
+from src.domain.entities.import_job import ImportJob
+from src.repositories.base import BaseRepository
+
+
+class ImportJobRepository(BaseRepository[ImportJobModel, ImportJob]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, ImportJobModel)
@@ -0,0 +1,187 @@
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Numeric,
+    Row,
+    String,
+    Table,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.dialects.postgresql import distinct_on
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import ContactModel, DealModel, DealStatus
+
+# Session-local staging tables, created per chunk and dropped when it commits.
+# They are kept off Base.metadata so create_all and migrations never see them.
+_staging_metadata = MetaData()
+
+contact_staging = Table(
+    "contact_import_staging",
+    _staging_metadata,
+    Column("line", Integer, nullable=False),
+    Column("id", PGUUID(as_uuid=True), nullable=False),
+    Column("name", String, nullable=False),
+    Column("email", String),
+    Column("phone", String),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+deal_staging = Table(
+    "deal_import_staging",
+    _staging_metadata,
+    Column("line", Integer, nullable=False),
+    Column("id", PGUUID(as_uuid=True), nullable=False),
+    Column("contact_ref", PGUUID(as_uuid=True)),
+    Column("contact_email", String),
+    Column("contact_id", PGUUID(as_uuid=True)),
+    Column("title", String, nullable=False),
+    Column("amount", Numeric(precision=15, scale=2), nullable=False),
+    Column("currency", String(3), nullable=False),
+    Column("status", String, nullable=False),
+    Column("stage", String, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+CONTACT_STAGING_COLUMNS = ("line", "id", "name", "email", "phone")
+DEAL_STAGING_COLUMNS = (
+    "line",
+    "id",
+    "contact_ref",
+    "contact_email",
+    "title",
+    "amount",
+    "currency",
+    "status",
+    "stage",
+)
+
+
+class ImportStagingRepository:
+    """COPY validated rows into a staging table and merge them into the tenant's data."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def stage(self, table: Table, columns: Sequence[str], rows: list[tuple]) -> None:
+        connection = await self.session.connection()
+        await connection.run_sync(table.create)
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name, records=rows, columns=list(columns)
+        )
+        # Temporary tables are never auto-analyzed; without statistics the merge
+        # joins are planned for a near-empty table.
+        await self.session.execute(text(f"ANALYZE {table.name}"))
+
+    async def merge_contacts(self, organization_id: UUID, owner_id: UUID) -> int:
+        # Same rules as POST /contacts: emails are not unique within an organization.
+        staged = contact_staging
+        result = await self.session.execute(
+            insert(ContactModel).from_select(
+                ["id", "organization_id", "owner_id", "name", "email", "phone"],
+                select(
+                    staged.c.id,
+                    literal(organization_id),
+                    literal(owner_id),
+                    staged.c.name,
+                    staged.c.email,
+                    staged.c.phone,
+                ).order_by(staged.c.line),
+            )
+        )
+        return result.rowcount
+
+    async def merge_deals(
+        self, organization_id: UUID, owner_id: UUID
+    ) -> tuple[list[Row[Any]], list[tuple[int, str]]]:
+        staged = deal_staging
+        await self.session.execute(
+            update(staged)
+            .where(
+                ContactModel.id == staged.c.contact_ref,
+                ContactModel.organization_id == organization_id,
+            )
+            .values(contact_id=ContactModel.id)
+        )
+        # Rows referencing a contact by email take the oldest contact with it.
+        email_key = func.lower(ContactModel.email)
+        by_email = (
+            select(email_key.label("email_key"), ContactModel.id)
+            .where(
+                ContactModel.organization_id == organization_id,
+                email_key.in_(
+                    select(func.lower(staged.c.contact_email)).where(staged.c.contact_ref.is_(None))
+                ),
+            )
+            .ext(distinct_on(email_key))
+            .order_by(email_key, ContactModel.created_at, ContactModel.id)
+            .subquery()
+        )
+        await self.session.execute(
+            update(staged)
+            .where(
+                staged.c.contact_ref.is_(None),
+                func.lower(staged.c.contact_email) == by_email.c.email_key,
+            )
+            .values(contact_id=by_email.c.id)
+        )
+        unresolved = await self.session.execute(
+            delete(staged).where(staged.c.contact_id.is_(None)).returning(staged.c.line)
+        )
+        rejected = [(line, "Contact not found") for line in unresolved.scalars()]
+
+        closed = staged.c.status.in_([DealStatus.WON, DealStatus.LOST])
+        result = await self.session.execute(
+            insert(DealModel)
+            .from_select(
+                [
+                    "id",
+                    "organization_id",
+                    "contact_id",
+                    "owner_id",
+                    "title",
+                    "amount",
+                    "currency",
+                    "status",
+                    "stage",
+                    "closed_at",
+                ],
+                select(
+                    staged.c.id,
+                    literal(organization_id),
+                    staged.c.contact_id,
+                    literal(owner_id),
+                    staged.c.title,
+                    staged.c.amount,
+                    staged.c.currency,
+                    staged.c.status,
+                    staged.c.stage,
+                    case((closed, func.now())),
+                ).order_by(staged.c.line),
+            )
+            .returning(
+                DealModel.status,
+                DealModel.stage,
+                DealModel.currency,
+                DealModel.amount,
+                DealModel.created_at,
+                DealModel.closed_at,
+            )
+        )
+        return list(result.all()), rejected
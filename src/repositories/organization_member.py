@@ -19,3 +19,14 @@ class OrganizationMemberRepository(BaseRepository[OrganizationMemberModel, Organ
             .where(OrganizationMemberModel.user_id == user_id)
         )
         return list(result.all())
+
+    async def get_membership(
+        self, user_id: UUID, organization_id: UUID
+    ) -> OrganizationMemberModel | None:
+        result = await self.session.execute(
+            select(OrganizationMemberModel).where(
+                OrganizationMemberModel.organization_id == organization_id,
+                OrganizationMemberModel.user_id == user_id,
+            )
+        )
+        return result.scalar_one_or_none()
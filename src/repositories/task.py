@@ -1,9 +1,10 @@
+from datetime import date
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.models import TaskModel
+from src.db.models import DealModel, TaskModel
 from src.domain.entities.task import Task
 from src.repositories.base import BaseRepository
 
@@ -12,14 +13,57 @@ class TaskRepository(BaseRepository[TaskModel, Task]):
     def __init__(self, session: AsyncSession):
         super().__init__(session, TaskModel)
 
+    async def get_with_deal(
+        self, task_id: UUID, organization_id: UUID
+    ) -> tuple[TaskModel, DealModel] | None:
+        """The organization's task and its deal, whose owner governs access to it."""
+        result = await self.session.execute(
+            select(TaskModel, DealModel)
+            .join(DealModel, DealModel.id == TaskModel.deal_id)
+            .where(TaskModel.id == task_id, TaskModel.organization_id == organization_id)
+        )
+        row = result.one_or_none()
+        return (row[0], row[1]) if row else None
+
     async def list_by_deal(
-        self, deal_id: UUID, only_open: bool = False
+        self, deal_id: UUID, is_done: bool | None = None
     ) -> list[TaskModel]:
         query = select(TaskModel).where(TaskModel.deal_id == deal_id)
 
-        if only_open:
-            query = query.where(~TaskModel.is_done)
+        if is_done is not None:
+            query = query.where(TaskModel.is_done == is_done)
 
         query = query.order_by(TaskModel.due_date)
         result = await self.session.execute(query)
         return list(result.scalars().all())
+
+    async def list_by_organization(
+        self,
+        organization_id: UUID,
+        limit: int = 50,
+        is_done: bool | None = None,
+        owner_id: UUID | None = None,
+        due_from: date | None = None,
+        due_to: date | None = None,
+        after: tuple[date, UUID] | None = None,
+    ) -> list[TaskModel]:
+        """A page of the organization's tasks ordered by due date."""
+        query = select(TaskModel).where(TaskModel.organization_id == organization_id)
+
+        if is_done is not None:
+            query = query.where(TaskModel.is_done == is_done)
+        if owner_id:
+            query = query.join(DealModel, DealModel.id == TaskModel.deal_id).where(
+                DealModel.owner_id == owner_id
+            )
+        if due_from:
+            query = query.where(TaskModel.due_date >= due_from)
+        if due_to:
+            query = query.where(TaskModel.due_date <= due_to)
+        if after:
+            query = query.where(tuple_(TaskModel.due_date, TaskModel.id) > after)
+
+        result = await self.session.execute(
+            query.order_by(TaskModel.due_date, TaskModel.id).limit(limit)
+        )
+        return list(result.scalars().all())
@@ -3,6 +3,7 @@ from src.services.analytics import AnalyticsService
 from src.services.auth import AuthService
 from src.services.contact import ContactService
 from src.services.deal import DealService
+from src.services.membership import MembershipService
 from src.services.permission import PermissionService
 from src.services.task import TaskService
 
@@ -14,4 +15,5 @@ __all__ = [
     "DealService",
     "TaskService",
     "AnalyticsService",
+    "MembershipService",
 ]
@@ -1,8 +1,11 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.pagination import decode_cursor, encode_cursor
 from src.db.models import ActivityModel, ActivityType
 from src.domain.exceptions import AuthorizationError, NotFoundError
 from src.repositories.activity import ActivityRepository
@@ -19,11 +22,9 @@ class ActivityService:
     async def create_activity(
         self, deal_id: UUID, organization_id: UUID, user_id: UUID, role, content: str
     ) -> ActivityModel:
-        deal = await self.deal_repo.get_by_id(deal_id)
+        deal = await self.deal_repo.get_for_organization(deal_id, organization_id)
         if not deal:
             raise NotFoundError("Deal not found")
-        if deal.organization_id != organization_id:
-            raise NotFoundError("Deal not found")
 
         if not PermissionService.check_resource_permission(user_id, deal.owner_id, role):
             raise AuthorizationError("Access denied")
@@ -49,16 +50,63 @@ class ActivityService:
         )
         return await self.activity_repo.create(activity)
 
-    async def list_activities(
-        self, deal_id: UUID, organization_id: UUID, user_id: UUID, role
+    async def create_system_activities(
+        self, activities: list[tuple[UUID, ActivityType, dict[str, Any]]]
     ) -> list[ActivityModel]:
-        deal = await self.deal_repo.get_by_id(deal_id)
+        """Record many system activities with one multi-row insert."""
+        return await self.activity_repo.create_many(
+            [
+                {
+                    "id": uuid4(),
+                    "deal_id": deal_id,
+                    "author_id": None,
+                    "type": activity_type,
+                    "payload": payload,
+                }
+                for deal_id, activity_type, payload in activities
+            ]
+        )
+
+    async def list_activities(
+        self,
+        deal_id: UUID,
+        organization_id: UUID,
+        user_id: UUID,
+        role,
+        limit: int = 50,
+        cursor: str | None = None,
+        activity_type: ActivityType | None = None,
+        since: datetime | None = None,
+    ) -> tuple[list[ActivityModel], str | None]:
+        deal = await self.deal_repo.get_for_organization(deal_id, organization_id)
         if not deal:
             raise NotFoundError("Deal not found")
-        if deal.organization_id != organization_id:
-            raise NotFoundError("Deal not found")
 
         if not PermissionService.check_resource_permission(user_id, deal.owner_id, role):
             raise AuthorizationError("Access denied")
 
-        return await self.activity_repo.list_by_deal(deal_id)
+        after = decode_cursor(cursor, datetime, UUID) if cursor else None
+        activities = await self.activity_repo.list_by_deal(
+            deal_id, limit + 1, activity_type, since, after
+        )
+
+        next_cursor = None
+        if len(activities) > limit:
+            activities = activities[:limit]
+            next_cursor = encode_cursor(activities[-1].created_at, activities[-1].id)
+
+        return activities, next_cursor
+
+    def export_activities(
+        self,
+        organization_id: UUID,
+        user_id: UUID,
+        role,
+        deal_id: UUID | None = None,
+        activity_type: ActivityType | None = None,
+    ) -> AsyncIterator[ActivityModel]:
+        # Members only see the history of deals they own, as in list_activities.
+        deal_owner_id = None if PermissionService.can_access_all_resources(role) else user_id
+        return self.activity_repo.stream_by_organization(
+            organization_id, deal_id, activity_type, deal_owner_id
+        )
@@ -1,50 +1,104 @@
-from datetime import datetime, timedelta
+import asyncio
+from datetime import date
 from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.repositories.deal import DealRepository
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.db.session import read_router, run_after_commit
+from src.domain.exceptions import ValidationError
+from src.domain.value_objects.timeseries_granularity import TimeseriesGranularity
+from src.repositories.deal_stats import DealStatsRepository
+from src.repositories.deal_timeseries import (
+    DealTimeseriesRepository,
+    bucket_start,
+    next_bucket_start,
+)
+
+MAX_TIMESERIES_BUCKETS = 1000
+
+analytics_cache: TTLCache[tuple[Any, ...], Any] = TTLCache(
+    max_entries=settings.analytics_cache_max_entries,
+    ttl_seconds=settings.analytics_cache_ttl_seconds,
+)
 
 
 class AnalyticsService:
     def __init__(self, session: AsyncSession):
         self.session = session
-        self.deal_repo = DealRepository(session)
-        self._cache: dict[str, tuple[datetime, Any]] = {}
-        self._cache_ttl = timedelta(minutes=5)
+        self.stats_repo = DealStatsRepository(session)
+        self.timeseries_repo = DealTimeseriesRepository(session)
 
-    def _get_cache_key(self, organization_id: UUID, method: str) -> str:
-        return f"{method}:{organization_id}"
+    @staticmethod
+    def invalidate_organization(session: AsyncSession, organization_id: UUID) -> None:
+        # Drop now so this request sees its own write, and again after commit so a
+        # concurrent reader cannot re-cache the pre-commit state.
+        def invalidate() -> None:
+            analytics_cache.invalidate_where(lambda key: key[0] == organization_id)
 
-    def _get_from_cache(self, key: str) -> Any | None:
-        if key in self._cache:
-            timestamp, value = self._cache[key]
-            if datetime.now() - timestamp < self._cache_ttl:
-                return value
-            del self._cache[key]
-        return None
+        def invalidate_after_commit() -> None:
+            invalidate()
+            if read_router.enabled:
+                # A lagging replica can still serve pre-commit totals for up to the
+                # lag bound, so drop whatever gets cached in that window as well.
+                asyncio.get_running_loop().call_later(read_router.max_lag_seconds, invalidate)
 
-    def _set_cache(self, key: str, value: Any) -> None:
-        self._cache[key] = (datetime.now(), value)
+        invalidate()
+        run_after_commit(session, invalidate_after_commit)
 
     async def get_deals_summary(self, organization_id: UUID) -> dict[str, int | Decimal]:
-        cache_key = self._get_cache_key(organization_id, "summary")
-        cached = self._get_from_cache(cache_key)
-        if cached is not None:
-            return cached
-
-        summary = await self.deal_repo.get_summary(organization_id)
-        self._set_cache(cache_key, summary)
-        return summary
+        return await analytics_cache.get_or_load(
+            (organization_id, "summary"),
+            lambda: self.stats_repo.get_summary(organization_id),
+        )
 
     async def get_deals_funnel(self, organization_id: UUID) -> list[dict[str, int | str]]:
-        cache_key = self._get_cache_key(organization_id, "funnel")
-        cached = self._get_from_cache(cache_key)
-        if cached is not None:
-            return cached
-
-        funnel = await self.deal_repo.get_funnel(organization_id)
-        self._set_cache(cache_key, funnel)
-        return funnel
+        return await analytics_cache.get_or_load(
+            (organization_id, "funnel"),
+            lambda: self.stats_repo.get_funnel(organization_id),
+        )
+
+    async def get_deals_timeseries(
+        self,
+        organization_id: UUID,
+        granularity: TimeseriesGranularity,
+        date_from: date,
+        date_to: date,
+    ) -> list[dict[str, date | int | Decimal]]:
+        if date_from > date_to:
+            raise ValidationError("'from' must not be after 'to'")
+        starts = [bucket_start(granularity, date_from)]
+        while (following := next_bucket_start(granularity, starts[-1])) <= date_to:
+            if len(starts) >= MAX_TIMESERIES_BUCKETS:
+                raise ValidationError(
+                    f"Range spans more than {MAX_TIMESERIES_BUCKETS} {granularity.value} buckets"
+                )
+            starts.append(following)
+
+        async def load() -> list[dict[str, date | int | Decimal]]:
+            rows = {
+                row.bucket_start: row
+                for row in await self.timeseries_repo.get_series(
+                    organization_id, granularity, date_from, date_to
+                )
+            }
+            points = []
+            for start in starts:
+                row = rows.get(start)
+                points.append(
+                    {
+                        "bucket_start": start,
+                        "created_count": row.created_count if row else 0,
+                        "won_count": row.won_count if row else 0,
+                        "lost_count": row.lost_count if row else 0,
+                        "won_amount": row.won_amount if row else Decimal(0),
+                    }
+                )
+            return points
+
+        return await analytics_cache.get_or_load(
+            (organization_id, "timeseries", granularity, date_from, date_to), load
+        )
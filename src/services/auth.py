@@ -1,19 +1,59 @@
+from typing import Any
 from uuid import UUID, uuid4
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
 
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.rate_limit import InMemoryRateLimitBackend, SlidingWindowRateLimiter
 from src.core.security import (
     create_access_token,
     create_refresh_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
 from src.db.models import OrganizationMemberModel, OrganizationModel, Role, UserModel
-from src.domain.exceptions import AuthenticationError, ConflictError
+from src.db.session import run_after_commit
+from src.domain.entities.principal import Principal
+from src.domain.exceptions import (
+    AuthenticationError,
+    ConflictError,
+    RateLimitError,
+    ServiceUnavailableError,
+)
 from src.repositories.organization import OrganizationRepository
 from src.repositories.organization_member import OrganizationMemberRepository
 from src.repositories.user import UserRepository
 
+principal_cache: TTLCache[UUID, Principal] = TTLCache(
+    max_entries=settings.principal_cache_max_entries,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+)
+
+_login_attempts = InMemoryRateLimitBackend(max_keys=settings.login_throttle_max_keys)
+login_email_limiter = SlidingWindowRateLimiter(
+    _login_attempts,
+    limit=settings.login_max_failures_per_email,
+    window_seconds=settings.login_failure_window_seconds,
+)
+login_ip_limiter = SlidingWindowRateLimiter(
+    _login_attempts,
+    limit=settings.login_max_failures_per_ip,
+    window_seconds=settings.login_failure_window_seconds,
+)
+
+_dummy_password_hash: str | None = None
+
+
+async def _get_dummy_password_hash() -> str:
+    # Unknown emails are verified against this hash so they cost the same as real ones.
+    global _dummy_password_hash
+    if _dummy_password_hash is None:
+        _dummy_password_hash = await hash_password_async(uuid4().hex)
+    return _dummy_password_hash
+
 
 class AuthService:
     def __init__(self, session: AsyncSession):
@@ -30,7 +70,7 @@ class AuthService:
         user = UserModel(
             id=uuid4(),
             email=email,
-            hashed_password=hash_password(password),
+            hashed_password=await hash_password_async(password),
             name=name,
         )
         user = await self.user_repo.create(user)
@@ -48,12 +88,53 @@ class AuthService:
 
         return user, org
 
-    async def login(self, email: str, password: str) -> dict[str, str]:
-        user = await self.user_repo.get_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):
+    async def login(
+        self, email: str, password: str, client_ip: str | None = None
+    ) -> dict[str, str]:
+        email_key = f"email:{email.lower()}"
+        ip_key = f"ip:{client_ip}" if client_ip else None
+
+        # Throttled attempts are rejected before any password hashing is spent on them.
+        # Every attempt is counted before the slow verification, so a concurrent burst
+        # cannot get past the limit while its first guesses are still being checked.
+        allowed = await login_email_limiter.acquire(email_key)
+        if allowed and ip_key and not await login_ip_limiter.acquire(ip_key):
+            await login_email_limiter.release(email_key)
+            allowed = False
+        if not allowed:
+            raise RateLimitError(
+                "Too many failed login attempts, retry later",
+                retry_after=settings.login_failure_window_seconds,
+            )
+
+        try:
+            user = await self.user_repo.get_by_email(email)
+            hashed_password = user.hashed_password if user else await _get_dummy_password_hash()
+            password_valid = await verify_password_async(password, hashed_password)
+        except ServiceUnavailableError:
+            # The password was never checked: a saturated executor must not push the
+            # account towards a lockout.
+            await login_email_limiter.release(email_key)
+            if ip_key:
+                await login_ip_limiter.release(ip_key)
+            raise
+
+        if not user or not password_valid:
             raise AuthenticationError("Invalid credentials")
 
-        access_token = create_access_token(user.id)
+        # Only failures count: the email starts over, the address gets its attempt back.
+        await login_email_limiter.reset(email_key)
+        if ip_key:
+            await login_ip_limiter.release(ip_key)
+
+        if settings.access_token_membership_claims:
+            # The version is read before the memberships, so a concurrent change can
+            # only make the token look stale, never newer than it is.
+            access_token = create_access_token(
+                user.id, await self._membership_claims(user.id), user.membership_version
+            )
+        else:
+            access_token = create_access_token(user.id)
         refresh_token = create_refresh_token(user.id)
 
         return {
@@ -61,8 +142,42 @@ class AuthService:
             "refresh_token": refresh_token,
         }
 
+    async def _membership_claims(self, user_id: UUID) -> dict[UUID, tuple[UUID, str]]:
+        # Organizations beyond the cap are left out and resolved from the database.
+        results = await self.member_repo.get_user_organizations(user_id)
+        return {
+            member.organization_id: (member.id, Role(member.role).value)
+            for member, org in results[: settings.access_token_max_memberships]
+        }
+
+    @staticmethod
+    def invalidate_principal(session: Session | AsyncSession | None, user_id: UUID) -> None:
+        principal_cache.invalidate(user_id)
+        if session is not None:
+            run_after_commit(session, lambda: principal_cache.invalidate(user_id))
+
+    async def get_principal(self, user_id: UUID) -> Principal:
+        return await principal_cache.get_or_load(user_id, lambda: self._load_principal(user_id))
+
+    async def _load_principal(self, user_id: UUID) -> Principal:
+        user = await self.user_repo.get_by_id(user_id)
+        if not user:
+            raise AuthenticationError("User not found")
+        return Principal(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            membership_version=user.membership_version,
+        )
+
     async def verify_token(self, user_id: UUID) -> UserModel:
         user = await self.user_repo.get_by_id(user_id)
         if not user:
             raise AuthenticationError("Invalid token")
         return user
+
+
+@event.listens_for(UserModel, "after_update")
+@event.listens_for(UserModel, "after_delete")
+def _invalidate_principal(mapper: Any, connection: Any, user: UserModel) -> None:
+    AuthService.invalidate_principal(object_session(user), user.id)
@@ -1,9 +1,19 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
 from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.pagination import TotalMode, decode_cursor, encode_cursor
 from src.db.models import ContactModel
-from src.domain.exceptions import AuthorizationError, ConflictError, NotFoundError
+from src.domain.exceptions import (
+    AuthorizationError,
+    ConflictError,
+    NotFoundError,
+    ValidationError,
+)
+from src.domain.value_objects.search_mode import ContactSearchMode
 from src.repositories.contact import ContactRepository
 from src.services.permission import PermissionService
 
@@ -31,39 +41,88 @@ class ContactService:
         )
         return await self.contact_repo.create(contact)
 
+    async def create_contacts(
+        self,
+        organization_id: UUID,
+        owner_id: UUID,
+        contacts: list[dict[str, str | None]],
+    ) -> list[ContactModel]:
+        return await self.contact_repo.create_many(
+            [
+                {
+                    "id": uuid4(),
+                    "organization_id": organization_id,
+                    "owner_id": owner_id,
+                    "name": contact["name"],
+                    "email": contact.get("email"),
+                    "phone": contact.get("phone"),
+                }
+                for contact in contacts
+            ]
+        )
+
     async def list_contacts(
         self,
         organization_id: UUID,
         limit: int = 50,
         offset: int = 0,
         search: str | None = None,
-    ) -> tuple[list[ContactModel], int]:
-        return await self.contact_repo.list_by_organization(
-            organization_id, limit, offset, search
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        search_mode: ContactSearchMode = ContactSearchMode.CONTAINS,
+    ) -> tuple[list[dict[str, Any]], int | None, str | None]:
+        # Similarity results are ordered by rank, which the created_at cursor cannot follow.
+        ranked = bool(search) and search_mode == ContactSearchMode.SIMILAR
+
+        after = None
+        if cursor:
+            if offset:
+                raise ValidationError("Offset cannot be combined with cursor")
+            if ranked:
+                raise ValidationError("Cursor cannot be combined with similarity search")
+            after = decode_cursor(cursor, datetime, UUID)
+
+        contacts, total = await self.contact_repo.list_by_organization(
+            organization_id, limit + 1, offset, search, after, total_mode, search_mode
         )
 
+        next_cursor = None
+        if len(contacts) > limit:
+            contacts = contacts[:limit]
+            if not ranked:
+                next_cursor = encode_cursor(contacts[-1]["created_at"], contacts[-1]["id"])
+
+        return contacts, total, next_cursor
+
+    def export_contacts(
+        self,
+        organization_id: UUID,
+        search: str | None = None,
+        search_mode: ContactSearchMode = ContactSearchMode.CONTAINS,
+    ) -> AsyncIterator[ContactModel]:
+        return self.contact_repo.stream_by_organization(organization_id, search, search_mode)
+
     async def get_contact(
         self,
         contact_id: UUID,
         organization_id: UUID,
     ) -> ContactModel:
-        contact = await self.contact_repo.get_by_id(contact_id)
+        contact = await self.contact_repo.get_for_organization(contact_id, organization_id)
         if not contact:
             raise NotFoundError("Contact not found")
-        if contact.organization_id != organization_id:
-            raise NotFoundError("Contact not found")
         return contact
 
     async def update_contact(
         self,
         contact_id: UUID,
+        organization_id: UUID,
         user_id: UUID,
         user_role,
         name: str | None = None,
         email: str | None = None,
         phone: str | None = None,
     ) -> ContactModel:
-        contact = await self.contact_repo.get_by_id(contact_id)
+        contact = await self.contact_repo.get_for_organization(contact_id, organization_id)
         if not contact:
             raise NotFoundError("Contact not found")
 
@@ -80,9 +139,9 @@ class ContactService:
         return await self.contact_repo.update(contact)
 
     async def delete_contact(
-        self, contact_id: UUID, user_id: UUID, user_role
+        self, contact_id: UUID, organization_id: UUID, user_id: UUID, user_role
     ) -> None:
-        contact = await self.contact_repo.get_by_id(contact_id)
+        contact = await self.contact_repo.get_for_organization(contact_id, organization_id)
         if not contact:
             raise NotFoundError("Contact not found")
 
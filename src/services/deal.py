@@ -1,21 +1,41 @@
-from decimal import Decimal
+from collections.abc import AsyncIterator
+from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
 from uuid import UUID, uuid4
 
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
+from src.core.pagination import TotalMode, decode_cursor, encode_cursor
 from src.db.models import ActivityType, DealModel, DealStage, DealStatus
 from src.domain.exceptions import AuthorizationError, NotFoundError, ValidationError
 from src.repositories.contact import ContactRepository
 from src.repositories.deal import DealRepository
+from src.repositories.deal_stats import DealStatsRepository, StatsKey
+from src.repositories.deal_timeseries import (
+    DealTimeseriesRepository,
+    combined_contribution,
+    contribution_delta,
+    deal_contribution,
+)
+from src.repositories.organization_member import OrganizationMemberRepository
 from src.services.activity import ActivityService
+from src.services.analytics import AnalyticsService
 from src.services.permission import PermissionService
 
+DEAL_INCLUDES = frozenset({"contact", "tasks", "activities"})
+
 
 class DealService:
     def __init__(self, session: AsyncSession):
         self.session = session
         self.deal_repo = DealRepository(session)
+        self.stats_repo = DealStatsRepository(session)
+        self.timeseries_repo = DealTimeseriesRepository(session)
         self.contact_repo = ContactRepository(session)
+        self.member_repo = OrganizationMemberRepository(session)
         self.activity_service = ActivityService(session)
 
     async def create_deal(
@@ -27,25 +47,29 @@ class DealService:
         amount: Decimal,
         currency: str = "USD",
     ) -> DealModel:
-        contact = await self.contact_repo.get_by_id(contact_id)
+        contact = await self.contact_repo.get_for_organization(contact_id, organization_id)
         if not contact:
             raise NotFoundError("Contact not found")
 
-        if contact.organization_id != organization_id:
-            raise ValidationError("Contact does not belong to organization")
-
         deal = DealModel(
             id=uuid4(),
             organization_id=organization_id,
             contact_id=contact_id,
             owner_id=owner_id,
             title=title,
-            amount=amount,
+            amount=_money(amount),
             currency=currency,
             status=DealStatus.NEW,
             stage=DealStage.QUALIFICATION,
+            closed_at=None,
         )
-        return await self.deal_repo.create(deal)
+        deal = await self.deal_repo.create(deal)
+        await self.stats_repo.apply_deltas(
+            organization_id, {(deal.status, deal.stage, deal.currency): (1, deal.amount)}
+        )
+        await self.timeseries_repo.apply_deltas(organization_id, deal_contribution(deal))
+        AnalyticsService.invalidate_organization(self.session, organization_id)
+        return deal
 
     async def list_deals(
         self,
@@ -55,11 +79,34 @@ class DealService:
         status: DealStatus | None = None,
         stage: DealStage | None = None,
         owner_id: UUID | None = None,
-    ) -> tuple[list[DealModel], int]:
-        return await self.deal_repo.list_by_organization(
-            organization_id, limit, offset, status, stage, owner_id
+        cursor: str | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ) -> tuple[list[dict[str, Any]], int | None, str | None]:
+        after = None
+        if cursor:
+            if offset:
+                raise ValidationError("Offset cannot be combined with cursor")
+            after = decode_cursor(cursor, datetime, UUID)
+
+        deals, total = await self.deal_repo.list_by_organization(
+            organization_id, limit + 1, offset, status, stage, owner_id, after, total_mode
         )
 
+        next_cursor = None
+        if len(deals) > limit:
+            deals = deals[:limit]
+            next_cursor = encode_cursor(deals[-1]["created_at"], deals[-1]["id"])
+
+        return deals, total, next_cursor
+
+    def export_deals(
+        self,
+        organization_id: UUID,
+        status: DealStatus | None = None,
+        stage: DealStage | None = None,
+    ) -> AsyncIterator[DealModel]:
+        return self.deal_repo.stream_by_organization(organization_id, status, stage)
+
     async def update_deal(
         self,
         deal_id: UUID,
@@ -71,13 +118,17 @@ class DealService:
         status: DealStatus | None = None,
         stage: DealStage | None = None,
     ) -> DealModel:
-        deal = await self.deal_repo.get_by_id(deal_id)
-        if not deal or deal.organization_id != organization_id:
+        # Locked: the rollup deltas below are computed from these values.
+        deal = await self.deal_repo.get_for_organization(deal_id, organization_id, lock=True)
+        if not deal:
             raise NotFoundError("Deal not found")
 
         if not PermissionService.check_resource_permission(user_id, deal.owner_id, user_role):
             raise AuthorizationError("Access denied")
 
+        old_key, old_amount = (deal.status, deal.stage, deal.currency), deal.amount
+        old_contribution = deal_contribution(deal)
+
         if stage and stage != deal.stage:
             if not PermissionService.can_rollback_stage(user_role, deal.stage, stage):
                 raise AuthorizationError("Cannot rollback stage")
@@ -97,25 +148,137 @@ class DealService:
                 {"old_status": deal.status, "new_status": status}
             )
             deal.status = status
+            # The database clock, as in update_many and imports: the timeseries buckets
+            # closed deals by this value.
+            deal.closed_at = func.now() if status in (DealStatus.WON, DealStatus.LOST) else None
 
         if title:
             deal.title = title
         if amount:
-            deal.amount = amount
+            deal.amount = _money(amount)
 
-        return await self.deal_repo.update(deal)
+        deal = await self.deal_repo.update(deal)
+        await self.stats_repo.apply_deltas(
+            organization_id, _stats_move(old_key, old_amount, deal)
+        )
+        await self.timeseries_repo.apply_deltas(
+            organization_id, contribution_delta(old_contribution, deal_contribution(deal))
+        )
+        AnalyticsService.invalidate_organization(self.session, organization_id)
+        return deal
 
-    async def get_deal(
+    async def update_deals(
+        self,
+        deal_ids: list[UUID],
+        organization_id: UUID,
+        user_id: UUID,
+        user_role,
+        status: DealStatus | None = None,
+        stage: DealStage | None = None,
+        owner_id: UUID | None = None,
+    ) -> tuple[list[DealModel], list[tuple[int, str]]]:
+        """Apply the same status/stage/owner change to many deals.
+
+        Deals the caller may not change are reported as ``(index, reason)``
+        and skipped; the rest are updated with one statement.
+        """
+        if status is None and stage is None and owner_id is None:
+            raise ValidationError("Nothing to update")
+        if owner_id and not await self.member_repo.get_membership(owner_id, organization_id):
+            raise ValidationError("New owner is not a member of the organization")
+
+        locked = {
+            deal.id: deal
+            for deal in await self.deal_repo.lock_many(organization_id, list(set(deal_ids)))
+        }
+        deals: dict[UUID, DealModel] = {}
+        errors: list[tuple[int, str]] = []
+        for index, deal_id in enumerate(deal_ids):
+            deal = locked.get(deal_id)
+            if deal is None:
+                errors.append((index, "Deal not found"))
+            elif deal_id in deals:
+                continue
+            elif not PermissionService.check_resource_permission(user_id, deal.owner_id, user_role):
+                errors.append((index, "Access denied"))
+            elif stage and not PermissionService.can_rollback_stage(user_role, deal.stage, stage):
+                errors.append((index, "Cannot rollback stage"))
+            elif status == DealStatus.WON and deal.status != status and deal.amount <= 0:
+                errors.append((index, "Won deal must have positive amount"))
+            else:
+                deals[deal_id] = deal
+
+        activities = []
+        changed = []
+        for deal in deals.values():
+            stage_changed = stage is not None and stage != deal.stage
+            status_changed = status is not None and status != deal.status
+            if stage_changed:
+                activities.append(
+                    (
+                        deal.id,
+                        ActivityType.STAGE_CHANGED,
+                        {"old_stage": deal.stage, "new_stage": stage},
+                    )
+                )
+            if status_changed:
+                activities.append(
+                    (
+                        deal.id,
+                        ActivityType.STATUS_CHANGED,
+                        {"old_status": deal.status, "new_status": status},
+                    )
+                )
+            if stage_changed or status_changed or (owner_id and owner_id != deal.owner_id):
+                changed.append(deal)
+        if not changed:
+            return list(deals.values()), errors
+
+        stats: dict[StatsKey, tuple[int, Decimal]] = {}
+        for deal in changed:
+            _add_stats(stats, (deal.status, deal.stage, deal.currency), -1, -deal.amount)
+        old_contribution = combined_contribution(changed)
+
+        # Refreshes the locked deals in place from RETURNING.
+        await self.deal_repo.update_many([deal.id for deal in changed], status, stage, owner_id)
+        await self.activity_service.create_system_activities(activities)
+
+        for deal in changed:
+            _add_stats(stats, (deal.status, deal.stage, deal.currency), 1, deal.amount)
+        await self.stats_repo.apply_deltas(organization_id, stats)
+        await self.timeseries_repo.apply_deltas(
+            organization_id, contribution_delta(old_contribution, combined_contribution(changed))
+        )
+        AnalyticsService.invalidate_organization(self.session, organization_id)
+        return list(deals.values()), errors
+
+    async def get_deal_detail(
         self,
         deal_id: UUID,
         organization_id: UUID,
-    ) -> DealModel:
-        deal = await self.deal_repo.get_by_id(deal_id)
-        if not deal:
-            raise NotFoundError("Deal not found")
-        if deal.organization_id != organization_id:
+        user_id: UUID,
+        role,
+        include: str | None = None,
+    ) -> tuple[DealModel, dict[str, Any]]:
+        """The deal and the comma-separated ``include`` relations, keyed by name."""
+        relations = frozenset(name.strip() for name in (include or "").split(",") if name.strip())
+        unknown = sorted(relations - DEAL_INCLUDES)
+        if unknown:
+            raise ValidationError(f"Unknown include: {', '.join(unknown)}")
+
+        detail = await self.deal_repo.get_detail(
+            deal_id, organization_id, relations, settings.deal_detail_max_items
+        )
+        if not detail:
             raise NotFoundError("Deal not found")
-        return deal
+        deal, related = detail
+
+        # Same rule as the deal's own activity timeline.
+        if "activities" in relations and not PermissionService.check_resource_permission(
+            user_id, deal.owner_id, role
+        ):
+            raise AuthorizationError("Access denied")
+        return deal, related
 
     async def delete_deal(
         self,
@@ -124,11 +287,40 @@ class DealService:
         user_id: UUID,
         role,
     ) -> None:
-        deal = await self.deal_repo.get_by_id(deal_id)
-        if not deal or deal.organization_id != organization_id:
+        deal = await self.deal_repo.get_for_organization(deal_id, organization_id, lock=True)
+        if not deal:
             raise NotFoundError("Deal not found")
 
         if not PermissionService.check_resource_permission(user_id, deal.owner_id, role):
             raise AuthorizationError("Access denied")
 
         await self.deal_repo.delete(deal)
+        await self.stats_repo.apply_deltas(
+            organization_id, {(deal.status, deal.stage, deal.currency): (-1, -deal.amount)}
+        )
+        await self.timeseries_repo.apply_deltas(
+            organization_id, contribution_delta(deal_contribution(deal), {})
+        )
+        AnalyticsService.invalidate_organization(self.session, organization_id)
+
+
+def _money(amount: Decimal) -> Decimal:
+    # Round the way Numeric(15, 2) does, so the in-memory deal (no longer reloaded
+    # after the write) and the rollup deltas match the stored amount.
+    return amount.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+def _add_stats(
+    stats: dict[StatsKey, tuple[int, Decimal]], key: StatsKey, count: int, amount: Decimal
+) -> None:
+    current_count, current_amount = stats.get(key, (0, Decimal(0)))
+    stats[key] = (current_count + count, current_amount + amount)
+
+
+def _stats_move(
+    old_key: StatsKey, old_amount: Decimal, deal: DealModel
+) -> dict[StatsKey, tuple[int, Decimal]]:
+    new_key = (deal.status, deal.stage, deal.currency)
+    if new_key == old_key:
+        return {new_key: (0, deal.amount - old_amount)}
+    return {old_key: (-1, -old_amount), new_key: (1, deal.amount)}
@@ -0,0 +1,300 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from datetime import UTC, datetime
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from tempfile import SpooledTemporaryFile
+from typing import Any
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import UploadFile
+
+from src.core.config import settings
+from src.core.tabular import Record, iter_records
+from src.db.models import DealStage, DealStatus, ImportEntity, ImportJobModel, ImportStatus
+from src.domain.exceptions import NotFoundError, PayloadTooLargeError, ValidationError
+from src.domain.value_objects.data_format import DataFormat
+from src.repositories.deal_stats import DealStatsRepository, StatsKey
+from src.repositories.deal_timeseries import DealTimeseriesRepository, combined_contribution
+from src.repositories.import_job import ImportJobRepository
+from src.repositories.import_staging import (
+    CONTACT_STAGING_COLUMNS,
+    DEAL_STAGING_COLUMNS,
+    ImportStagingRepository,
+    contact_staging,
+    deal_staging,
+)
+from src.services.analytics import AnalyticsService
+
+logger = logging.getLogger(__name__)
+
+# Numeric(15, 2) on deals.amount.
+_MAX_AMOUNT = Decimal("1e13")
+
+# Uploads are spooled to memory up to this size and to a temporary file beyond it.
+_SPOOL_MAX_MEMORY = 1024 * 1024
+_SPOOL_READ_SIZE = 64 * 1024
+
+# Imports running in this process; the event loop only keeps weak references.
+_running_imports: set[asyncio.Task] = set()
+
+
+class ImportService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.job_repo = ImportJobRepository(session)
+        self.staging_repo = ImportStagingRepository(session)
+        self.stats_repo = DealStatsRepository(session)
+        self.timeseries_repo = DealTimeseriesRepository(session)
+
+    async def get_job(self, job_id: UUID, organization_id: UUID) -> ImportJobModel:
+        job = await self.job_repo.get_for_organization(job_id, organization_id)
+        if not job:
+            raise NotFoundError("Import job not found")
+        return job
+
+    async def create_job(
+        self,
+        organization_id: UUID,
+        user_id: UUID,
+        entity: ImportEntity,
+        data_format: DataFormat,
+    ) -> ImportJobModel:
+        return await self.job_repo.create(
+            ImportJobModel(
+                id=uuid4(),
+                organization_id=organization_id,
+                created_by=user_id,
+                entity=entity,
+                format=data_format,
+                status=ImportStatus.RUNNING,
+                errors=[],
+            )
+        )
+
+    async def fail_interrupted(self, job_id: UUID) -> None:
+        """Mark a job whose import was cancelled before it finished as failed."""
+        job = await self.job_repo.get_by_id(job_id)
+        if job is None or job.status != ImportStatus.RUNNING:
+            return
+        job.status = ImportStatus.FAILED
+        job.error = "Import interrupted by a server shutdown"
+        job.finished_at = datetime.now(UTC)
+        await self.session.commit()
+
+    async def run_import(self, job: ImportJobModel, chunks: AsyncIterable[bytes]) -> None:
+        """Load ``chunks`` chunk by chunk, committing each one with the job's progress.
+
+        The session must belong to the import alone. Committed chunks stay
+        imported if a later one fails; the job then ends up ``failed`` with the
+        reason in ``error``.
+        """
+        try:
+            batch: list[Record] = []
+            async for record in iter_records(
+                chunks, DataFormat(job.format), settings.import_max_record_length
+            ):
+                batch.append(record)
+                if len(batch) >= settings.import_chunk_rows:
+                    await self._load_chunk(job, batch)
+                    batch = []
+            if batch:
+                await self._load_chunk(job, batch)
+            job.status = ImportStatus.COMPLETED
+        except ValidationError as e:
+            await self.session.rollback()
+            job.status = ImportStatus.FAILED
+            job.error = str(e)
+            job.finished_at = datetime.now(UTC)
+            await self.session.commit()
+            return
+        except Exception:
+            await self.session.rollback()
+            job.status = ImportStatus.FAILED
+            job.error = "Import aborted by an internal error"
+            job.finished_at = datetime.now(UTC)
+            await self.session.commit()
+            raise
+
+        job.finished_at = datetime.now(UTC)
+        await self.session.commit()
+
+    async def _load_chunk(self, job: ImportJobModel, records: list[Record]) -> None:
+        to_row = _contact_row if job.entity == ImportEntity.CONTACTS else _deal_row
+        rows: list[tuple] = []
+        rejected: list[tuple[int, str]] = []
+        for record in records:
+            if record.values is None:
+                rejected.append((record.line, record.error or "Malformed record"))
+                continue
+            try:
+                rows.append((record.line, *to_row(record.values)))
+            except ValueError as e:
+                rejected.append((record.line, str(e)))
+
+        imported = 0
+        if rows:
+            if job.entity == ImportEntity.CONTACTS:
+                await self.staging_repo.stage(contact_staging, CONTACT_STAGING_COLUMNS, rows)
+                imported = await self.staging_repo.merge_contacts(
+                    job.organization_id, job.created_by
+                )
+            else:
+                await self.staging_repo.stage(deal_staging, DEAL_STAGING_COLUMNS, rows)
+                deals, unresolved = await self.staging_repo.merge_deals(
+                    job.organization_id, job.created_by
+                )
+                rejected.extend(unresolved)
+                imported = len(deals)
+                await self._apply_rollups(job.organization_id, deals)
+
+        rejected.sort()
+        room = settings.import_max_reported_errors - len(job.errors)
+        if rejected and room > 0:
+            job.errors = job.errors + [
+                {"line": line, "detail": detail} for line, detail in rejected[:room]
+            ]
+        job.processed_rows += len(records)
+        job.imported_rows += imported
+        job.failed_rows += len(rejected)
+        # Committing per chunk publishes progress and drops the staging table.
+        await self.session.commit()
+
+    async def _apply_rollups(self, organization_id: UUID, deals: list[Any]) -> None:
+        if not deals:
+            return
+        stats: dict[StatsKey, tuple[int, Decimal]] = {}
+        for deal in deals:
+            key = (deal.status, deal.stage, deal.currency)
+            count, amount = stats.get(key, (0, Decimal(0)))
+            stats[key] = (count + 1, amount + deal.amount)
+        await self.stats_repo.apply_deltas(organization_id, stats)
+        await self.timeseries_repo.apply_deltas(organization_id, combined_contribution(deals))
+        AnalyticsService.invalidate_organization(self.session, organization_id)
+
+
+async def spool_upload(chunks: AsyncIterable[bytes]) -> UploadFile:
+    """Buffer a request body so it can still be read after the response is sent.
+
+    Reading stops with PayloadTooLargeError once the body exceeds
+    ``import_max_upload_bytes``.
+    """
+    upload = UploadFile(SpooledTemporaryFile(max_size=_SPOOL_MAX_MEMORY))
+    size = 0
+    try:
+        async for chunk in chunks:
+            size += len(chunk)
+            if size > settings.import_max_upload_bytes:
+                raise PayloadTooLargeError(
+                    f"Import body exceeds {settings.import_max_upload_bytes} bytes"
+                )
+            await upload.write(chunk)
+    except BaseException:
+        await upload.close()
+        raise
+    return upload
+
+
+def schedule_import(
+    job_id: UUID, upload: UploadFile, session_factory: Callable[[], AsyncSession]
+) -> None:
+    """Run a committed job over ``upload`` in the background, on its own session."""
+    task = asyncio.create_task(_import_in_background(job_id, upload, session_factory))
+    _running_imports.add(task)
+    task.add_done_callback(_running_imports.discard)
+
+
+async def cancel_running_imports() -> None:
+    """Cancel this process's background imports on shutdown, failing their jobs."""
+    tasks = list(_running_imports)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _import_in_background(
+    job_id: UUID, upload: UploadFile, session_factory: Callable[[], AsyncSession]
+) -> None:
+    try:
+        async with session_factory() as session:
+            service = ImportService(session)
+            job = await service.job_repo.get_by_id(job_id)
+            await service.run_import(job, _read_spooled(upload))
+    except asyncio.CancelledError:
+        # The chunks committed so far stay imported; only the job is left to close.
+        async with session_factory() as session:
+            await ImportService(session).fail_interrupted(job_id)
+        raise
+    except Exception:
+        # Nobody awaits the task; the job itself already records the failure.
+        logger.exception("Import job %s failed", job_id)
+    finally:
+        await upload.close()
+
+
+async def _read_spooled(upload: UploadFile) -> AsyncIterator[bytes]:
+    await upload.seek(0)
+    while chunk := await upload.read(_SPOOL_READ_SIZE):
+        yield chunk
+
+
+def _contact_row(values: dict[str, Any]) -> tuple:
+    name = _text(values, "name")
+    if not name:
+        raise ValueError("name: field required")
+    return (uuid4(), name, _text(values, "email"), _text(values, "phone"))
+
+
+def _deal_row(values: dict[str, Any]) -> tuple:
+    title = _text(values, "title")
+    if not title:
+        raise ValueError("title: field required")
+
+    raw_amount = values.get("amount")
+    if raw_amount in (None, "") or isinstance(raw_amount, bool):
+        raise ValueError("amount: field required")
+    try:
+        amount = Decimal(str(raw_amount)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    except InvalidOperation:
+        raise ValueError("amount: invalid number")
+    if not amount.is_finite() or abs(amount) >= _MAX_AMOUNT:
+        raise ValueError("amount: out of range")
+
+    currency = (_text(values, "currency") or "USD").upper()
+    if len(currency) != 3:
+        raise ValueError("currency: expected a 3-letter code")
+
+    try:
+        status = DealStatus(_text(values, "status") or DealStatus.NEW)
+    except ValueError:
+        raise ValueError("status: invalid value")
+    try:
+        stage = DealStage(_text(values, "stage") or DealStage.QUALIFICATION)
+    except ValueError:
+        raise ValueError("stage: invalid value")
+    if status == DealStatus.WON and amount <= 0:
+        raise ValueError("Won deal must have positive amount")
+
+    contact_ref = _text(values, "contact_id")
+    contact_email = _text(values, "contact_email")
+    if contact_ref:
+        try:
+            contact_ref = UUID(contact_ref)
+        except ValueError:
+            raise ValueError("contact_id: invalid UUID")
+    elif not contact_email:
+        raise ValueError("contact_id or contact_email is required")
+
+    return (uuid4(), contact_ref, contact_email, title, amount, currency, status.value, stage.value)
+
+
+def _text(values: dict[str, Any], key: str) -> str | None:
+    value = values.get(key)
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise ValueError(f"{key}: expected a string")
+    if "\x00" in value:
+        raise ValueError(f"{key}: contains a NUL character")
+    return value.strip() or None
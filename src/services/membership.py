@@ -0,0 +1,84 @@
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import event, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import object_session
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.security import AccessTokenClaims
+from src.db.models import OrganizationMemberModel, UserModel
+from src.domain.entities.organization_member import OrganizationMember
+from src.domain.entities.principal import Principal
+from src.domain.exceptions import AuthorizationError
+from src.domain.value_objects.role import Role
+from src.repositories.organization_member import OrganizationMemberRepository
+from src.services.auth import AuthService
+
+# Keys carry the user's membership_version, so bumping it orphans every stale entry.
+membership_cache: TTLCache[tuple[UUID, UUID, int], OrganizationMember] = TTLCache(
+    max_entries=settings.membership_cache_max_entries,
+    ttl_seconds=settings.membership_cache_ttl_seconds,
+)
+
+membership_claims_stats = {"authorized": 0, "fallback": 0}
+
+
+class MembershipService:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.member_repo = OrganizationMemberRepository(session)
+
+    @staticmethod
+    def membership_from_claims(
+        claims: AccessTokenClaims, principal: Principal, organization_id: UUID
+    ) -> OrganizationMember | None:
+        # Claims are trusted only while they match the user's current membership version.
+        if claims.membership_version is None:
+            return None
+        claim = claims.memberships.get(organization_id)
+        if claim is None or claims.membership_version != principal.membership_version:
+            membership_claims_stats["fallback"] += 1
+            return None
+        membership_claims_stats["authorized"] += 1
+        member_id, role = claim
+        return OrganizationMember(
+            id=member_id,
+            organization_id=organization_id,
+            user_id=principal.id,
+            role=Role(role),
+        )
+
+    async def get_membership(self, principal: Principal, organization_id: UUID) -> OrganizationMember:
+        return await membership_cache.get_or_load(
+            (principal.id, organization_id, principal.membership_version),
+            lambda: self._load_membership(principal.id, organization_id),
+        )
+
+    async def _load_membership(self, user_id: UUID, organization_id: UUID) -> OrganizationMember:
+        member = await self.member_repo.get_membership(user_id, organization_id)
+        if not member:
+            results = await self.member_repo.get_user_organizations(user_id)
+            available_orgs = [str(m.organization_id) for m, org in results]
+            raise AuthorizationError(
+                f"Access denied to organization. Available organizations: {available_orgs}"
+            )
+        return OrganizationMember(
+            id=member.id,
+            organization_id=member.organization_id,
+            user_id=member.user_id,
+            role=Role(member.role),
+        )
+
+
+@event.listens_for(OrganizationMemberModel, "after_insert")
+@event.listens_for(OrganizationMemberModel, "after_update")
+@event.listens_for(OrganizationMemberModel, "after_delete")
+def _bump_membership_version(mapper: Any, connection: Any, member: OrganizationMemberModel) -> None:
+    connection.execute(
+        update(UserModel)
+        .where(UserModel.id == member.user_id)
+        .values(membership_version=UserModel.membership_version + 1)
+    )
+    AuthService.invalidate_principal(object_session(member), member.user_id)
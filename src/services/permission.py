@@ -9,11 +9,15 @@ class PermissionService:
     def check_organization_access(user_role: Role | None) -> bool:
         return user_role is not None
 
+    @staticmethod
+    def can_access_all_resources(user_role: Role) -> bool:
+        return user_role in (Role.OWNER, Role.ADMIN)
+
     @staticmethod
     def check_resource_permission(
         user_id: UUID, resource_owner_id: UUID, user_role: Role
     ) -> bool:
-        if user_role in (Role.OWNER, Role.ADMIN):
+        if PermissionService.can_access_all_resources(user_role):
             return True
         return user_id == resource_owner_id
 
@@ -3,6 +3,7 @@ from uuid import UUID, uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.pagination import decode_cursor, encode_cursor
 from src.db.models import Role, TaskModel
 from src.domain.exceptions import AuthorizationError, NotFoundError, ValidationError
 from src.repositories.deal import DealRepository
@@ -26,11 +27,9 @@ class TaskService:
         due_date: date,
         description: str | None = None,
     ) -> TaskModel:
-        deal = await self.deal_repo.get_by_id(deal_id)
+        deal = await self.deal_repo.get_for_organization(deal_id, organization_id)
         if not deal:
             raise NotFoundError("Deal not found")
-        if deal.organization_id != organization_id:
-            raise NotFoundError("Deal not found")
 
         if not PermissionService.check_resource_permission(user_id, deal.owner_id, role):
             raise AuthorizationError("Access denied")
@@ -43,6 +42,7 @@ class TaskService:
 
         task = TaskModel(
             id=uuid4(),
+            organization_id=organization_id,
             deal_id=deal_id,
             title=title,
             description=description,
@@ -56,13 +56,34 @@ class TaskService:
         organization_id: UUID,
         deal_id: UUID | None = None,
         only_open: bool = False,
-    ) -> list[TaskModel]:
+        is_done: bool | None = None,
+        owner_id: UUID | None = None,
+        due_from: date | None = None,
+        due_to: date | None = None,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> tuple[list[TaskModel], str | None]:
+        if only_open:
+            is_done = False
         if deal_id:
-            deal = await self.deal_repo.get_by_id(deal_id)
-            if not deal or deal.organization_id != organization_id:
+            deal = await self.deal_repo.get_for_organization(deal_id, organization_id)
+            if not deal:
                 raise NotFoundError("Deal not found")
-            return await self.task_repo.list_by_deal(deal_id, only_open)
-        return []
+            return await self.task_repo.list_by_deal(deal_id, is_done), None
+
+        if due_from and due_to and due_from > due_to:
+            raise ValidationError("'due_from' must not be after 'due_to'")
+        after = decode_cursor(cursor, date, UUID) if cursor else None
+        tasks = await self.task_repo.list_by_organization(
+            organization_id, limit + 1, is_done, owner_id, due_from, due_to, after
+        )
+
+        next_cursor = None
+        if len(tasks) > limit:
+            tasks = tasks[:limit]
+            next_cursor = encode_cursor(tasks[-1].due_date, tasks[-1].id)
+
+        return tasks, next_cursor
 
     async def update_task(
         self,
@@ -75,15 +96,10 @@ class TaskService:
         due_date: date | None = None,
         is_done: bool | None = None,
     ) -> TaskModel:
-        task = await self.task_repo.get_by_id(task_id)
-        if not task:
-            raise NotFoundError("Task not found")
-
-        deal = await self.deal_repo.get_by_id(task.deal_id)
-        if not deal:
-            raise NotFoundError("Deal not found")
-        if deal.organization_id != organization_id:
+        found = await self.task_repo.get_with_deal(task_id, organization_id)
+        if not found:
             raise NotFoundError("Task not found")
+        task, deal = found
 
         if not PermissionService.check_resource_permission(user_id, deal.owner_id, role):
             raise AuthorizationError("Access denied")
@@ -104,12 +120,9 @@ class TaskService:
         task_id: UUID,
         organization_id: UUID,
     ) -> TaskModel:
-        task = await self.task_repo.get_by_id(task_id)
+        task = await self.task_repo.get_for_organization(task_id, organization_id)
         if not task:
             raise NotFoundError("Task not found")
-        deal = await self.deal_repo.get_by_id(task.deal_id)
-        if not deal or deal.organization_id != organization_id:
-            raise NotFoundError("Task not found")
         return task
 
     async def delete_task(
@@ -119,14 +132,10 @@ class TaskService:
         user_id: UUID,
         role: Role,
     ) -> None:
-        task = await self.task_repo.get_by_id(task_id)
-        if not task:
-            raise NotFoundError("Task not found")
-        deal = await self.deal_repo.get_by_id(task.deal_id)
-        if not deal:
-            raise NotFoundError("Deal not found")
-        if deal.organization_id != organization_id:
+        found = await self.task_repo.get_with_deal(task_id, organization_id)
+        if not found:
             raise NotFoundError("Task not found")
+        task, deal = found
         if not PermissionService.check_resource_permission(user_id, deal.owner_id, role):
             raise AuthorizationError("Access denied")
         await self.task_repo.delete(task)
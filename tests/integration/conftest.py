@@ -2,11 +2,12 @@ from collections.abc import AsyncGenerator
 
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
+from src.api.dependencies import get_export_db
 from src.db.base import Base
-from src.db.session import get_db
+from src.db.session import get_db, get_session_factory
 from src.main import app
 
 TEST_DATABASE_URL = "postgresql+asyncpg://crm_user:crm_password@db_test:5432/crm_test"
@@ -41,6 +42,10 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_export_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: async_sessionmaker(
+        db_session.bind, expire_on_commit=False
+    )
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
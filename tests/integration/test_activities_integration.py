@@ -77,3 +77,66 @@ async def test_activity_timeline(client: AsyncClient):
     )
     assert status_activity is not None
     assert status_activity["author_id"] is None
+
+
+@pytest.mark.asyncio
+async def test_activity_timeline_pagination(client: AsyncClient):
+    register_response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "timeline@example.com",
+            "password": "password123",
+            "name": "Timeline User",
+            "organization_name": "Timeline Org",
+        },
+    )
+    org_id = register_response.json()["organization_id"]
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "timeline@example.com", "password": "password123"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": org_id,
+    }
+    contact_response = await client.post(
+        "/api/v1/contacts", json={"name": "Timeline Contact"}, headers=headers
+    )
+    deal_response = await client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact_response.json()["id"], "title": "Timeline", "amount": "10"},
+        headers=headers,
+    )
+    deal_id = deal_response.json()["id"]
+    for i in range(5):
+        await client.post(
+            f"/api/v1/deals/{deal_id}/activities", json={"content": f"Comment {i}"}, headers=headers
+        )
+    await client.patch(f"/api/v1/deals/{deal_id}", json={"stage": "proposal"}, headers=headers)
+
+    url = f"/api/v1/deals/{deal_id}/activities"
+    seen: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 2, "type": "comment"}
+        if cursor:
+            params["cursor"] = cursor
+        page = (await client.get(url, params=params, headers=headers)).json()
+        assert len(page["items"]) <= 2
+        assert all(item["type"] == "comment" for item in page["items"])
+        seen.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert len(seen) == len(set(seen)) == 5
+
+    everything = (await client.get(url, headers=headers)).json()
+    assert len(everything["items"]) == 6
+    assert everything["next_cursor"] is None
+
+    newest = everything["items"][0]["created_at"]
+    since = await client.get(url, params={"since": newest}, headers=headers)
+    assert since.json()["items"] == []
+
+    invalid = await client.get(url, params={"cursor": "not-a-cursor"}, headers=headers)
+    assert invalid.status_code == 400
@@ -0,0 +1,84 @@
+from datetime import UTC, date, datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.activity_partition import ActivityPartitionRepository, month_start
+
+
+@pytest.mark.asyncio
+async def test_activity_partitions_lifecycle(client: AsyncClient, db_session: AsyncSession):
+    register_response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "partitions@example.com",
+            "password": "password123",
+            "name": "Partitions User",
+            "organization_name": "Partitions Org",
+        },
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "partitions@example.com", "password": "password123"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": register_response.json()["organization_id"],
+    }
+    contact_response = await client.post(
+        "/api/v1/contacts", json={"name": "Partitions Contact"}, headers=headers
+    )
+    deal_response = await client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact_response.json()["id"], "title": "Partitioned", "amount": "5"},
+        headers=headers,
+    )
+    deal_id = deal_response.json()["id"]
+    for i in range(3):
+        await client.post(
+            f"/api/v1/deals/{deal_id}/activities", json={"content": f"Comment {i}"}, headers=headers
+        )
+
+    repo = ActivityPartitionRepository(db_session)
+    current = month_start(datetime.now(UTC))
+    # create_all only sets up the default partition; its rows move into the new month.
+    assert await repo.list_months() == []
+    assert await repo.create(current) == 3
+    old_month = date(2020, 1, 1)
+    await repo.create(old_month)
+    assert await repo.list_months() == [old_month, current]
+
+    placement = await db_session.execute(
+        text("SELECT DISTINCT tableoid::regclass::text FROM activities")
+    )
+    assert placement.scalars().all() == [f"activities_{current:%Y_%m}"]
+    timeline = await client.get(f"/api/v1/deals/{deal_id}/activities", headers=headers)
+    assert len(timeline.json()["items"]) == 3
+
+    await db_session.execute(
+        text(
+            "INSERT INTO activities (id, deal_id, type, payload, created_at) "
+            "VALUES (gen_random_uuid(), :deal_id, 'comment', '{}', '2020-01-15 12:00:00+00')"
+        ),
+        {"deal_id": deal_id},
+    )
+    try:
+        await repo.detach(old_month, archive_schema="activities_archive")
+        assert await repo.list_months() == [current]
+        archived = await db_session.execute(
+            text("SELECT count(*) FROM activities_archive.activities_2020_01")
+        )
+        assert archived.scalar_one() == 1
+        remaining = await db_session.execute(text("SELECT count(*) FROM activities"))
+        assert remaining.scalar_one() == 3
+
+        await repo.detach(current)
+        assert await repo.list_months() == []
+        exists = await db_session.execute(
+            text("SELECT to_regclass(:name)"), {"name": f"activities_{current:%Y_%m}"}
+        )
+        assert exists.scalar_one() is None
+    finally:
+        await db_session.rollback()
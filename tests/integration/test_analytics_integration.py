@@ -1,5 +1,18 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from uuid import UUID
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import OrgDealStatsModel, OrgDealTimeseriesModel, Role
+from src.repositories.deal_stats import DealStatsRepository
+from src.repositories.deal_timeseries import DealTimeseriesRepository
+from src.services.deal import DealService
 
 
 @pytest.mark.asyncio
@@ -179,3 +192,368 @@ async def test_analytics_empty_organization(client: AsyncClient):
     assert funnel_response.status_code == 200
     funnel = funnel_response.json()
     assert "stages" in funnel
+
+
+@pytest.mark.asyncio
+async def test_analytics_cache_is_invalidated_by_deal_writes(client: AsyncClient):
+    register_data = {
+        "email": "cache_user@example.com",
+        "password": "password123",
+        "name": "Cache User",
+        "organization_name": "Cache Org",
+    }
+    register_response = await client.post("/api/v1/auth/register", json=register_data)
+    assert register_response.status_code == 201
+    org_id = register_response.json()["organization_id"]
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "cache_user@example.com", "password": "password123"},
+    )
+    token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}", "X-Organization-Id": org_id}
+
+    contact_response = await client.post(
+        "/api/v1/contacts", json={"name": "Cache Contact"}, headers=headers
+    )
+    contact_id = contact_response.json()["id"]
+
+    before = (await client.get("/metrics")).json()
+    first = await client.get("/api/v1/analytics/deals/summary", headers=headers)
+    second = await client.get("/api/v1/analytics/deals/summary", headers=headers)
+    after = (await client.get("/metrics")).json()
+
+    assert first.json() == second.json()
+    assert first.json()["total_count"] == 0
+    assert after["analytics_cache"]["hits"] == before["analytics_cache"]["hits"] + 1
+
+    deal_response = await client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact_id, "title": "Cached Deal", "amount": "500.00"},
+        headers=headers,
+    )
+    assert deal_response.status_code == 201
+
+    refreshed = await client.get("/api/v1/analytics/deals/summary", headers=headers)
+    assert refreshed.json()["total_count"] == 1
+    assert float(refreshed.json()["total_amount"]) == 500.0
+
+
+@pytest.mark.asyncio
+async def test_deal_stats_rollup_matches_rebuild(client: AsyncClient, db_session: AsyncSession):
+    register_response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "rollup_user@example.com",
+            "password": "password123",
+            "name": "Rollup User",
+            "organization_name": "Rollup Org",
+        },
+    )
+    org_id = register_response.json()["organization_id"]
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "rollup_user@example.com", "password": "password123"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": org_id,
+    }
+    contact_response = await client.post(
+        "/api/v1/contacts", json={"name": "Rollup Contact"}, headers=headers
+    )
+    contact_id = contact_response.json()["id"]
+
+    deal_ids = []
+    for amount in ("100.00", "200.00", "300.00", "400.00"):
+        response = await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": "Rollup", "amount": amount},
+            headers=headers,
+        )
+        deal_ids.append(response.json()["id"])
+
+    await client.patch(f"/api/v1/deals/{deal_ids[0]}", json={"status": "won"}, headers=headers)
+    await client.patch(
+        f"/api/v1/deals/{deal_ids[1]}", json={"stage": "proposal", "amount": "250.00"}, headers=headers
+    )
+    await client.patch(f"/api/v1/deals/{deal_ids[2]}", json={"amount": "350.00"}, headers=headers)
+    await client.delete(f"/api/v1/deals/{deal_ids[3]}", headers=headers)
+
+    async def stats_rows() -> set[tuple]:
+        result = await db_session.execute(
+            select(
+                OrgDealStatsModel.status,
+                OrgDealStatsModel.stage,
+                OrgDealStatsModel.currency,
+                OrgDealStatsModel.deal_count,
+                OrgDealStatsModel.amount_sum,
+            ).where(
+                OrgDealStatsModel.organization_id == UUID(org_id),
+                OrgDealStatsModel.deal_count != 0,
+            )
+        )
+        return {tuple(row) for row in result}
+
+    maintained = await stats_rows()
+    await DealStatsRepository(db_session).rebuild(UUID(org_id))
+    assert maintained == await stats_rows()
+
+    deal_queries: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM deals" in statement:
+            deal_queries.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        summary = (await client.get("/api/v1/analytics/deals/summary", headers=headers)).json()
+        funnel = (await client.get("/api/v1/analytics/deals/funnel", headers=headers)).json()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert deal_queries == []
+    assert summary["total_count"] == 3
+    assert summary["won_count"] == 1
+    assert float(summary["total_amount"]) == 700.0
+    assert {stage["stage"]: stage["count"] for stage in funnel["stages"]} == {
+        "qualification": 1,
+        "proposal": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_deal_timeseries_rollup_matches_rebuild(client: AsyncClient, db_session: AsyncSession):
+    register_response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "timeseries_user@example.com",
+            "password": "password123",
+            "name": "Timeseries User",
+            "organization_name": "Timeseries Org",
+        },
+    )
+    org_id = register_response.json()["organization_id"]
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "timeseries_user@example.com", "password": "password123"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": org_id,
+    }
+    contact_response = await client.post(
+        "/api/v1/contacts", json={"name": "Timeseries Contact"}, headers=headers
+    )
+    contact_id = contact_response.json()["id"]
+
+    deal_ids = []
+    for amount in ("100.00", "200.00", "300.00", "400.00"):
+        response = await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": "Timeseries", "amount": amount},
+            headers=headers,
+        )
+        deal_ids.append(response.json()["id"])
+
+    won = await client.patch(f"/api/v1/deals/{deal_ids[0]}", json={"status": "won"}, headers=headers)
+    assert won.json()["closed_at"] is not None
+    await client.patch(f"/api/v1/deals/{deal_ids[1]}", json={"status": "lost"}, headers=headers)
+    await client.patch(f"/api/v1/deals/{deal_ids[2]}", json={"status": "won"}, headers=headers)
+    reopened = await client.patch(
+        f"/api/v1/deals/{deal_ids[2]}", json={"status": "in_progress"}, headers=headers
+    )
+    assert reopened.json()["closed_at"] is None
+    await client.delete(f"/api/v1/deals/{deal_ids[3]}", headers=headers)
+
+    async def timeseries_rows() -> set[tuple]:
+        result = await db_session.execute(
+            select(
+                OrgDealTimeseriesModel.granularity,
+                OrgDealTimeseriesModel.bucket_start,
+                OrgDealTimeseriesModel.created_count,
+                OrgDealTimeseriesModel.won_count,
+                OrgDealTimeseriesModel.lost_count,
+                OrgDealTimeseriesModel.won_amount,
+            ).where(
+                OrgDealTimeseriesModel.organization_id == UUID(org_id),
+                (OrgDealTimeseriesModel.created_count != 0)
+                | (OrgDealTimeseriesModel.won_count != 0)
+                | (OrgDealTimeseriesModel.lost_count != 0),
+            )
+        )
+        return {tuple(row) for row in result}
+
+    maintained = await timeseries_rows()
+    await DealTimeseriesRepository(db_session).rebuild(UUID(org_id))
+    assert maintained == await timeseries_rows()
+
+    today = datetime.now(UTC).date()
+    params = {
+        "granularity": "day",
+        "from": (today - timedelta(days=2)).isoformat(),
+        "to": today.isoformat(),
+    }
+    deal_queries: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM deals" in statement:
+            deal_queries.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = await client.get(
+            "/api/v1/analytics/deals/timeseries", params=params, headers=headers
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert deal_queries == []
+    points = response.json()["points"]
+    assert [point["bucket_start"] for point in points] == [
+        (today - timedelta(days=days)).isoformat() for days in (2, 1, 0)
+    ]
+    assert points[0]["created_count"] == 0
+    assert points[-1]["created_count"] == 3
+    assert points[-1]["won_count"] == 1
+    assert points[-1]["lost_count"] == 1
+    assert float(points[-1]["won_amount"]) == 100.0
+
+    invalid = await client.get(
+        "/api/v1/analytics/deals/timeseries",
+        params={"from": today.isoformat(), "to": (today - timedelta(days=1)).isoformat()},
+        headers=headers,
+    )
+    assert invalid.status_code == 400
+
+
+async def _committed_deal(client: AsyncClient, db_session: AsyncSession, email: str):
+    register_response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": email,
+            "password": "password123",
+            "name": "Race User",
+            "organization_name": "Race Org",
+        },
+    )
+    org_id = UUID(register_response.json()["organization_id"])
+    user_id = UUID(register_response.json()["id"])
+    login_response = await client.post(
+        "/api/v1/auth/login", json={"email": email, "password": "password123"}
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": str(org_id),
+    }
+    contact_response = await client.post(
+        "/api/v1/contacts", json={"name": "Race Contact"}, headers=headers
+    )
+    deal_response = await client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact_response.json()["id"], "title": "Race", "amount": "100.00"},
+        headers=headers,
+    )
+    # The racing writers below use their own connections.
+    await db_session.commit()
+    return org_id, user_id, UUID(deal_response.json()["id"])
+
+
+async def _race(
+    db_session: AsyncSession,
+    first: Callable[[DealService], Awaitable[object]],
+    second: Callable[[DealService], Awaitable[object]],
+) -> None:
+    """Run ``second`` while ``first`` has written but not yet committed."""
+    async with (
+        AsyncSession(db_session.bind, expire_on_commit=False) as first_session,
+        AsyncSession(db_session.bind, expire_on_commit=False) as second_session,
+    ):
+        await first(DealService(first_session))
+        pending = asyncio.create_task(second(DealService(second_session)))
+        # Let the second writer read the deal and block on the first one's locks.
+        await asyncio.sleep(0.3)
+        await first_session.commit()
+        await pending
+        await second_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_deal_updates_keep_stats_consistent(
+    client: AsyncClient, db_session: AsyncSession
+):
+    org_id, user_id, deal_id = await _committed_deal(client, db_session, "race_stats@example.com")
+
+    await _race(
+        db_session,
+        lambda service: service.update_deal(deal_id, org_id, user_id, Role.OWNER, status="won"),
+        lambda service: service.update_deal(deal_id, org_id, user_id, Role.OWNER, status="lost"),
+    )
+
+    result = await db_session.execute(
+        select(
+            OrgDealStatsModel.status,
+            OrgDealStatsModel.stage,
+            OrgDealStatsModel.deal_count,
+            OrgDealStatsModel.amount_sum,
+        ).where(OrgDealStatsModel.organization_id == org_id, OrgDealStatsModel.deal_count != 0)
+    )
+    assert {tuple(row) for row in result} == {("lost", "qualification", 1, 100)}
+
+
+
+@pytest.mark.asyncio
+async def test_concurrent_deal_updates_keep_timeseries_consistent(
+    client: AsyncClient, db_session: AsyncSession
+):
+    org_id, user_id, deal_id = await _committed_deal(
+        client, db_session, "race_timeseries@example.com"
+    )
+
+    # An amount change computed from the stale, pre-win snapshot would miss won_amount.
+    await _race(
+        db_session,
+        lambda service: service.update_deal(deal_id, org_id, user_id, Role.OWNER, status="won"),
+        lambda service: service.update_deal(
+            deal_id, org_id, user_id, Role.OWNER, amount=Decimal("250.00")
+        ),
+    )
+
+    async def timeseries_rows() -> set[tuple]:
+        result = await db_session.execute(
+            select(
+                OrgDealTimeseriesModel.granularity,
+                OrgDealTimeseriesModel.bucket_start,
+                OrgDealTimeseriesModel.created_count,
+                OrgDealTimeseriesModel.won_count,
+                OrgDealTimeseriesModel.won_amount,
+            ).where(OrgDealTimeseriesModel.organization_id == org_id)
+        )
+        return {tuple(row) for row in result}
+
+    maintained = await timeseries_rows()
+    assert {row[-1] for row in maintained} == {Decimal("250.00")}
+    await DealTimeseriesRepository(db_session).rebuild(org_id)
+    assert maintained == await timeseries_rows()
+
+
+@pytest.mark.asyncio
+async def test_single_and_bulk_updates_close_deals_on_the_database_clock(
+    client: AsyncClient, db_session: AsyncSession
+):
+    org_id, user_id, deal_id = await _committed_deal(client, db_session, "clock@example.com")
+    service = DealService(db_session)
+
+    deal = await service.update_deal(deal_id, org_id, user_id, Role.OWNER, status="won")
+    assert deal.closed_at == await db_session.scalar(select(func.now()))
+    await db_session.commit()
+
+    await service.update_deal(deal_id, org_id, user_id, Role.OWNER, status="new")
+    [deal], errors = await service.update_deals(
+        [deal_id], org_id, user_id, Role.OWNER, status="lost"
+    )
+    assert errors == []
+    assert deal.closed_at == await db_session.scalar(select(func.now()))
@@ -1,5 +1,19 @@
+import asyncio
+import time
+from uuid import UUID, uuid4
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.security import password_hash_executor
+from src.db.models import OrganizationMemberModel, Role, UserModel
+from src.domain.exceptions import AuthenticationError, RateLimitError, ServiceUnavailableError
+from src.services import auth as auth_module
+from src.services.auth import AuthService, principal_cache
+from src.services.membership import membership_cache
 
 
 @pytest.mark.asyncio
@@ -34,3 +48,294 @@ async def test_full_auth_flow(client: AsyncClient):
     assert len(orgs) == 1
     assert orgs[0]["organization_id"] == org_id
     assert orgs[0]["role"] == "owner"
+
+
+@pytest.mark.asyncio
+async def test_authenticated_requests_reuse_cached_principal(
+    client: AsyncClient, db_session: AsyncSession
+):
+    register_data = {
+        "email": "principal@example.com",
+        "password": "password123",
+        "name": "Principal User",
+        "organization_name": "Principal Org",
+    }
+    register_response = await client.post("/api/v1/auth/register", json=register_data)
+    user_id = UUID(register_response.json()["id"])
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "principal@example.com", "password": "password123"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    await client.get("/api/v1/organizations/me", headers=headers)
+
+    user_queries: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            user_queries.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = await client.get("/api/v1/organizations/me", headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert user_queries == []
+    assert principal_cache.get(user_id) is not None
+
+    user = await db_session.get(UserModel, user_id)
+    user.name = "Renamed User"
+    await db_session.flush()
+
+    assert principal_cache.get(user_id) is None
+
+
+@pytest.mark.asyncio
+async def test_membership_is_cached_and_refreshed_on_role_change(
+    client: AsyncClient, db_session: AsyncSession
+):
+    register_data = {
+        "email": "membership@example.com",
+        "password": "password123",
+        "name": "Membership User",
+        "organization_name": "Membership Org",
+    }
+    register_response = await client.post("/api/v1/auth/register", json=register_data)
+    user_id = UUID(register_response.json()["id"])
+    org_id = UUID(register_response.json()["organization_id"])
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "membership@example.com", "password": "password123"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": str(org_id),
+    }
+
+    await client.get("/api/v1/contacts", headers=headers)
+
+    member_queries: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM organization_members" in statement:
+            member_queries.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        await client.get("/api/v1/contacts", headers=headers)
+        assert member_queries == []
+
+        member = (
+            await db_session.execute(
+                select(OrganizationMemberModel).where(
+                    OrganizationMemberModel.user_id == user_id,
+                    OrganizationMemberModel.organization_id == org_id,
+                )
+            )
+        ).scalar_one()
+        member.role = Role.MEMBER
+        await db_session.flush()
+        member_queries.clear()
+
+        await client.get("/api/v1/contacts", headers=headers)
+        assert len(member_queries) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    principal = principal_cache.get(user_id)
+    cached = membership_cache.get((user_id, org_id, principal.membership_version))
+    assert cached.role == Role.MEMBER
+
+    foreign_response = await client.get(
+        "/api/v1/contacts", headers={**headers, "X-Organization-Id": str(uuid4())}
+    )
+    assert foreign_response.status_code == 403
+    assert str(org_id) in foreign_response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_login_is_throttled_before_password_hashing(client: AsyncClient):
+    register_data = {
+        "email": "throttled@example.com",
+        "password": "password123",
+        "name": "Throttled User",
+        "organization_name": "Throttled Org",
+    }
+    await client.post("/api/v1/auth/register", json=register_data)
+
+    for _ in range(settings.login_max_failures_per_email):
+        response = await client.post(
+            "/api/v1/auth/login",
+            json={"email": "throttled@example.com", "password": "wrong-password"},
+        )
+        assert response.status_code == 401
+
+    hashes_before = password_hash_executor.stats()["completed"]
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "throttled@example.com", "password": "password123"},
+    )
+
+    assert response.status_code == 429
+    assert "Retry-After" in response.headers
+    assert password_hash_executor.stats()["completed"] == hashes_before
+
+
+@pytest.mark.asyncio
+async def test_concurrent_login_burst_is_throttled(db_session: AsyncSession):
+    attempts = settings.login_max_failures_per_email + 3
+
+    async def attempt() -> type[Exception]:
+        async with AsyncSession(db_session.bind) as session:
+            try:
+                await AuthService(session).login("burst@example.com", "guess", "198.51.100.7")
+            except (AuthenticationError, RateLimitError) as e:
+                return type(e)
+        raise AssertionError("login succeeded")
+
+    outcomes = await asyncio.gather(*(attempt() for _ in range(attempts)))
+
+    assert outcomes.count(AuthenticationError) == settings.login_max_failures_per_email
+    assert outcomes.count(RateLimitError) == 3
+
+
+@pytest.mark.asyncio
+async def test_saturated_password_hashing_does_not_count_towards_the_lockout(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    async def saturated(password: str, hashed_password: str) -> bool:
+        raise ServiceUnavailableError("Password hashing capacity exhausted, retry later")
+
+    email, ip = "saturated@example.com", "198.51.100.8"
+    monkeypatch.setattr(auth_module, "verify_password_async", saturated)
+    for _ in range(settings.login_max_failures_per_email + 1):
+        with pytest.raises(ServiceUnavailableError):
+            await AuthService(db_session).login(email, "guess", ip)
+    monkeypatch.undo()
+
+    assert await auth_module.login_email_limiter.backend.count(
+        f"email:{email}", time.time(), settings.login_failure_window_seconds
+    ) == 0
+    assert await auth_module.login_ip_limiter.backend.count(
+        f"ip:{ip}", time.time(), settings.login_failure_window_seconds
+    ) == 0
+    with pytest.raises(AuthenticationError):
+        await AuthService(db_session).login(email, "guess", ip)
+
+
+@pytest.mark.asyncio
+async def test_login_ip_throttle_uses_forwarded_address_from_trusted_proxy(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    # The test client connects from 127.0.0.1, standing in for the proxy.
+    monkeypatch.setattr(settings, "trusted_proxies", ["127.0.0.0/8"])
+    monkeypatch.setattr(auth_module.login_ip_limiter, "limit", 2)
+    # A frozen clock keeps the counts exact: across a window boundary the sliding
+    # estimate would discount the earlier failures.
+    now = time.time()
+    monkeypatch.setattr(auth_module.login_ip_limiter, "_clock", lambda: now)
+
+    async def login(email: str, forwarded_for: str) -> int:
+        response = await client.post(
+            "/api/v1/auth/login",
+            json={"email": email, "password": "wrong-password"},
+            headers={"X-Forwarded-For": forwarded_for},
+        )
+        return response.status_code
+
+    # The left-most hop is whatever the client sent; the proxy appends the real peer.
+    assert await login("proxy-a1@example.com", "203.0.113.1") == 401
+    assert await login("proxy-a2@example.com", "10.9.9.9, 203.0.113.1") == 401
+    assert await login("proxy-a3@example.com", "203.0.113.1") == 429
+    assert await login("proxy-b1@example.com", "203.0.113.2") == 401
+
+    # Untrusted peers cannot choose their address through the header.
+    monkeypatch.setattr(settings, "trusted_proxies", [])
+    await auth_module.login_ip_limiter.reset("ip:127.0.0.1")
+    assert await login("proxy-c1@example.com", "203.0.113.3") == 401
+    assert await login("proxy-c2@example.com", "203.0.113.4") == 401
+    assert await login("proxy-c3@example.com", "203.0.113.5") == 429
+    await auth_module.login_ip_limiter.reset("ip:127.0.0.1")
+
+
+@pytest.mark.asyncio
+async def test_unknown_email_still_pays_for_password_verification(client: AsyncClient):
+    await client.post(
+        "/api/v1/auth/login",
+        json={"email": "warmup-unknown@example.com", "password": "password123"},
+    )
+
+    hashes_before = password_hash_executor.stats()["completed"]
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "nobody@example.com", "password": "password123"},
+    )
+
+    assert response.status_code == 401
+    assert password_hash_executor.stats()["completed"] == hashes_before + 1
+
+
+@pytest.mark.asyncio
+async def test_membership_claims_skip_lookup_until_version_changes(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "access_token_membership_claims", True)
+    register_data = {
+        "email": "claims@example.com",
+        "password": "password123",
+        "name": "Claims User",
+        "organization_name": "Claims Org",
+    }
+    register_response = await client.post("/api/v1/auth/register", json=register_data)
+    user_id = UUID(register_response.json()["id"])
+    org_id = UUID(register_response.json()["organization_id"])
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "claims@example.com", "password": "password123"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": str(org_id),
+    }
+
+    member_queries: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM organization_members" in statement:
+            member_queries.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = await client.get("/api/v1/contacts", headers=headers)
+        assert response.status_code == 200
+        assert member_queries == []
+
+        member = (
+            await db_session.execute(
+                select(OrganizationMemberModel).where(
+                    OrganizationMemberModel.user_id == user_id,
+                    OrganizationMemberModel.organization_id == org_id,
+                )
+            )
+        ).scalar_one()
+        member.role = Role.MEMBER
+        await db_session.flush()
+        member_queries.clear()
+
+        response = await client.get("/api/v1/contacts", headers=headers)
+        assert response.status_code == 200
+        assert len(member_queries) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    principal = principal_cache.get(user_id)
+    assert membership_cache.get((user_id, org_id, principal.membership_version)).role == Role.MEMBER
@@ -1,5 +1,11 @@
+from datetime import date, timedelta
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
 
 
 @pytest.mark.asyncio
@@ -73,3 +79,241 @@ async def test_deal_lifecycle(client: AsyncClient):
     )
     assert status_activity is not None
     assert status_activity["payload"]["new_status"] == "won"
+
+
+@pytest.mark.asyncio
+async def test_deal_list_total_modes(client: AsyncClient, db_session: AsyncSession):
+    register_data = {
+        "email": "totals@example.com",
+        "password": "password123",
+        "name": "Totals User",
+        "organization_name": "Totals Org",
+    }
+    register_response = await client.post("/api/v1/auth/register", json=register_data)
+    org_id = register_response.json()["organization_id"]
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "totals@example.com", "password": "password123"},
+    )
+    token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}", "X-Organization-Id": org_id}
+
+    contact_response = await client.post(
+        "/api/v1/contacts", json={"name": "Totals Contact"}, headers=headers
+    )
+    contact_id = contact_response.json()["id"]
+    for i in range(3):
+        await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": f"Deal {i}", "amount": "100.00"},
+            headers=headers,
+        )
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM deals" in statement:
+            statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        exact = await client.get("/api/v1/deals?limit=2", headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert exact.json()["total"] == 3
+    assert exact.json()["total_exact"] is True
+    assert len(statements) == 1
+
+    past_end = await client.get("/api/v1/deals?limit=2&offset=10", headers=headers)
+    assert past_end.json()["items"] == []
+    assert past_end.json()["total"] == 3
+
+    estimated = await client.get("/api/v1/deals?total_mode=estimated", headers=headers)
+    assert estimated.status_code == 200
+    assert isinstance(estimated.json()["total"], int)
+    assert estimated.json()["total_exact"] is False
+
+    none = await client.get("/api/v1/deals?total_mode=none", headers=headers)
+    assert none.json()["total"] is None
+    assert none.json()["total_exact"] is False
+    assert len(none.json()["items"]) == 3
+    for item in none.json()["items"]:
+        detail = (await client.get(f"/api/v1/deals/{item['id']}", headers=headers)).json()
+        assert item == {key: value for key, value in detail.items() if key in item}
+        assert item["amount"] == "100.00"
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_deals(client: AsyncClient, db_session: AsyncSession):
+    register_response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "bulkdeals@example.com",
+            "password": "password123",
+            "name": "Bulk Deals User",
+            "organization_name": "Bulk Deals Org",
+        },
+    )
+    org_id = register_response.json()["organization_id"]
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "bulkdeals@example.com", "password": "password123"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": org_id,
+    }
+    contact_response = await client.post(
+        "/api/v1/contacts", json={"name": "Bulk Contact"}, headers=headers
+    )
+    contact_id = contact_response.json()["id"]
+    deal_ids = []
+    for amount in ("100.00", "250.00", "0.00"):
+        deal_response = await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": f"Deal {amount}", "amount": amount},
+            headers=headers,
+        )
+        deal_ids.append(deal_response.json()["id"])
+    unknown_id = "00000000-0000-0000-0000-000000000000"
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = await client.patch(
+            "/api/v1/deals/bulk",
+            json={
+                "ids": [deal_ids[0], deal_ids[1], deal_ids[2], unknown_id, deal_ids[0]],
+                "status": "won",
+                "stage": "proposal",
+            },
+            headers=headers,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [deal["id"] for deal in body["updated"]] == deal_ids[:2]
+    assert all(deal["status"] == "won" and deal["closed_at"] for deal in body["updated"])
+    assert all(deal["stage"] == "proposal" for deal in body["updated"])
+    assert body["errors"] == [
+        {"index": 2, "detail": "Won deal must have positive amount"},
+        {"index": 3, "detail": "Deal not found"},
+    ]
+    assert sum(1 for s in statements if s.startswith("UPDATE deals")) == 1
+    assert sum(1 for s in statements if s.startswith("INSERT INTO activities")) == 1
+
+    activities_response = await client.get(
+        f"/api/v1/deals/{deal_ids[1]}/activities", headers=headers
+    )
+    assert sorted(a["type"] for a in activities_response.json()["items"]) == [
+        "stage_changed",
+        "status_changed",
+    ]
+
+    summary = (await client.get("/api/v1/analytics/deals/summary", headers=headers)).json()
+    assert summary["won_count"] == 2
+    assert float(summary["won_amount"]) == 350.0
+
+    nothing = await client.patch("/api/v1/deals/bulk", json={"ids": deal_ids}, headers=headers)
+    assert nothing.status_code == 400
+
+    stranger = await client.patch(
+        "/api/v1/deals/bulk", json={"ids": deal_ids, "owner_id": unknown_id}, headers=headers
+    )
+    assert stranger.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_deal_detail_includes(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    register_response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "dealdetail@example.com",
+            "password": "password123",
+            "name": "Deal Detail User",
+            "organization_name": "Deal Detail Org",
+        },
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "dealdetail@example.com", "password": "password123"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": register_response.json()["organization_id"],
+    }
+    contact_response = await client.post(
+        "/api/v1/contacts", json={"name": "Detail Contact"}, headers=headers
+    )
+    deal_response = await client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact_response.json()["id"], "title": "Detail", "amount": "5"},
+        headers=headers,
+    )
+    deal_id = deal_response.json()["id"]
+    for days in (3, 1, 2):
+        await client.post(
+            "/api/v1/tasks",
+            json={"title": f"In {days}", "due_date": (date.today() + timedelta(days=days)).isoformat()},
+            params={"deal_id": deal_id},
+            headers=headers,
+        )
+    for i in range(3):
+        await client.post(
+            f"/api/v1/deals/{deal_id}/activities", json={"content": f"Note {i}"}, headers=headers
+        )
+    monkeypatch.setattr(settings, "deal_detail_max_items", 2)
+
+    # Statements and the rows each returned: 3 tasks and 3 activities must not
+    # multiply into a tasks x activities cross product.
+    statements: list[tuple[str, int]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, cursor.rowcount))
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "after_cursor_execute", record)
+    try:
+        response = await client.get(
+            f"/api/v1/deals/{deal_id}",
+            params={"include": "contact,tasks,activities"},
+            headers=headers,
+        )
+    finally:
+        event.remove(engine, "after_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert [rowcount for _, rowcount in statements] == [1]
+    deal = response.json()
+    assert deal["title"] == "Detail"
+    assert deal["contact"]["name"] == "Detail Contact"
+    assert [task["title"] for task in deal["tasks"]] == ["In 1", "In 2"]
+    assert len(deal["activities"]) == 2
+    timeline = await client.get(f"/api/v1/deals/{deal_id}/activities", headers=headers)
+    assert deal["activities"] == timeline.json()["items"][:2]
+
+    plain = (await client.get(f"/api/v1/deals/{deal_id}", headers=headers)).json()
+    assert plain["contact"] is None and plain["tasks"] is None and plain["activities"] is None
+
+    tasks_only = await client.get(
+        f"/api/v1/deals/{deal_id}", params={"include": "tasks"}, headers=headers
+    )
+    assert len(tasks_only.json()["tasks"]) == 2
+    assert tasks_only.json()["contact"] is None
+
+    unknown = await client.get(
+        f"/api/v1/deals/{deal_id}", params={"include": "owner"}, headers=headers
+    )
+    assert unknown.status_code == 400
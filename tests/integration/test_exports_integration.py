@@ -0,0 +1,130 @@
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+
+
+async def _register(client: AsyncClient, email: str, organization_name: str) -> dict[str, str]:
+    register_response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": email,
+            "password": "password123",
+            "name": "Export User",
+            "organization_name": organization_name,
+        },
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login", json={"email": email, "password": "password123"}
+    )
+    return {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": register_response.json()["organization_id"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_export_deals_streams_filtered_csv_through_server_side_cursor(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "export_batch_rows", 2)
+    headers = await _register(client, "export_deals@example.com", "Export Org")
+    other_headers = await _register(client, "export_other@example.com", "Other Export Org")
+    contact = await client.post("/api/v1/contacts", json={"name": "Buyer"}, headers=headers)
+    contact_id = contact.json()["id"]
+
+    deal_ids = []
+    for i in range(5):
+        response = await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": f"Export {i}", "amount": f"{i + 1}00.00"},
+            headers=headers,
+        )
+        deal_ids.append(response.json()["id"])
+    await client.patch(f"/api/v1/deals/{deal_ids[1]}", json={"status": "won"}, headers=headers)
+    other_contact = await client.post(
+        "/api/v1/contacts", json={"name": "Other"}, headers=other_headers
+    )
+    await client.post(
+        "/api/v1/deals",
+        json={"contact_id": other_contact.json()["id"], "title": "Foreign", "amount": "1.00"},
+        headers=other_headers,
+    )
+
+    streamed: list[dict] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM deals" in statement:
+            streamed.append(dict(context.execution_options))
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = await client.get("/api/v1/deals/export", headers=headers)
+        won = await client.get(
+            "/api/v1/deals/export?format=ndjson&status=won", headers=headers
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="deals.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    # Everything here is written in one transaction, so created_at ties everywhere.
+    assert sorted(row["title"] for row in rows) == [f"Export {i}" for i in range(5)]
+    assert {row["closed_at"] == "" for row in rows} == {True, False}
+    assert all(options.get("stream_results") for options in streamed)
+
+    assert won.headers["content-type"] == "application/x-ndjson"
+    won_rows = [json.loads(line) for line in won.text.splitlines()]
+    assert [(row["id"], row["status"]) for row in won_rows] == [(deal_ids[1], "won")]
+
+
+@pytest.mark.asyncio
+async def test_export_contacts_and_activities(client: AsyncClient):
+    headers = await _register(client, "export_contacts@example.com", "Export Contacts Org")
+    for name in ("Alice Export", "Bob Export", "Carol"):
+        await client.post("/api/v1/contacts", json={"name": name}, headers=headers)
+
+    contacts = await client.get(
+        "/api/v1/contacts/export?format=ndjson&search=Export", headers=headers
+    )
+    assert sorted(json.loads(line)["name"] for line in contacts.text.splitlines()) == [
+        "Alice Export",
+        "Bob Export",
+    ]
+
+    contacts_csv = await client.get("/api/v1/contacts/export", headers=headers)
+    assert contacts_csv.text.splitlines()[0] == (
+        "id,organization_id,owner_id,name,email,phone,created_at"
+    )
+
+    contact_id = json.loads(contacts.text.splitlines()[0])["id"]
+    deal = await client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact_id, "title": "Commented", "amount": "10.00"},
+        headers=headers,
+    )
+    deal_id = deal.json()["id"]
+    await client.post(
+        f"/api/v1/deals/{deal_id}/activities", json={"content": "Hello"}, headers=headers
+    )
+    await client.patch(f"/api/v1/deals/{deal_id}", json={"status": "in_progress"}, headers=headers)
+
+    activities = await client.get(
+        f"/api/v1/activities/export?format=ndjson&deal_id={deal_id}&type=comment",
+        headers=headers,
+    )
+    assert activities.status_code == 200
+    rows = [json.loads(line) for line in activities.text.splitlines()]
+    assert [(row["type"], row["payload"]) for row in rows] == [("comment", {"content": "Hello"})]
+
+    activities_csv = await client.get("/api/v1/activities/export", headers=headers)
+    assert len(list(csv.DictReader(io.StringIO(activities_csv.text)))) == 2
@@ -0,0 +1,261 @@
+import asyncio
+import json
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.services.import_job import ImportService, cancel_running_imports
+
+
+async def _register(client: AsyncClient, email: str) -> dict[str, str]:
+    register_response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": email,
+            "password": "password123",
+            "name": "Import User",
+            "organization_name": "Import Org",
+        },
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login", json={"email": email, "password": "password123"}
+    )
+    return {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": register_response.json()["organization_id"],
+    }
+
+
+async def _wait_for_job(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    headers: dict[str, str],
+    job_id: str,
+    until: Callable[[dict[str, Any]], bool] = lambda job: job["status"] != "running",
+) -> dict[str, Any]:
+    for _ in range(200):
+        # The client shares db_session between requests; expire the job it holds
+        # so each poll reads what the background import has committed.
+        db_session.expire_all()
+        job = (await client.get(f"/api/v1/imports/{job_id}", headers=headers)).json()
+        if until(job):
+            return job
+        await asyncio.sleep(0.05)
+    raise AssertionError(f"Import job never got there: {job}")
+
+
+@pytest.mark.asyncio
+async def test_import_contacts_csv_in_chunks(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "import_chunk_rows", 2)
+    headers = await _register(client, "import_contacts@example.com")
+    existing = await client.post(
+        "/api/v1/contacts",
+        json={"name": "Existing", "email": "taken@example.com"},
+        headers=headers,
+    )
+    assert existing.status_code == 201
+
+    csv_body = (
+        "name,email,phone\n"
+        "Alice,alice@example.com,+100\n"
+        ",nameless@example.com,\n"
+        "Bob,TAKEN@example.com,\n"
+        '"Carol, Jr",carol@example.com,+300\n'
+        "Alice again,Alice@Example.com,\n"
+        "Dave,,\n"
+    )
+    response = await client.post(
+        "/api/v1/imports/contacts?format=csv",
+        content=csv_body.encode(),
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 202
+    accepted = response.json()
+    assert response.headers["Location"] == f"/api/v1/imports/{accepted['id']}"
+    assert (accepted["status"], accepted["processed_rows"]) == ("running", 0)
+
+    job = await _wait_for_job(client, db_session, headers, accepted["id"])
+    assert job["status"] == "completed"
+    assert job["processed_rows"] == 6
+    assert job["imported_rows"] == 5
+    assert job["failed_rows"] == 1
+    assert job["errors"] == [{"line": 3, "detail": "name: field required"}]
+
+    # Like POST /contacts, an import does not treat a shared email as a duplicate.
+    contacts = (await client.get("/api/v1/contacts?limit=100", headers=headers)).json()
+    assert sorted(contact["name"] for contact in contacts["items"]) == [
+        "Alice",
+        "Alice again",
+        "Bob",
+        "Carol, Jr",
+        "Dave",
+        "Existing",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_deals_ndjson_resolves_contacts_and_updates_analytics(
+    client: AsyncClient, db_session: AsyncSession
+):
+    headers = await _register(client, "import_deals@example.com")
+    contact = await client.post(
+        "/api/v1/contacts",
+        json={"name": "Buyer", "email": "buyer@example.com"},
+        headers=headers,
+    )
+    contact_id = contact.json()["id"]
+
+    lines = [
+        {"contact_id": contact_id, "title": "By id", "amount": "100.00"},
+        {"contact_email": "BUYER@example.com", "title": "By email", "amount": 250, "status": "won"},
+        {"contact_email": "nobody@example.com", "title": "Orphan", "amount": "10"},
+        {"contact_id": contact_id, "title": "Bad status", "amount": "10", "status": "done"},
+        {"contact_id": contact_id, "title": "Bad amount", "amount": "lots"},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\nnot json\n"
+
+    response = await client.post(
+        "/api/v1/imports/deals?format=ndjson",
+        content=body.encode(),
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 202
+    job = await _wait_for_job(client, db_session, headers, response.json()["id"])
+    assert job["status"] == "completed"
+    assert (job["imported_rows"], job["failed_rows"]) == (2, 4)
+    assert [(error["line"], error["detail"]) for error in job["errors"]] == [
+        (3, "Contact not found"),
+        (4, "status: invalid value"),
+        (5, "amount: invalid number"),
+        (6, "Invalid JSON: Expecting value"),
+    ]
+
+    summary = (await client.get("/api/v1/analytics/deals/summary", headers=headers)).json()
+    assert summary["total_count"] == 2
+    assert summary["won_count"] == 1
+    assert float(summary["won_amount"]) == 250.0
+
+
+@pytest.mark.asyncio
+async def test_import_with_unreadable_stream_fails_job(
+    client: AsyncClient, db_session: AsyncSession
+):
+    headers = await _register(client, "import_broken@example.com")
+
+    response = await client.post(
+        "/api/v1/imports/contacts?format=csv",
+        content=b"name\nAlice\n\xff\xfe\n",
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+
+    job = await _wait_for_job(client, db_session, headers, response.json()["id"])
+    assert job["status"] == "failed"
+    assert job["error"] == "Input is not valid UTF-8"
+    assert job["finished_at"] is not None
+
+    other_org = await _register(client, "import_other@example.com")
+    missing = await client.get(f"/api/v1/imports/{job['id']}", headers=other_org)
+    assert missing.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_import_progress_is_visible_while_it_runs(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "import_chunk_rows", 2)
+    headers = await _register(client, "import_progress@example.com")
+
+    resume = asyncio.Event()
+    load_chunk = ImportService._load_chunk
+
+    async def held_after_each_chunk(self, job, records):
+        await load_chunk(self, job, records)
+        await resume.wait()
+
+    monkeypatch.setattr(ImportService, "_load_chunk", held_after_each_chunk)
+
+    csv_body = "name\n" + "".join(f"Contact {i}\n" for i in range(5))
+    response = await client.post(
+        "/api/v1/imports/contacts?format=csv",
+        content=csv_body.encode(),
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    try:
+        job = await _wait_for_job(
+            client, db_session, headers, job_id, until=lambda job: job["processed_rows"] > 0
+        )
+        assert (job["status"], job["processed_rows"], job["imported_rows"]) == ("running", 2, 2)
+        assert job["finished_at"] is None
+    finally:
+        resume.set()
+
+    job = await _wait_for_job(client, db_session, headers, job_id)
+    assert (job["status"], job["processed_rows"], job["imported_rows"]) == ("completed", 5, 5)
+
+
+@pytest.mark.asyncio
+async def test_import_body_over_the_limit_is_rejected(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "import_max_upload_bytes", 64)
+    headers = await _register(client, "import_too_large@example.com")
+
+    async def body():
+        for i in range(100):
+            yield f"Contact {i}\n".encode()
+
+    response = await client.post(
+        "/api/v1/imports/contacts?format=csv",
+        content=body(),
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 413
+    contacts = (await client.get("/api/v1/contacts", headers=headers)).json()
+    assert contacts["items"] == []
+
+
+@pytest.mark.asyncio
+async def test_shutdown_fails_imports_that_are_still_running(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "import_chunk_rows", 2)
+    headers = await _register(client, "import_shutdown@example.com")
+
+    load_chunk = ImportService._load_chunk
+
+    async def stuck_after_first_chunk(self, job, records):
+        await load_chunk(self, job, records)
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(ImportService, "_load_chunk", stuck_after_first_chunk)
+
+    csv_body = "name\n" + "".join(f"Contact {i}\n" for i in range(5))
+    response = await client.post(
+        "/api/v1/imports/contacts?format=csv",
+        content=csv_body.encode(),
+        headers={**headers, "Content-Type": "text/csv"},
+    )
+    job_id = response.json()["id"]
+    await _wait_for_job(
+        client, db_session, headers, job_id, until=lambda job: job["processed_rows"] > 0
+    )
+
+    await cancel_running_imports()
+
+    job = await _wait_for_job(client, db_session, headers, job_id)
+    assert job["status"] == "failed"
+    assert job["error"] == "Import interrupted by a server shutdown"
+    assert (job["processed_rows"], job["imported_rows"]) == (2, 2)
+    assert job["finished_at"] is not None
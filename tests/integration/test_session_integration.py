@@ -0,0 +1,217 @@
+import json
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.db.models import OrganizationModel
+from src.db.pool import InstrumentedAsyncAdaptedQueuePool, instrument_pool, pool_stats
+from src.db.session import connection_hold_seconds, engine, get_db, snapshot_session
+from src.main import app
+from tests.integration.conftest import TEST_DATABASE_URL
+
+
+def _request(method: str) -> Request:
+    return Request({"type": "http", "method": method, "headers": []})
+
+
+async def _call(
+    method: str, path: str, events: list[str], body: Any = None, token: str | None = None
+) -> Any:
+    """Call the app over raw ASGI, appending the messages it sends to ``events``."""
+    payload = json.dumps(body).encode() if body is not None else b""
+    headers = [(b"host", b"test"), (b"content-type", b"application/json")]
+    if token:
+        headers.append((b"authorization", f"Bearer {token}".encode()))
+    received = False
+    response_body = b""
+
+    async def receive() -> dict[str, Any]:
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": payload, "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        nonlocal response_body
+        events.append(message["type"])
+        response_body += message.get("body", b"")
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+    return json.loads(response_body)
+
+
+@pytest.mark.asyncio
+async def test_safe_methods_read_in_autocommit_without_commit(db_session: AsyncSession):
+    observed = connection_hold_seconds["read_only"].count
+    generator = get_db(_request("GET"))
+    try:
+        session = await anext(generator)
+        assert (await session.execute(text("SELECT 1"))).scalar_one() == 1
+
+        raw_connection = await (await session.connection()).get_raw_connection()
+        assert not raw_connection.driver_connection.is_in_transaction()
+
+        session.add(OrganizationModel(id=uuid4(), name="Read Only Org"))
+        with pytest.raises(RuntimeError):
+            await session.flush()
+        session.expunge_all()
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(generator)
+        assert connection_hold_seconds["read_only"].count == observed + 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_unsafe_methods_commit_in_a_transaction(db_session: AsyncSession):
+    observed = connection_hold_seconds["read_write"].count
+    generator = get_db(_request("POST"))
+    try:
+        session = await anext(generator)
+        await session.execute(text("SELECT 1"))
+        raw_connection = await (await session.connection()).get_raw_connection()
+        assert raw_connection.driver_connection.is_in_transaction()
+
+        with pytest.raises(StopAsyncIteration):
+            await anext(generator)
+        assert connection_hold_seconds["read_write"].count == observed + 1
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_writes_commit_before_the_response_is_sent(db_session: AsyncSession):
+    events: list[str] = []
+
+    def record_commit(session: Session) -> None:
+        events.append("commit")
+
+    event.listen(Session, "after_commit", record_commit)
+    try:
+        await _call(
+            "POST",
+            "/api/v1/auth/register",
+            events,
+            body={
+                "email": "commit-order@example.com",
+                "password": "password123",
+                "name": "Commit Order",
+                "organization_name": "Commit Order Org",
+            },
+        )
+    finally:
+        event.remove(Session, "after_commit", record_commit)
+        await engine.dispose()
+
+    assert events == ["commit", "http.response.start", "http.response.body"]
+
+
+@pytest.mark.asyncio
+async def test_reads_release_the_connection_before_the_response_is_sent(
+    db_session: AsyncSession,
+):
+    events: list[str] = []
+    credentials = {"email": "release-order@example.com", "password": "password123"}
+    try:
+        await _call(
+            "POST",
+            "/api/v1/auth/register",
+            events,
+            body={**credentials, "name": "Release Order", "organization_name": "Release Org"},
+        )
+        token = (await _call("POST", "/api/v1/auth/login", events, body=credentials))[
+            "access_token"
+        ]
+        observed = connection_hold_seconds["read_only"].count
+
+        def record_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+            events.append("checkin")
+
+        events.clear()
+        event.listen(engine.sync_engine, "checkin", record_checkin)
+        try:
+            organizations = await _call("GET", "/api/v1/organizations/me", events, token=token)
+        finally:
+            event.remove(engine.sync_engine, "checkin", record_checkin)
+    finally:
+        await engine.dispose()
+
+    assert [org["organization_name"] for org in organizations] == ["Release Org"]
+    assert events == ["checkin", "http.response.start", "http.response.body"]
+    assert connection_hold_seconds["read_only"].count == observed + 1
+
+
+@pytest.mark.asyncio
+async def test_snapshot_session_reads_in_one_read_only_repeatable_read_transaction(
+    db_session: AsyncSession,
+):
+    try:
+        async with snapshot_session(engine) as session:
+            isolation = (await session.execute(text("SHOW transaction_isolation"))).scalar_one()
+            read_only = (await session.execute(text("SHOW transaction_read_only"))).scalar_one()
+            raw_connection = await (await session.connection()).get_raw_connection()
+
+            assert isolation == "repeatable read"
+            assert read_only == "on"
+            assert raw_connection.driver_connection.is_in_transaction()
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_reports_checkouts_waits_and_timeouts():
+    pooled_engine = create_async_engine(
+        TEST_DATABASE_URL,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    metrics = instrument_pool(pooled_engine)
+    try:
+        async with pooled_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert pool_stats(pooled_engine)["checked_out"] == 1
+
+            with pytest.raises(PoolTimeoutError):
+                async with pooled_engine.connect():
+                    pass
+
+        stats = pool_stats(pooled_engine)
+        assert stats["checked_out"] == 0
+        assert stats["waiters"] == 0
+        assert stats["checkouts"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["checkout_wait_seconds"]["count"] == 2
+        assert stats["checkout_wait_seconds"]["sum"] >= 0.1
+        assert stats["checkout_hold_seconds"]["count"] == 1
+
+        await pooled_engine.dispose()
+        async with pooled_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        assert pooled_engine.sync_engine.pool.metrics is metrics
+        assert pool_stats(pooled_engine)["checkouts"] == 2
+    finally:
+        await pooled_engine.dispose()
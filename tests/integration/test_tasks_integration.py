@@ -2,6 +2,8 @@ from datetime import date, timedelta
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 @pytest.mark.asyncio
@@ -114,3 +116,106 @@ async def test_tasks_filtering(client: AsyncClient):
     assert open_response.status_code == 200
     open_tasks = open_response.json()["items"]
     assert len(open_tasks) == 2
+
+
+@pytest.mark.asyncio
+async def test_tasks_organization_listing(client: AsyncClient, db_session: AsyncSession):
+    register_response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "orgtasks@example.com",
+            "password": "password123",
+            "name": "Org Tasks User",
+            "organization_name": "Org Tasks Org",
+        },
+    )
+    org_id = register_response.json()["organization_id"]
+    user_id = register_response.json()["id"]
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "orgtasks@example.com", "password": "password123"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": org_id,
+    }
+    contact_response = await client.post(
+        "/api/v1/contacts", json={"name": "Org Tasks Contact"}, headers=headers
+    )
+    contact_id = contact_response.json()["id"]
+
+    today = date.today()
+    task_ids = []
+    for deal_index in range(2):
+        deal_response = await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": f"Deal {deal_index}", "amount": "10"},
+            headers=headers,
+        )
+        for offset in range(1, 4):
+            task_response = await client.post(
+                "/api/v1/tasks",
+                json={
+                    "title": f"Task {deal_index}-{offset}",
+                    "due_date": (today + timedelta(days=offset)).isoformat(),
+                },
+                params={"deal_id": deal_response.json()["id"]},
+                headers=headers,
+            )
+            assert task_response.json()["organization_id"] == org_id
+            task_ids.append(task_response.json()["id"])
+    await client.patch(f"/api/v1/tasks/{task_ids[0]}", json={"is_done": True}, headers=headers)
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM tasks" in statement:
+            statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        first_page = await client.get(
+            "/api/v1/tasks",
+            params={"is_done": "false", "owner_id": user_id, "limit": 3},
+            headers=headers,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert len(statements) == 1
+
+    body = first_page.json()
+    second_page = await client.get(
+        "/api/v1/tasks",
+        params={"is_done": "false", "owner_id": user_id, "limit": 3, "cursor": body["next_cursor"]},
+        headers=headers,
+    )
+    items = body["items"] + second_page.json()["items"]
+    assert second_page.json()["next_cursor"] is None
+    assert len(items) == 5
+    assert task_ids[0] not in [item["id"] for item in items]
+    assert [item["due_date"] for item in items] == sorted(item["due_date"] for item in items)
+
+    this_week = await client.get(
+        "/api/v1/tasks",
+        params={"due_to": (today + timedelta(days=2)).isoformat()},
+        headers=headers,
+    )
+    assert len(this_week.json()["items"]) == 4
+
+    done = await client.get("/api/v1/tasks", params={"is_done": "true"}, headers=headers)
+    assert [item["id"] for item in done.json()["items"]] == [task_ids[0]]
+
+    stranger = await client.get(
+        "/api/v1/tasks",
+        params={"owner_id": "00000000-0000-0000-0000-000000000000"},
+        headers=headers,
+    )
+    assert stranger.json()["items"] == []
+
+    reversed_range = await client.get(
+        "/api/v1/tasks",
+        params={"due_from": today.isoformat(), "due_to": (today - timedelta(days=1)).isoformat()},
+        headers=headers,
+    )
+    assert reversed_range.status_code == 400
@@ -0,0 +1,129 @@
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+async def _login(client: AsyncClient, email: str) -> dict[str, str]:
+    register_response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": email,
+            "password": "password123",
+            "name": "Tenant User",
+            "organization_name": f"Org of {email}",
+        },
+    )
+    login_response = await client.post(
+        "/api/v1/auth/login", json={"email": email, "password": "password123"}
+    )
+    return {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": register_response.json()["organization_id"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_entity_endpoints_round_trips(client: AsyncClient, db_session: AsyncSession):
+    headers = await _login(client, "lookups@example.com")
+    due_date = (date.today() + timedelta(days=1)).isoformat()
+    contact_id = (
+        await client.post("/api/v1/contacts", json={"name": "Lookup"}, headers=headers)
+    ).json()["id"]
+    deal_id = (
+        await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": "Lookup", "amount": "5"},
+            headers=headers,
+        )
+    ).json()["id"]
+    task_id = (
+        await client.post(
+            "/api/v1/tasks",
+            json={"title": "Lookup", "due_date": due_date},
+            params={"deal_id": deal_id},
+            headers=headers,
+        )
+    ).json()["id"]
+
+    # (method, url, json, params, statements): the org-scoped lookup is a single
+    # statement, followed by the write or the list query where there is one.
+    cases = [
+        ("GET", f"/api/v1/contacts/{contact_id}", None, None, 1),
+        ("PATCH", f"/api/v1/contacts/{contact_id}", {"phone": "+1"}, None, 2),
+        ("GET", f"/api/v1/deals/{deal_id}", None, None, 1),
+        ("PATCH", f"/api/v1/deals/{deal_id}", {"title": "Renamed"}, None, 2),
+        ("POST", "/api/v1/tasks", {"title": "More", "due_date": due_date}, {"deal_id": deal_id}, 2),
+        ("GET", "/api/v1/tasks", None, {"deal_id": deal_id}, 2),
+        ("GET", f"/api/v1/tasks/{task_id}", None, None, 1),
+        ("PATCH", f"/api/v1/tasks/{task_id}", {"is_done": True}, None, 2),
+        ("POST", f"/api/v1/deals/{deal_id}/activities", {"content": "Note"}, None, 2),
+        ("GET", f"/api/v1/deals/{deal_id}/activities", None, None, 2),
+        ("DELETE", f"/api/v1/tasks/{task_id}", None, None, 2),
+    ]
+    engine = db_session.bind.sync_engine
+    for method, url, body, params, expected in cases:
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            response = await client.request(method, url, json=body, params=params, headers=headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+        assert response.status_code < 300, (method, url, response.text)
+        assert len(statements) == expected, (method, url, statements)
+
+
+@pytest.mark.asyncio
+async def test_entities_of_other_organizations_are_not_found(client: AsyncClient):
+    owner_headers = await _login(client, "tenant-owner@example.com")
+    other_headers = await _login(client, "tenant-other@example.com")
+    contact_id = (
+        await client.post("/api/v1/contacts", json={"name": "Private"}, headers=owner_headers)
+    ).json()["id"]
+    deal_id = (
+        await client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": "Private", "amount": "5"},
+            headers=owner_headers,
+        )
+    ).json()["id"]
+    task_id = (
+        await client.post(
+            "/api/v1/tasks",
+            json={"title": "Private", "due_date": (date.today() + timedelta(days=1)).isoformat()},
+            params={"deal_id": deal_id},
+            headers=owner_headers,
+        )
+    ).json()["id"]
+
+    requests = [
+        ("GET", f"/api/v1/contacts/{contact_id}", None),
+        ("PATCH", f"/api/v1/contacts/{contact_id}", {"name": "Taken"}),
+        ("DELETE", f"/api/v1/contacts/{contact_id}", None),
+        ("GET", f"/api/v1/deals/{deal_id}", None),
+        ("PATCH", f"/api/v1/deals/{deal_id}", {"title": "Taken"}),
+        ("GET", f"/api/v1/tasks/{task_id}", None),
+        ("PATCH", f"/api/v1/tasks/{task_id}", {"is_done": True}),
+        ("DELETE", f"/api/v1/tasks/{task_id}", None),
+        ("GET", f"/api/v1/deals/{deal_id}/activities", None),
+    ]
+    for method, url, body in requests:
+        response = await client.request(method, url, json=body, headers=other_headers)
+        assert response.status_code == 404, (method, url)
+
+    foreign_contact = await client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact_id, "title": "Taken", "amount": "5"},
+        headers=other_headers,
+    )
+    assert foreign_contact.status_code == 404
+
+    contact = await client.get(f"/api/v1/contacts/{contact_id}", headers=owner_headers)
+    assert contact.json()["name"] == "Private"
@@ -0,0 +1,152 @@
+import re
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient, Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_WRITE = re.compile(r"^(?:INSERT INTO|UPDATE) (\w+)")
+
+
+async def _record(
+    db_session: AsyncSession, request: Callable[[], Awaitable[Response]]
+) -> tuple[Response, list[str]]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = await request()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return response, statements
+
+
+def _refetches(statements: list[str]) -> list[str]:
+    """SELECTs that read a row back by primary key after it was written."""
+    written: set[str] = set()
+    refetches = []
+    for statement in statements:
+        match = _WRITE.match(statement)
+        if match:
+            written.add(match.group(1))
+            continue
+        refetches.extend(
+            statement
+            for table in written
+            if re.search(rf"FROM {table}\s+WHERE {table}\.id = ", statement)
+        )
+    return refetches
+
+
+@pytest.mark.asyncio
+async def test_write_endpoints_do_not_read_back_written_rows(
+    client: AsyncClient, db_session: AsyncSession
+):
+    response, statements = await _record(
+        db_session,
+        lambda: client.post(
+            "/api/v1/auth/register",
+            json={
+                "email": "roundtrips@example.com",
+                "password": "password123",
+                "name": "Round Trips",
+                "organization_name": "Round Trips Org",
+            },
+        ),
+    )
+    assert response.status_code == 201
+    assert _refetches(statements) == []
+    assert sum(1 for s in statements if s.startswith("INSERT INTO")) == 3
+
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "roundtrips@example.com", "password": "password123"},
+    )
+    headers = {
+        "Authorization": f"Bearer {login_response.json()['access_token']}",
+        "X-Organization-Id": response.json()["organization_id"],
+    }
+
+    response, statements = await _record(
+        db_session,
+        lambda: client.post("/api/v1/contacts", json={"name": "Contact"}, headers=headers),
+    )
+    assert response.status_code == 201
+    assert response.json()["created_at"]
+    assert _refetches(statements) == []
+    contact_id = response.json()["id"]
+
+    response, statements = await _record(
+        db_session,
+        lambda: client.patch(
+            f"/api/v1/contacts/{contact_id}", json={"phone": "+100"}, headers=headers
+        ),
+    )
+    assert response.status_code == 200
+    assert response.json()["phone"] == "+100"
+    assert _refetches(statements) == []
+
+    response, statements = await _record(
+        db_session,
+        lambda: client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": "Deal", "amount": "10.005"},
+            headers=headers,
+        ),
+    )
+    assert response.status_code == 201
+    deal = response.json()
+    assert deal["created_at"] and deal["updated_at"]
+    assert deal["amount"] == "10.01"
+    assert _refetches(statements) == []
+
+    response, statements = await _record(
+        db_session,
+        lambda: client.patch(
+            f"/api/v1/deals/{deal['id']}", json={"status": "won"}, headers=headers
+        ),
+    )
+    assert response.status_code == 200
+    assert response.json()["closed_at"]
+    # The onupdate timestamp rides back on the UPDATE itself.
+    assert any(
+        s.startswith("UPDATE deals") and "RETURNING deals.updated_at" in s for s in statements
+    )
+    assert _refetches(statements) == []
+
+    response, statements = await _record(
+        db_session,
+        lambda: client.post(
+            "/api/v1/tasks",
+            json={"title": "Task", "due_date": (date.today() + timedelta(days=1)).isoformat()},
+            params={"deal_id": deal["id"]},
+            headers=headers,
+        ),
+    )
+    assert response.status_code == 201
+    assert _refetches(statements) == []
+    task_id = response.json()["id"]
+
+    response, statements = await _record(
+        db_session,
+        lambda: client.patch(f"/api/v1/tasks/{task_id}", json={"is_done": True}, headers=headers),
+    )
+    assert response.status_code == 200
+    assert response.json()["is_done"] is True
+    assert _refetches(statements) == []
+
+    response, statements = await _record(
+        db_session,
+        lambda: client.post(
+            f"/api/v1/deals/{deal['id']}/activities", json={"content": "Note"}, headers=headers
+        ),
+    )
+    assert response.status_code == 201
+    assert response.json()["created_at"]
+    assert _refetches(statements) == []
@@ -4,6 +4,7 @@ from hypothesis import strategies as st
 from src.core.security import (
     create_access_token,
     create_refresh_token,
+    decode_access_token,
     decode_token,
     hash_password,
     verify_password,
@@ -55,3 +56,25 @@ def test_decode_token_returns_payload(user_id):
     assert payload["sub"] == str(user_id)
     assert payload["type"] == "access"
     assert "exp" in payload
+
+
+@given(st.uuids(), st.uuids(), st.uuids(), st.integers(min_value=0, max_value=10_000))
+def test_access_token_membership_claims_roundtrip(user_id, org_id, member_id, version):
+    token = create_access_token(user_id, {org_id: (member_id, "admin")}, version)
+    claims = decode_access_token(token)
+
+    assert claims is not None
+    assert claims.user_id == user_id
+    assert claims.membership_version == version
+    assert claims.memberships == {org_id: (member_id, "admin")}
+    assert verify_token(token, "access") == user_id
+
+
+@given(st.uuids())
+def test_access_token_without_claims_has_no_memberships(user_id):
+    claims = decode_access_token(create_access_token(user_id))
+
+    assert claims is not None
+    assert claims.membership_version is None
+    assert claims.memberships == {}
+    assert decode_access_token(create_refresh_token(user_id)) is None
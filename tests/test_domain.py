@@ -113,6 +113,7 @@ def test_deal_entity() -> None:
 def test_task_entity() -> None:
     task = Task(
         id=uuid4(),
+        organization_id=uuid4(),
         deal_id=uuid4(),
         title="Follow up",
         description="Call customer",
@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from src.core.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_entries=10, ttl_seconds=5, clock=clock)
+
+    cache.set("a", 1)
+    clock.now = 4.9
+    assert cache.get("a") == 1
+
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_entries=2, ttl_seconds=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_invalidate_where_drops_matching_keys() -> None:
+    cache: TTLCache[tuple[str, str], int] = TTLCache(max_entries=10, ttl_seconds=60)
+    cache.set(("org1", "summary"), 1)
+    cache.set(("org1", "funnel"), 2)
+    cache.set(("org2", "summary"), 3)
+
+    removed = cache.invalidate_where(lambda key: key[0] == "org1")
+
+    assert removed == 2
+    assert cache.get(("org2", "summary")) == 3
+    assert cache.invalidations == 2
+
+
+async def test_get_or_load_counts_hits_and_misses() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_entries=10, ttl_seconds=60)
+    calls = 0
+
+    async def loader() -> int:
+        nonlocal calls
+        calls += 1
+        return 42
+
+    assert await cache.get_or_load("a", loader) == 42
+    assert await cache.get_or_load("a", loader) == 42
+
+    assert calls == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+async def test_concurrent_loads_are_coalesced() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_entries=10, ttl_seconds=60)
+    release = asyncio.Event()
+    calls = 0
+
+    async def loader() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 7
+
+    tasks = [asyncio.create_task(cache.get_or_load("a", loader)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [7] * 10
+    assert calls == 1
+    assert cache.coalesced == 9
+
+
+async def test_loader_error_propagates_to_waiters_and_is_not_cached() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_entries=10, ttl_seconds=60)
+    release = asyncio.Event()
+
+    async def failing_loader() -> int:
+        await release.wait()
+        raise RuntimeError("boom")
+
+    tasks = [asyncio.create_task(cache.get_or_load("a", failing_loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.get("a") is None
+
+
+async def test_invalidation_during_load_skips_caching_stale_value() -> None:
+    cache: TTLCache[str, int] = TTLCache(max_entries=10, ttl_seconds=60)
+
+    async def loader() -> int:
+        cache.invalidate("a")
+        return 1
+
+    assert await cache.get_or_load("a", loader) == 1
+    assert cache.get("a") is None
+
+
+@pytest.mark.parametrize("max_entries", [1, 3])
+def test_size_never_exceeds_bound(max_entries: int) -> None:
+    cache: TTLCache[int, int] = TTLCache(max_entries=max_entries, ttl_seconds=60)
+    for i in range(10):
+        cache.set(i, i)
+    assert len(cache) == max_entries
@@ -0,0 +1,55 @@
+from datetime import UTC, date, datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.db.models import DealStatus
+from src.domain.value_objects.timeseries_granularity import TimeseriesGranularity
+from src.repositories.deal_timeseries import (
+    bucket_start,
+    contribution_delta,
+    deal_contribution,
+    next_bucket_start,
+)
+
+
+@pytest.mark.parametrize(
+    ("granularity", "expected", "following"),
+    [
+        (TimeseriesGranularity.DAY, date(2026, 1, 29), date(2026, 1, 30)),
+        (TimeseriesGranularity.WEEK, date(2026, 1, 26), date(2026, 2, 2)),
+        (TimeseriesGranularity.MONTH, date(2026, 1, 1), date(2026, 2, 1)),
+    ],
+)
+def test_bucket_boundaries(
+    granularity: TimeseriesGranularity, expected: date, following: date
+) -> None:
+    start = bucket_start(granularity, date(2026, 1, 29))
+    assert start == expected
+    assert next_bucket_start(granularity, start) == following
+
+
+def test_bucket_start_uses_utc_day() -> None:
+    moment = datetime(2026, 3, 1, 1, 30, tzinfo=timezone(timedelta(hours=3)))
+    assert bucket_start(TimeseriesGranularity.DAY, moment) == date(2026, 2, 28)
+    assert bucket_start(TimeseriesGranularity.MONTH, moment) == date(2026, 2, 1)
+
+
+def test_closing_a_deal_moves_only_the_closed_bucket() -> None:
+    deal = SimpleNamespace(
+        created_at=datetime(2026, 1, 5, tzinfo=UTC),
+        closed_at=None,
+        status=DealStatus.NEW,
+        amount=Decimal("150.00"),
+    )
+    before = deal_contribution(deal)
+    deal.status, deal.closed_at = DealStatus.WON, datetime(2026, 2, 10, tzinfo=UTC)
+
+    delta = contribution_delta(before, deal_contribution(deal))
+
+    assert delta == {
+        (TimeseriesGranularity.DAY, date(2026, 2, 10)): (0, 1, 0, Decimal("150.00")),
+        (TimeseriesGranularity.WEEK, date(2026, 2, 9)): (0, 1, 0, Decimal("150.00")),
+        (TimeseriesGranularity.MONTH, date(2026, 2, 1)): (0, 1, 0, Decimal("150.00")),
+    }
@@ -0,0 +1,20 @@
+import pytest
+
+from src.core.metrics import Histogram
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(2.65)
+    assert snapshot["buckets"] == {"0.1": 2, "1.0": 3, "+Inf": 4}
+
+
+def test_empty_histogram_snapshot() -> None:
+    snapshot = Histogram(buckets=(1.0,)).snapshot()
+    assert snapshot == {"count": 0, "sum": 0.0, "buckets": {"1.0": 0, "+Inf": 0}}
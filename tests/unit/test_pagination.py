@@ -0,0 +1,29 @@
+from datetime import UTC, date, datetime
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core.pagination import decode_cursor, encode_cursor
+from src.domain.exceptions import ValidationError
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)
+    id = uuid4()
+
+    cursor = encode_cursor(created_at, id)
+
+    assert decode_cursor(cursor, datetime, UUID) == (created_at, id)
+    assert "=" not in cursor
+
+
+def test_cursor_round_trip_with_date() -> None:
+    id = uuid4()
+    cursor = encode_cursor(date(2026, 5, 1), id)
+    assert decode_cursor(cursor, date, UUID) == (date(2026, 5, 1), id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", encode_cursor(uuid4())])
+def test_malformed_cursor_is_rejected(cursor: str) -> None:
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor, datetime, UUID)
@@ -0,0 +1,61 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.core.security import PasswordHashExecutor, hash_password, verify_password_async
+from src.domain.exceptions import ServiceUnavailableError
+
+
+async def test_runs_work_off_the_event_loop() -> None:
+    executor = PasswordHashExecutor(workers=2, queue_limit=0)
+    loop_thread = threading.get_ident()
+
+    worker_thread = await executor.run(threading.get_ident)
+
+    assert worker_thread != loop_thread
+    assert executor.stats()["completed"] == 1
+    assert executor.stats()["run_seconds"]["count"] == 1
+
+
+async def test_rejects_work_beyond_workers_plus_queue_limit() -> None:
+    executor = PasswordHashExecutor(workers=1, queue_limit=1)
+    release = threading.Event()
+
+    running = [asyncio.create_task(executor.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert executor.stats()["in_flight"] == 2
+    assert executor.stats()["queue_depth"] == 1
+
+    with pytest.raises(ServiceUnavailableError):
+        await executor.run(release.wait)
+    assert executor.rejected == 1
+
+    release.set()
+    await asyncio.gather(*running)
+    assert executor.stats()["in_flight"] == 0
+
+
+async def test_cancelled_caller_keeps_slot_until_worker_finishes() -> None:
+    executor = PasswordHashExecutor(workers=1, queue_limit=0)
+    release = threading.Event()
+
+    task = asyncio.create_task(executor.run(release.wait))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert executor.stats()["in_flight"] == 1
+    release.set()
+    for _ in range(100):
+        if executor.stats()["in_flight"] == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert executor.stats()["in_flight"] == 0
+
+
+async def test_verify_password_async_matches_sync_hash() -> None:
+    hashed = hash_password("secret")
+    assert await verify_password_async("secret", hashed)
+    assert not await verify_password_async("wrong", hashed)
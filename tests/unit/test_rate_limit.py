@@ -0,0 +1,78 @@
+import pytest
+
+from src.core.rate_limit import InMemoryRateLimitBackend, SlidingWindowRateLimiter
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def test_rejects_after_limit_within_window() -> None:
+    clock = FakeClock()
+    limiter = SlidingWindowRateLimiter(
+        InMemoryRateLimitBackend(max_keys=100), limit=3, window_seconds=60, clock=clock
+    )
+
+    for _ in range(3):
+        assert await limiter.is_allowed("email:a")
+        await limiter.hit("email:a")
+
+    assert not await limiter.is_allowed("email:a")
+    assert await limiter.is_allowed("email:b")
+    assert limiter.rejected == 1
+
+
+async def test_previous_window_decays_as_it_slides_out() -> None:
+    clock = FakeClock(now=0.0)
+    backend = InMemoryRateLimitBackend(max_keys=100)
+    limiter = SlidingWindowRateLimiter(backend, limit=4, window_seconds=60, clock=clock)
+
+    for _ in range(4):
+        await limiter.hit("k")
+
+    clock.now = 60.0
+    assert await backend.count("k", clock.now, 60) == pytest.approx(4)
+    assert not await limiter.is_allowed("k")
+
+    clock.now = 90.0
+    assert await backend.count("k", clock.now, 60) == pytest.approx(2)
+    assert await limiter.is_allowed("k")
+
+    clock.now = 121.0
+    assert await backend.count("k", clock.now, 60) == 0
+
+
+async def test_reset_clears_key() -> None:
+    limiter = SlidingWindowRateLimiter(InMemoryRateLimitBackend(max_keys=100), limit=1, window_seconds=60)
+    await limiter.hit("k")
+    assert not await limiter.is_allowed("k")
+
+    await limiter.reset("k")
+    assert await limiter.is_allowed("k")
+
+
+async def test_backend_is_bounded() -> None:
+    backend = InMemoryRateLimitBackend(max_keys=2)
+    for key in ("a", "b", "c"):
+        await backend.increment(key, 0.0, 60)
+
+    assert len(backend) == 2
+    assert await backend.count("a", 0.0, 60) == 0
+
+
+async def test_acquire_counts_attempts_up_front_and_release_returns_them() -> None:
+    limiter = SlidingWindowRateLimiter(
+        InMemoryRateLimitBackend(max_keys=100), limit=2, window_seconds=60, clock=FakeClock()
+    )
+
+    assert await limiter.acquire("k")
+    assert await limiter.acquire("k")
+    assert not await limiter.acquire("k")
+
+    await limiter.release("k")
+    assert await limiter.acquire("k")
+    assert limiter.rejected == 1
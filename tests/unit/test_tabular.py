@@ -0,0 +1,91 @@
+from collections.abc import AsyncIterator
+
+import pytest
+
+from src.core.tabular import Record, encode_records, iter_records
+from src.domain.exceptions import ValidationError
+from src.domain.value_objects.data_format import DataFormat
+
+
+async def _chunks(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _parse(data: bytes, data_format: DataFormat, size: int = 3) -> list[Record]:
+    return [record async for record in iter_records(_chunks(data, size), data_format, 1000)]
+
+
+async def test_csv_records_survive_chunk_boundaries_and_quoted_newlines() -> None:
+    data = (
+        "﻿name,email\r\n"
+        'Jane,jane@example.com\r\n'
+        '"Doe, ""John""\nJr",john@example.com\n'
+        "\n"
+        "Пётр,petr@example.com"
+    ).encode()
+
+    records = await _parse(data, DataFormat.CSV)
+
+    assert records == [
+        Record(2, {"name": "Jane", "email": "jane@example.com"}),
+        Record(3, {"name": 'Doe, "John"\nJr', "email": "john@example.com"}),
+        Record(6, {"name": "Пётр", "email": "petr@example.com"}),
+    ]
+
+
+async def test_csv_field_count_mismatch_and_unterminated_quote_are_row_errors() -> None:
+    records = await _parse(b'name,email\nonly-name\n"open,x\n', DataFormat.CSV)
+
+    assert records == [
+        Record(2, None, "Expected 2 fields, got 1"),
+        Record(3, None, "Unterminated quoted field"),
+    ]
+
+
+async def test_ndjson_reports_bad_lines_by_line_number() -> None:
+    data = b'{"name": "A"}\n\nnot json\n[1, 2]\n{"name": "B"}'
+
+    records = await _parse(data, DataFormat.NDJSON)
+
+    assert [record.line for record in records] == [1, 3, 4, 5]
+    assert records[0].values == {"name": "A"}
+    assert records[1].error.startswith("Invalid JSON")
+    assert records[2].error == "Expected a JSON object"
+    assert records[3].values == {"name": "B"}
+
+
+async def test_invalid_utf8_and_oversized_lines_fail_the_stream() -> None:
+    with pytest.raises(ValidationError, match="UTF-8"):
+        await _parse(b'{"name": "\xff"}\n', DataFormat.NDJSON)
+
+    with pytest.raises(ValidationError, match="exceeds"):
+        await _parse(b"x" * 2000, DataFormat.NDJSON, size=100)
+
+
+async def _rows(rows: list[dict]) -> AsyncIterator[dict]:
+    for row in rows:
+        yield row
+
+
+async def test_encode_records_writes_csv_with_header_and_ndjson_lines() -> None:
+    rows = [
+        {"id": 1, "name": 'Doe, "J"', "payload": {"a": 1}, "email": None},
+        {"id": 2, "name": "Пётр", "payload": {}, "email": "p@example.com"},
+    ]
+    columns = ["id", "name", "email", "payload"]
+
+    csv_chunks = [chunk async for chunk in encode_records(_rows(rows), columns, DataFormat.CSV, 16)]
+    ndjson = b"".join(
+        [chunk async for chunk in encode_records(_rows(rows), columns, DataFormat.NDJSON)]
+    )
+
+    assert len(csv_chunks) > 1
+    assert b"".join(csv_chunks).decode() == (
+        "id,name,email,payload\n"
+        '1,"Doe, ""J""",,"{""a"":1}"\n'
+        "2,Пётр,p@example.com,{}\n"
+    )
+    assert ndjson.decode().splitlines()[1] == (
+        '{"id":2,"name":"Пётр","payload":{},"email":"p@example.com"}'
+    )